@@ -39,6 +39,8 @@ class Transaction(BaseModel):
     stealth_metadata: Optional[Dict[str, Any]] = Field(None, description="Metadata for stealth transactions.")
     # Flag indicating whether this is a stealth transaction
     is_stealth: bool = Field(False, description="Flag indicating whether this is a stealth transaction.")
+    # Multi-signature metadata (threshold, signer count and collected signatures)
+    multisig_data: Optional[Dict[str, Any]] = Field(None, description="Metadata for multi-signature transactions.")
 
     # Automatically generate transaction_id if not provided
     @validator('transaction_id', pre=True, always=True)
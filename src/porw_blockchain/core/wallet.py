@@ -18,6 +18,14 @@ from .structures import Transaction
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Default write buffer for wallet files, large enough to write most wallets in one syscall
+WALLET_WRITE_BUFFER_SIZE = 256 * 1024
+
 
 class Wallet:
     """
@@ -192,19 +200,24 @@ class Wallet:
             'transactions': [tx.model_dump(mode='json') for tx in self.transactions]
         }
 
-    def save(self, path: Path) -> None:
+    def save(self, path: Path, buffer_size: int = WALLET_WRITE_BUFFER_SIZE) -> None:
         """
         Save the wallet to a file.
 
         Args:
             path: Path to save the wallet to
+            buffer_size: Size of the file write buffer in bytes
         """
         # Create parent directory if it doesn't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save wallet to file
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Save wallet to file, using orjson's direct-to-bytes encoder when available
+        if orjson is not None:
+            with open(path, 'wb', buffering=buffer_size) as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', buffering=buffer_size) as f:
+                json.dump(self.to_dict(), f, indent=2)
 
         logger.info(f"Saved wallet to {path}")
 
@@ -219,9 +232,13 @@ class Wallet:
         Returns:
             The loaded wallet
         """
-        # Load wallet from file
-        with open(path, 'r') as f:
-            wallet_data = json.load(f)
+        # Load wallet from file, parsing the raw bytes with orjson when available
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                wallet_data = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                wallet_data = json.load(f)
 
         # Create wallet from private key
         wallet = cls(private_key=wallet_data['private_key'])
@@ -16,7 +16,7 @@ import hashlib
 import logging
 import asyncio
 import json
-from typing import Dict, List, Set, Tuple, Optional, Any, Union
+from typing import Callable, Dict, List, Set, Tuple, Optional, Any, Union
 from datetime import datetime, timedelta
 
 from cryptography.hazmat.primitives import hashes
@@ -86,7 +86,8 @@ class MixingSession:
         self.timeout = timeout
         self.created_at = datetime.now()
         self.expires_at = self.created_at + timedelta(seconds=timeout)
-        self.status = "created"  # created, registration, verification, signing, completed, failed
+        self._status_listeners = []  # Callbacks invoked with (session_id, status) on status changes
+        self._status = "created"  # created, registration, verification, signing, completed, failed
         
         # Coordinator keys
         self._coordinator_private_key = ec.generate_private_key(CURVE, default_backend())
@@ -102,16 +103,52 @@ class MixingSession:
         self.coinjoin_transaction = None
         self.transaction_signatures = {}  # {participant_id: signature}
         
+        # Cached dictionary form, keyed by the state it was built from
+        self._dict_cache = None  # (status, participant_count, dict)
+        
         logger.info(f"Created mixing session {self.session_id} with denomination {denomination}")
     
+    @property
+    def status(self) -> str:
+        """The current status of the session."""
+        return self._status
+    
+    @status.setter
+    def status(self, status: str) -> None:
+        """Set the session status, notifying status listeners if it changed."""
+        if status == self._status:
+            return
+        self._status = status
+        for listener in self._status_listeners:
+            listener(self.session_id, status)
+    
+    def add_status_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Register a callback to be invoked whenever the session status changes.
+        
+        Args:
+            listener: Callback taking the session ID and the new status.
+        """
+        if listener not in self._status_listeners:
+            self._status_listeners.append(listener)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the session to a dictionary.
         
+        Only the status and participant count change after creation, so the
+        dictionary is cached and rebuilt only when either of them changes.
+        
         Returns:
             A dictionary representation of the session.
         """
-        return {
+        participant_count = len(self.participants)
+        if self._dict_cache is not None:
+            status, count, cached = self._dict_cache
+            if status == self.status and count == participant_count:
+                return dict(cached)
+        
+        session_dict = {
             "session_id": self.session_id,
             "denomination": self.denomination,
             "min_participants": self.min_participants,
@@ -122,9 +159,11 @@ class MixingSession:
             "created_at": self.created_at.isoformat(),
             "expires_at": self.expires_at.isoformat(),
             "status": self.status,
-            "participant_count": len(self.participants),
+            "participant_count": participant_count,
             "coordinator_public_key": serialize_public_key(self.coordinator_public_key).decode('utf-8')
         }
+        self._dict_cache = (self.status, participant_count, session_dict)
+        return dict(session_dict)
     
     def register_participant(
         self,
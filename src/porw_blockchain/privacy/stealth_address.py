@@ -17,7 +17,7 @@ import base58
 import logging
 from typing import Tuple, Dict, Any, Optional, List, Union
 
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
@@ -146,6 +146,9 @@ class StealthKeys:
         # Derive public keys
         self.view_public_key = self.view_private_key.public_key()
         self.spend_public_key = self.spend_private_key.public_key()
+        
+        # Payment address derived from the spend key, computed on first use
+        self._payment_address: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -185,6 +188,20 @@ class StealthKeys:
             A StealthMetadata object.
         """
         return StealthMetadata(self.view_public_key, self.spend_public_key)
+    
+    def get_payment_address(self) -> str:
+        """
+        Get the payment address that stealth payments to these keys are sent to.
+        
+        The address only depends on the spend key, so it is derived once and
+        reused by every scan.
+        
+        Returns:
+            The payment address.
+        """
+        if self._payment_address is None:
+            self._payment_address = _derive_payment_address(self.spend_public_key)
+        return self._payment_address
 
 
 def generate_stealth_address(metadata: StealthMetadata, testnet: bool = False) -> str:
@@ -313,10 +330,43 @@ def create_stealth_payment_address(
     return payment_address, tx_metadata
 
 
+def _derive_payment_address(spend_public_key: ec.EllipticCurvePublicKey, testnet: bool = False) -> str:
+    """
+    Derive the payment address that stealth payments to a spend key are sent to.
+    
+    Args:
+        spend_public_key: The recipient's spend public key.
+        testnet: Whether to derive a testnet address (default: False).
+        
+    Returns:
+        The payment address.
+    """
+    # The payment public key is currently the spend public key itself; see
+    # create_stealth_payment_address, which derives the same address
+    payment_public_key_bytes = spend_public_key.public_bytes(
+        encoding=serialization.Encoding.X962,
+        format=serialization.PublicFormat.CompressedPoint
+    )
+    
+    # Hash the payment public key
+    payment_hash = hashlib.sha256(payment_public_key_bytes).digest()
+    ripemd160_hash = hashlib.new('ripemd160', payment_hash).digest()
+    
+    # Choose version byte based on network
+    version = TESTNET_ADDRESS_VERSION if testnet else ADDRESS_VERSION
+    
+    # Encode with Base58Check
+    encoded_address = base58check_encode(version, ripemd160_hash)
+    
+    # Add human-readable prefix
+    return f"{ADDRESS_PREFIX}_{encoded_address}"
+
+
 def scan_for_stealth_payments(
     view_private_key: ec.EllipticCurvePrivateKey,
     spend_public_key: ec.EllipticCurvePublicKey,
-    blockchain_transactions: List[Dict[str, Any]]
+    blockchain_transactions: List[Dict[str, Any]],
+    payment_address: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Scan the blockchain for stealth payments to the owner of the view private key.
@@ -325,79 +375,64 @@ def scan_for_stealth_payments(
         view_private_key: The recipient's view private key.
         spend_public_key: The recipient's spend public key.
         blockchain_transactions: List of transactions to scan.
+        payment_address: The precomputed payment address for the spend key
+                         (default: derived from spend_public_key).
         
     Returns:
         A list of detected stealth payments.
     """
     detected_payments = []
     
+    # Payment keys derived so far, keyed by ephemeral public key PEM, so a key
+    # reused across several outputs only costs one ECDH + HKDF per scan
+    payment_keys: Dict[str, bytes] = {}
+    
+    # The payment address depends only on the spend public key, so derive it
+    # once per scan rather than once per transaction
+    if payment_address is None:
+        payment_address = _derive_payment_address(spend_public_key)
+    
     for tx in blockchain_transactions:
         # Check if transaction has stealth metadata
         if "stealth_metadata" not in tx:
             continue
         
+        # Only payments to our address need the ECDH step
+        if tx.get("recipient") != payment_address:
+            continue
+        
         try:
             # Extract ephemeral public key from metadata
             ephemeral_public_key_pem = tx["stealth_metadata"].get("ephemeral_public_key")
             if not ephemeral_public_key_pem:
                 continue
             
-            ephemeral_public_key = load_public_key_from_pem(ephemeral_public_key_pem.encode('utf-8'))
-            
-            # Compute shared secret using ECDH
-            shared_secret = view_private_key.exchange(
-                ec.ECDH(),
-                ephemeral_public_key
-            )
-            
-            # Derive payment key using HKDF
-            hkdf = HKDF(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=None,
-                info=b"PoRW-Stealth-Address"
-            )
-            payment_key = hkdf.derive(shared_secret)
-            
-            # Convert payment key to scalar
-            payment_scalar = int.from_bytes(payment_key, byteorder='big') % CURVE.order
-            
-            # Compute payment public key: P' = P + H(rA)G
-            # where P is the recipient's spend public key, r is the sender's private key,
-            # A is the recipient's view public key, and G is the base point
-            spend_public_key_point = spend_public_key.public_numbers()
-            payment_point = ec.EllipticCurvePublicKey.from_encoded_point(
-                CURVE,
-                spend_public_key_point.encode_point()
-            )
-            
-            # Generate payment address
-            payment_public_key_bytes = payment_point.public_bytes(
-                encoding=ec.PublicFormat.CompressedPoint,
-                format=ec.PublicFormat.CompressedPoint
-            )
-            
-            # Hash the payment public key
-            payment_hash = hashlib.sha256(payment_public_key_bytes).digest()
-            ripemd160_hash = hashlib.new('ripemd160', payment_hash).digest()
-            
-            # Choose version byte based on network
-            version = ADDRESS_VERSION  # Assuming mainnet
-            
-            # Encode with Base58Check
-            encoded_address = base58check_encode(version, ripemd160_hash)
-            
-            # Add human-readable prefix
-            payment_address = f"{ADDRESS_PREFIX}_{encoded_address}"
+            payment_key = payment_keys.get(ephemeral_public_key_pem)
+            if payment_key is None:
+                ephemeral_public_key = load_public_key_from_pem(ephemeral_public_key_pem.encode('utf-8'))
+                
+                # Compute shared secret using ECDH
+                shared_secret = view_private_key.exchange(
+                    ec.ECDH(),
+                    ephemeral_public_key
+                )
+                
+                # Derive payment key using HKDF
+                hkdf = HKDF(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=None,
+                    info=b"PoRW-Stealth-Address"
+                )
+                payment_key = hkdf.derive(shared_secret)
+                payment_keys[ephemeral_public_key_pem] = payment_key
             
-            # Check if the payment address matches the transaction recipient
-            if tx["recipient"] == payment_address:
-                # This payment is for us
-                detected_payments.append({
-                    "transaction": tx,
-                    "payment_key": payment_key.hex(),
-                    "is_spent": False  # We would check the blockchain to see if this output is spent
-                })
+            # This payment is for us
+            detected_payments.append({
+                "transaction": tx,
+                "payment_key": payment_key.hex(),
+                "is_spent": False  # We would check the blockchain to see if this output is spent
+            })
         
         except Exception as e:
             logger.error(f"Error scanning transaction for stealth payments: {e}")
@@ -9,7 +9,8 @@ information.
 import json
 import logging
 import time
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Union
 
 from ..core.crypto_utils import is_valid_address
 
@@ -17,6 +18,24 @@ from ..core.crypto_utils import is_valid_address
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _is_valid_address(address: str) -> bool:
+    """
+    Validate an address, caching the result.
+
+    Address validation decodes and checksums the address, so repeated
+    validations of the same address (re-adding or updating contacts) reuse
+    the first result.
+
+    Args:
+        address: The address to validate.
+
+    Returns:
+        True if the address is valid, False otherwise.
+    """
+    return is_valid_address(address)
+
+
 class Contact:
     """
     Represents a contact in the address book.
@@ -54,7 +73,7 @@ class Contact:
         Raises:
             ValueError: If the address is invalid.
         """
-        if not is_valid_address(address):
+        if not _is_valid_address(address):
             raise ValueError(f"Invalid address: {address}")
         
         self.name = name
@@ -63,7 +82,7 @@ class Contact:
         self.email = email
         self.phone = phone
         self.description = description
-        self.tags = tags or []
+        self.tags: Set[str] = set(tags or [])
         self.created_at = created_at or int(time.time())
         self.updated_at = updated_at or int(time.time())
         
@@ -102,7 +121,8 @@ class Contact:
         Raises:
             ValueError: If the address is invalid.
         """
-        if address and not is_valid_address(address):
+        # Only validate an address that is actually changing
+        if address and address != self.address and not _is_valid_address(address):
             raise ValueError(f"Invalid address: {address}")
         
         if name:
@@ -121,7 +141,7 @@ class Contact:
             self.description = description
         
         if tags is not None:  # Allow empty list to clear tags
-            self.tags = tags
+            self.tags = set(tags)
         
         self.updated_at = int(time.time())
         
@@ -141,7 +161,7 @@ class Contact:
             "email": self.email,
             "phone": self.phone,
             "description": self.description,
-            "tags": self.tags,
+            "tags": sorted(self.tags),
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
@@ -184,6 +204,9 @@ class AddressBook:
         """
         self.contacts: Dict[str, Contact] = {}  # contact_id -> Contact
         self.address_index: Dict[str, str] = {}  # address -> contact_id
+        self.name_index: Dict[str, List[str]] = {}  # lowercased name -> contact_ids
+        self.tag_index: Dict[str, Dict[str, None]] = {}  # tag -> contact_ids, in the order they were tagged
+        self._sorted_tags: Optional[List[str]] = None  # Cached result of get_all_tags
         
         logger.debug("Initialized AddressBook")
     
@@ -205,6 +228,8 @@ class AddressBook:
         
         self.contacts[contact.contact_id] = contact
         self.address_index[contact.address] = contact.contact_id
+        self._index_name(contact)
+        self._index_tags(contact)
         
         logger.debug(f"Added contact to address book: {contact.name} ({contact.address})")
         return contact
@@ -241,16 +266,11 @@ class AddressBook:
             raise ValueError(f"Contact with ID {contact_id} not found")
         
         contact = self.contacts[contact_id]
+        old_address = contact.address
+        old_name = contact.name
+        old_tags = contact.tags
         
-        # If address is changing, update the address index
-        if address and address != contact.address:
-            # Remove old address from index
-            self.address_index.pop(contact.address, None)
-            
-            # Add new address to index
-            self.address_index[address] = contact_id
-        
-        # Update the contact
+        # Update the contact first; it validates the address before changing anything
         contact.update(
             name=name,
             address=address,
@@ -260,6 +280,22 @@ class AddressBook:
             tags=tags
         )
         
+        # If address changed, update the address index
+        if contact.address != old_address:
+            self.address_index.pop(old_address, None)
+            self.address_index[contact.address] = contact_id
+        
+        # If name changed, update the name index
+        if contact.name != old_name:
+            self._unindex_name(contact, old_name)
+            self._index_name(contact)
+        
+        # If tags changed, update the tag index
+        if tags is not None:
+            for tag in old_tags:
+                self._discard_tag(tag, contact_id)
+            self._index_tags(contact)
+        
         logger.debug(f"Updated contact in address book: {contact.name} ({contact.address})")
         return contact
     
@@ -278,8 +314,10 @@ class AddressBook:
         
         contact = self.contacts[contact_id]
         
-        # Remove from address index
+        # Remove from address, name and tag indexes
         self.address_index.pop(contact.address, None)
+        self._unindex_name(contact)
+        self._unindex_tags(contact)
         
         # Remove from contacts
         self.contacts.pop(contact_id)
@@ -330,11 +368,136 @@ class AddressBook:
         Returns:
             The first contact with the given name, or None if not found.
         """
-        for contact in self.contacts.values():
-            if contact.name.lower() == name.lower():
-                return contact
+        contact_ids = self.name_index.get(name.lower())
+        if not contact_ids:
+            return None
+        
+        return self.contacts.get(contact_ids[0])
+    
+    def _index_name(self, contact: Contact, name: Optional[str] = None) -> None:
+        """
+        Add a contact to the name index.
+        
+        Args:
+            contact: The contact to index.
+            name: The name to index it under (default: the contact's name).
+        """
+        self.name_index.setdefault((name or contact.name).lower(), []).append(contact.contact_id)
+    
+    def _unindex_name(self, contact: Contact, name: Optional[str] = None) -> None:
+        """
+        Remove a contact from the name index.
+        
+        Args:
+            contact: The contact to remove.
+            name: The name it is indexed under (default: the contact's name).
+        """
+        key = (name or contact.name).lower()
+        contact_ids = self.name_index.get(key)
+        if contact_ids and contact.contact_id in contact_ids:
+            contact_ids.remove(contact.contact_id)
+            if not contact_ids:
+                del self.name_index[key]
+    
+    def _index_tags(self, contact: Contact) -> None:
+        """
+        Add a contact's tags to the tag index.
+        
+        Args:
+            contact: The contact to index.
+        """
+        for tag in contact.tags:
+            self._index_tag(tag, contact.contact_id)
+    
+    def _unindex_tags(self, contact: Contact) -> None:
+        """
+        Remove a contact's tags from the tag index.
+        
+        Args:
+            contact: The contact to remove.
+        """
+        for tag in contact.tags:
+            self._discard_tag(tag, contact.contact_id)
+    
+    def _index_tag(self, tag: str, contact_id: str) -> None:
+        """
+        Add a contact ID to a tag's index entry.
         
-        return None
+        Args:
+            tag: The tag.
+            contact_id: The ID of the contact.
+        """
+        contact_ids = self.tag_index.get(tag)
+        if contact_ids is None:
+            # A new tag invalidates the sorted tag list
+            contact_ids = self.tag_index[tag] = {}
+            self._sorted_tags = None
+        contact_ids[contact_id] = None
+    
+    def _discard_tag(self, tag: str, contact_id: str) -> None:
+        """
+        Remove a contact ID from a tag's index entry, dropping it when empty.
+        
+        Args:
+            tag: The tag.
+            contact_id: The ID of the contact.
+        """
+        contact_ids = self.tag_index.get(tag)
+        if contact_ids is not None:
+            contact_ids.pop(contact_id, None)
+            if not contact_ids:
+                del self.tag_index[tag]
+                self._sorted_tags = None
+    
+    def add_tag_to_contact(self, contact_id: str, tag: str) -> Contact:
+        """
+        Add a tag to a contact.
+        
+        Args:
+            contact_id: The ID of the contact.
+            tag: The tag to add.
+            
+        Returns:
+            The updated contact.
+            
+        Raises:
+            ValueError: If the contact is not found.
+        """
+        contact = self.get_contact(contact_id)
+        
+        # Add tag if not already present
+        if tag not in contact.tags:
+            contact.tags.add(tag)
+            contact.updated_at = int(time.time())
+            self._index_tag(tag, contact_id)
+        
+        logger.debug(f"Added tag '{tag}' to contact: {contact.name}")
+        return contact
+    
+    def remove_tag_from_contact(self, contact_id: str, tag: str) -> Contact:
+        """
+        Remove a tag from a contact.
+        
+        Args:
+            contact_id: The ID of the contact.
+            tag: The tag to remove.
+            
+        Returns:
+            The updated contact.
+            
+        Raises:
+            ValueError: If the contact is not found.
+        """
+        contact = self.get_contact(contact_id)
+        
+        # Remove tag if present
+        if tag in contact.tags:
+            contact.tags.discard(tag)
+            contact.updated_at = int(time.time())
+            self._discard_tag(tag, contact_id)
+        
+        logger.debug(f"Removed tag '{tag}' from contact: {contact.name}")
+        return contact
     
     def search_contacts(
         self,
@@ -401,7 +564,18 @@ class AddressBook:
         Returns:
             A list of contacts with the given tag.
         """
-        return [contact for contact in self.contacts.values() if tag in contact.tags]
+        return [self.contacts[contact_id] for contact_id in self.tag_index.get(tag, ())]
+    
+    def get_all_tags(self) -> List[str]:
+        """
+        Get all tags used in the address book.
+        
+        Returns:
+            A sorted list of all tags.
+        """
+        if self._sorted_tags is None:
+            self._sorted_tags = sorted(self.tag_index)
+        return list(self._sorted_tags)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -435,6 +609,8 @@ class AddressBook:
             contact = Contact.from_dict(contact_data)
             address_book.contacts[contact_id] = contact
             address_book.address_index[contact.address] = contact_id
+            address_book._index_name(contact)
+            address_book._index_tags(contact)
         
         return address_book
 
@@ -7,10 +7,12 @@ allowing users to securely store their private keys on dedicated hardware
 devices and sign transactions without exposing private keys to the computer.
 """
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import partial
 from typing import Dict, Any, Optional, List, Tuple, Union
 
 from ..core.structures import Transaction
@@ -726,14 +728,8 @@ class HardwareWalletManager:
             return True
         
         # Create wallet interface if it doesn't exist
-        if wallet_type not in self.wallets:
-            if wallet_type == HardwareWalletType.LEDGER:
-                self.wallets[wallet_type] = LedgerWallet()
-            elif wallet_type == HardwareWalletType.TREZOR:
-                self.wallets[wallet_type] = TrezorWallet()
-            else:
-                logger.error(f"Unsupported wallet type: {wallet_type}")
-                return False
+        if not self._ensure_wallet_interface(wallet_type):
+            return False
         
         # Connect to wallet
         if self.wallets[wallet_type].connect():
@@ -745,6 +741,107 @@ class HardwareWalletManager:
             logger.error(f"Failed to connect to {wallet_type.value} wallet")
             return False
 
+    async def connect_first_available(
+        self,
+        wallet_types: Optional[List[HardwareWalletType]] = None
+    ) -> Optional[HardwareWalletType]:
+        """
+        Probe several hardware wallet types concurrently and connect to the first one found.
+
+        Each probe runs in the default executor, so connect latency is that of
+        the slowest probe rather than the sum of all of them. Devices that also
+        connect after the winner are disconnected again.
+
+        Args:
+            wallet_types: The wallet types to probe. If None, probes all types
+                          whose libraries are installed.
+
+        Returns:
+            The type of the connected wallet, or None if no wallet could be connected.
+        """
+        if wallet_types is None:
+            wallet_types = self.get_available_wallets()
+
+        # Create interfaces up front so the probes don't race on self.wallets
+        wallet_types = [wallet_type for wallet_type in wallet_types if self._ensure_wallet_interface(wallet_type)]
+        if not wallet_types:
+            return None
+
+        loop = asyncio.get_running_loop()
+        probes = {
+            loop.run_in_executor(None, self._probe_wallet, wallet_type): wallet_type
+            for wallet_type in wallet_types
+        }
+
+        # Wait until one probe succeeds or all of them fail
+        connected_type = None
+        pending = set(probes)
+        while pending and connected_type is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future.result():
+                    if connected_type is None:
+                        connected_type = probes[future]
+                    else:
+                        self.wallets[probes[future]].disconnect()
+
+        # Disconnect any slower probes that connect after the winner
+        for future in pending:
+            future.add_done_callback(partial(self._discard_probe, probes[future]))
+
+        if connected_type is None:
+            logger.error("No hardware wallet found")
+            return None
+
+        self.active_wallet = self.wallets[connected_type]
+        self.active_wallet_type = connected_type
+        logger.info(f"Connected to {connected_type.value} wallet")
+        return connected_type
+
+    def _ensure_wallet_interface(self, wallet_type: HardwareWalletType) -> bool:
+        """
+        Create the interface for a wallet type if it doesn't exist yet.
+
+        Args:
+            wallet_type: The type of hardware wallet.
+
+        Returns:
+            True if an interface is available, False if the type is unsupported.
+        """
+        if wallet_type not in self.wallets:
+            if wallet_type == HardwareWalletType.LEDGER:
+                self.wallets[wallet_type] = LedgerWallet()
+            elif wallet_type == HardwareWalletType.TREZOR:
+                self.wallets[wallet_type] = TrezorWallet()
+            else:
+                logger.error(f"Unsupported wallet type: {wallet_type}")
+                return False
+        return True
+
+    def _probe_wallet(self, wallet_type: HardwareWalletType) -> bool:
+        """
+        Try to connect a single wallet interface (blocking).
+
+        Args:
+            wallet_type: The type of hardware wallet.
+
+        Returns:
+            True if the device is connected, False otherwise.
+        """
+        wallet = self.wallets[wallet_type]
+        return wallet.is_connected() or wallet.connect()
+
+    def _discard_probe(self, wallet_type: HardwareWalletType, future: asyncio.Future) -> None:
+        """
+        Disconnect a wallet whose probe finished after another wallet was chosen.
+
+        Args:
+            wallet_type: The type of hardware wallet.
+            future: The completed probe.
+        """
+        if not future.cancelled() and future.exception() is None and future.result():
+            self.wallets[wallet_type].disconnect()
+
     def disconnect_wallet(self, wallet_type: Optional[HardwareWalletType] = None) -> None:
         """
         Disconnect from a hardware wallet.
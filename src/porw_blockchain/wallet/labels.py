@@ -48,7 +48,7 @@ class TransactionLabel:
         self.label = label
         self.category = category
         self.notes = notes
-        self.tags = tags or []
+        self.tags: Set[str] = set(tags or [])
         self.created_at = created_at or int(time.time())
         self.updated_at = updated_at or int(time.time())
         
@@ -80,7 +80,7 @@ class TransactionLabel:
             self.notes = notes
         
         if tags is not None:  # Allow empty list to clear tags
-            self.tags = tags
+            self.tags = set(tags)
         
         self.updated_at = int(time.time())
         
@@ -98,7 +98,7 @@ class TransactionLabel:
             "label": self.label,
             "category": self.category,
             "notes": self.notes,
-            "tags": self.tags,
+            "tags": sorted(self.tags),
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
@@ -139,6 +139,9 @@ class TransactionLabelManager:
         """
         self.labels: Dict[str, TransactionLabel] = {}  # transaction_id -> TransactionLabel
         self.categories: Set[str] = set()  # Set of all categories
+        self.category_index: Dict[str, Dict[str, None]] = {}  # category -> transaction_ids, in the order they were labelled
+        self.tag_index: Dict[str, Dict[str, None]] = {}  # tag -> transaction_ids, in the order they were tagged
+        self._sorted_tags: Optional[List[str]] = None  # Cached result of get_all_tags
         
         logger.debug("Initialized TransactionLabelManager")
     
@@ -172,8 +175,13 @@ class TransactionLabelManager:
             tags=tags
         )
         
+        # Replace any existing label in the indexes
+        if transaction_id in self.labels:
+            self._unindex_label(self.labels[transaction_id])
+        
         # Add to labels
         self.labels[transaction_id] = transaction_label
+        self._index_label(transaction_label)
         
         # Add category to categories
         if category:
@@ -213,6 +221,8 @@ class TransactionLabelManager:
         transaction_label = self.labels[transaction_id]
         
         # Update transaction label
+        old_category = transaction_label.category
+        old_tags = set(transaction_label.tags)
         transaction_label.update(
             label=label,
             category=category,
@@ -220,6 +230,17 @@ class TransactionLabelManager:
             tags=tags
         )
         
+        # Re-index only a changed category and tags, so unchanged entries keep their order
+        if transaction_label.category != old_category:
+            if old_category:
+                self._discard_from_index(self.category_index, old_category, transaction_id)
+            if transaction_label.category:
+                self.category_index.setdefault(transaction_label.category, {})[transaction_id] = None
+        for tag in old_tags - transaction_label.tags:
+            self._unindex_tag(tag, transaction_id)
+        for tag in transaction_label.tags - old_tags:
+            self._index_tag(tag, transaction_id)
+        
         # Update categories
         if category:
             self.categories.add(category)
@@ -241,7 +262,7 @@ class TransactionLabelManager:
             raise ValueError(f"Transaction label for {transaction_id} not found")
         
         # Remove from labels
-        self.labels.pop(transaction_id)
+        self._unindex_label(self.labels.pop(transaction_id))
         
         # Update categories
         self._update_categories()
@@ -342,7 +363,7 @@ class TransactionLabelManager:
         Returns:
             A list of transaction labels with the given category.
         """
-        return [label for label in self.labels.values() if label.category == category]
+        return [self.labels[transaction_id] for transaction_id in self.category_index.get(category, ())]
     
     def get_labels_by_tag(self, tag: str) -> List[TransactionLabel]:
         """
@@ -354,7 +375,7 @@ class TransactionLabelManager:
         Returns:
             A list of transaction labels with the given tag.
         """
-        return [label for label in self.labels.values() if tag in label.tags]
+        return [self.labels[transaction_id] for transaction_id in self.tag_index.get(tag, ())]
     
     def get_all_categories(self) -> List[str]:
         """
@@ -372,16 +393,83 @@ class TransactionLabelManager:
         Returns:
             A list of all tags.
         """
-        tags = set()
-        for label in self.labels.values():
-            tags.update(label.tags)
-        return sorted(list(tags))
+        if self._sorted_tags is None:
+            self._sorted_tags = sorted(self.tag_index)
+        return list(self._sorted_tags)
     
     def _update_categories(self) -> None:
         """
         Update the set of categories based on the current labels.
         """
-        self.categories = {label.category for label in self.labels.values() if label.category}
+        self.categories = set(self.category_index)
+    
+    def _index_label(self, transaction_label: TransactionLabel) -> None:
+        """
+        Add a transaction label to the category and tag indexes.
+        
+        Args:
+            transaction_label: The transaction label to index.
+        """
+        transaction_id = transaction_label.transaction_id
+        if transaction_label.category:
+            self.category_index.setdefault(transaction_label.category, {})[transaction_id] = None
+        for tag in transaction_label.tags:
+            self._index_tag(tag, transaction_id)
+    
+    def _unindex_label(self, transaction_label: TransactionLabel) -> None:
+        """
+        Remove a transaction label from the category and tag indexes.
+        
+        Args:
+            transaction_label: The transaction label to remove.
+        """
+        transaction_id = transaction_label.transaction_id
+        if transaction_label.category:
+            self._discard_from_index(self.category_index, transaction_label.category, transaction_id)
+        for tag in transaction_label.tags:
+            self._unindex_tag(tag, transaction_id)
+    
+    def _index_tag(self, tag: str, transaction_id: str) -> None:
+        """
+        Add a transaction ID to a tag's index entry.
+        
+        Args:
+            tag: The tag.
+            transaction_id: The ID of the transaction.
+        """
+        if tag not in self.tag_index:
+            # A new tag invalidates the sorted tag list
+            self._sorted_tags = None
+        self.tag_index.setdefault(tag, {})[transaction_id] = None
+    
+    def _unindex_tag(self, tag: str, transaction_id: str) -> None:
+        """
+        Remove a transaction ID from a tag's index entry.
+        
+        Args:
+            tag: The tag.
+            transaction_id: The ID of the transaction.
+        """
+        self._discard_from_index(self.tag_index, tag, transaction_id)
+        if tag not in self.tag_index:
+            # A removed tag invalidates the sorted tag list
+            self._sorted_tags = None
+    
+    @staticmethod
+    def _discard_from_index(index: Dict[str, Dict[str, None]], key: str, transaction_id: str) -> None:
+        """
+        Remove a transaction ID from an index, dropping empty entries.
+        
+        Args:
+            index: The index to update.
+            key: The category or tag.
+            transaction_id: The ID of the transaction.
+        """
+        transaction_ids = index.get(key)
+        if transaction_ids is not None:
+            transaction_ids.pop(transaction_id, None)
+            if not transaction_ids:
+                del index[key]
     
     def add_tag_to_label(self, transaction_id: str, tag: str) -> TransactionLabel:
         """
@@ -405,8 +493,9 @@ class TransactionLabelManager:
         
         # Add tag if not already present
         if tag not in transaction_label.tags:
-            transaction_label.tags.append(tag)
+            transaction_label.tags.add(tag)
             transaction_label.updated_at = int(time.time())
+            self._index_tag(tag, transaction_id)
         
         logger.debug(f"Added tag '{tag}' to transaction {transaction_id}")
         return transaction_label
@@ -433,8 +522,9 @@ class TransactionLabelManager:
         
         # Remove tag if present
         if tag in transaction_label.tags:
-            transaction_label.tags.remove(tag)
+            transaction_label.tags.discard(tag)
             transaction_label.updated_at = int(time.time())
+            self._unindex_tag(tag, transaction_id)
         
         logger.debug(f"Removed tag '{tag}' from transaction {transaction_id}")
         return transaction_label
@@ -470,7 +560,9 @@ class TransactionLabelManager:
         # Load labels
         labels_data = data.get("labels", {})
         for transaction_id, label_data in labels_data.items():
-            manager.labels[transaction_id] = TransactionLabel.from_dict(label_data)
+            transaction_label = TransactionLabel.from_dict(label_data)
+            manager.labels[transaction_id] = transaction_label
+            manager._index_label(transaction_label)
         
         # Load categories
         manager.categories = set(data.get("categories", []))
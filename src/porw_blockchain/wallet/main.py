@@ -8,21 +8,25 @@ and blockchain querying.
 """
 
 import asyncio
+import copy
 import json
 import logging
 import os
+import secrets
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Tuple, Callable
+from typing import Dict, Any, Optional, List, Union, Tuple, Callable, Iterator
 
 from ..core.structures import Transaction
 from ..core.crypto_utils import (
     load_private_key_from_pem,
     load_public_key_from_pem,
     is_valid_address,
-    get_address_from_pubkey,
-    sign_message,
-    verify_signature
+    get_address_from_pubkey
 )
 from ..network.client import NetworkClient
 from .key_management import (
@@ -39,18 +43,104 @@ from .balance import BalanceTracker
 from .transaction import TransactionBuilder, TransactionMonitor
 from .blockchain import BlockchainMonitor, BlockchainQuery
 from .zkp import ZKPWallet
-from .stealth import StealthWallet
+from .stealth import StealthWallet, shutdown_scan_executor
 from .mixing import MixingWallet
 from .multisig import MultiSigWallet, create_multisig_wallet, join_multisig_wallet
 from .contacts import AddressBook, Contact, create_contact
-from .labels import TransactionLabelManager, TransactionLabel, create_transaction_label
+from .labels import TransactionLabelManager, TransactionLabel
 from .recurring import RecurringTransactionManager, RecurringTransaction, RecurrenceInterval, create_recurring_transaction
 from .hardware import HardwareWalletManager, HardwareWalletType, hardware_wallet_manager
-from .qrcode import QRCodeGenerator, QRCodeParser, QRCodeScanner, PaymentRequest, QRCodeType, QRCodeError, parse_payment_qr_code
+from .qrcode import (
+    QRCodeGenerator,
+    QRCodeParser,
+    QRCodeScanner,
+    PaymentRequest,
+    QRCodeType,
+    QRCodeError,
+    parse_payment_qr_code,
+    MAX_FRAME_DIMENSION
+)
+from .signing import EcdsaBackend, prepare_message, verify_batch
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before writing a coalesced auto-save
+AUTO_SAVE_DELAY = 2.0
+
+# Times a failed background auto-save is retried, with exponential backoff, before giving up
+AUTO_SAVE_MAX_RETRIES = 3
+
+# Wallet data sections whose entries are replaced on every change, never modified in place
+_ENTRY_SECTIONS = frozenset({"address_book", "transaction_labels", "recurring_transactions"})
+
+# Seconds a cached hardware wallet device info entry stays fresh
+HARDWARE_INFO_TTL = 5.0
+
+
+@lru_cache(maxsize=64)
+def _payment_qr_data(
+    address: str,
+    amount: Optional[float],
+    memo: Optional[str],
+    label: Optional[str],
+    expires: Optional[int],
+    request_id: Optional[str]
+) -> str:
+    """
+    Build payment request QR code data, reusing results for repeated parameters.
+
+    Args:
+        address: The payment address.
+        amount: Optional payment amount.
+        memo: Optional payment memo.
+        label: Optional payment label.
+        expires: Optional expiration timestamp.
+        request_id: Optional request ID.
+
+    Returns:
+        QR code data string.
+    """
+    payment_request = PaymentRequest(
+        address=address,
+        amount=amount,
+        memo=memo,
+        label=label,
+        expires=expires,
+        request_id=request_id
+    )
+    return QRCodeGenerator.generate_payment_request_data(payment_request)
+
+
+@lru_cache(maxsize=64)
+def _contact_qr_data(
+    name: str,
+    address: str,
+    email: Optional[str],
+    phone: Optional[str],
+    notes: Optional[str]
+) -> str:
+    """
+    Build contact card QR code data, reusing results for repeated parameters.
+
+    Args:
+        name: Contact name.
+        address: Contact address.
+        email: Optional contact email.
+        phone: Optional contact phone.
+        notes: Optional notes.
+
+    Returns:
+        QR code data string.
+    """
+    return QRCodeGenerator.generate_contact_card_data(
+        name=name,
+        address=address,
+        email=email,
+        phone=phone,
+        notes=notes
+    )
+
 
 class Wallet:
     """
@@ -61,6 +151,27 @@ class Wallet:
     and blockchain querying.
     """
 
+    __slots__ = (
+        # Network
+        "testnet", "network_id", "network_client", "is_connected",
+        # Wallet components
+        "balance_tracker", "blockchain_monitor", "blockchain_query", "transaction_monitor",
+        # Wallet state
+        "wallet_data", "private_key", "public_key", "address",
+        "_private_key_obj", "_public_key_obj", "_ecdsa_backend",
+        "transaction_builder", "zkp_wallet", "stealth_wallet", "mixing_wallet",
+        "multisig_wallets", "address_book", "label_manager", "recurring_manager", "_dict_cache",
+        "_list_snapshots", "_next_nonce", "_executing_due_transactions",
+        # Hardware wallet state
+        "hardware_wallet_manager", "using_hardware_wallet", "hardware_wallet_type",
+        "hardware_derivation_path", "_hw_device_info_cache",
+        # QR code scanner
+        "qr_scanner",
+        # Auto-save state
+        "auto_save", "wallet_password", "auto_save_delay", "_save_dirty", "_save_handle",
+        "_save_lock", "_save_executor", "_in_batch", "_save_retries", "last_save_error",
+    )
+
     def __init__(
         self,
         network_client: Optional[NetworkClient] = None,
@@ -96,6 +207,9 @@ class Wallet:
         self.private_key = None
         self.public_key = None
         self.address = None
+        self._private_key_obj = None  # Parsed private key, cached at load time
+        self._public_key_obj = None  # Parsed public key, cached at load time
+        self._ecdsa_backend = None  # Signing backend selected at load time
         self.transaction_builder = None
         self.zkp_wallet = None
         self.stealth_wallet = None
@@ -104,6 +218,10 @@ class Wallet:
         self.address_book = AddressBook()
         self.label_manager = TransactionLabelManager()
         self.recurring_manager = RecurringTransactionManager()
+        self._dict_cache: Dict[Tuple[str, str], Tuple[int, Dict[str, Any]]] = {}  # (section, id) -> (updated_at, data)
+        self._list_snapshots: Dict[str, Tuple[Dict[str, Any], ...]] = {}  # section -> serialized entries
+        self._next_nonce = 0  # Next nonce handed out by _reserve_nonce
+        self._executing_due_transactions = False  # Whether execute_due_transactions is running
         self.is_connected = False
 
         # Hardware wallet state
@@ -111,10 +229,23 @@ class Wallet:
         self.using_hardware_wallet = False
         self.hardware_wallet_type = None
         self.hardware_derivation_path = None
+        self._hw_device_info_cache: Dict[HardwareWalletType, Tuple[float, Dict[str, Any]]] = {}
 
         # QR code scanner
         self.qr_scanner = None
 
+        # Auto-save state
+        self.auto_save = False
+        self.wallet_password = None
+        self.auto_save_delay = AUTO_SAVE_DELAY
+        self._save_dirty = False
+        self._save_handle = None  # Pending timer for a coalesced auto-save
+        self._save_lock = threading.Lock()  # Serializes every write of the wallet file
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wallet-save")
+        self._in_batch = False  # Defer auto-saves until the current batch ends
+        self._save_retries = 0  # Consecutive failed background auto-saves
+        self.last_save_error: Optional[BaseException] = None  # Error of a failed background auto-save, cleared by the next write
+
         # Connect to network if auto_connect is True
         if auto_connect:
             asyncio.create_task(self.connect())
@@ -154,6 +285,9 @@ class Wallet:
         Disconnect from the blockchain network.
         """
         try:
+            # Write any pending auto-save
+            await self.flush_save_async()
+
             # Stop blockchain monitor
             await self.blockchain_monitor.stop()
 
@@ -187,6 +321,8 @@ class Wallet:
         self.private_key = self.wallet_data["private_key"]
         self.public_key = self.wallet_data["public_key"]
         self.address = self.wallet_data["address"]
+        self._load_key_objects()
+        self._init_wallet_sections()
 
         # Create transaction builder
         self.transaction_builder = TransactionBuilder(
@@ -229,6 +365,12 @@ class Wallet:
                     wallet_data,
                     private_key=self.private_key
                 )
+                self.wallet_data["multisig_wallets"][wallet_id] = self.multisig_wallets[wallet_id].dict_view()
+
+        # Drop serialized entries cached for a previously loaded wallet
+        self._dict_cache.clear()
+        self._list_snapshots.clear()
+        self._init_wallet_sections()
 
         # Load address book if available
         if "address_book" in self.wallet_data:
@@ -271,6 +413,12 @@ class Wallet:
         self.private_key = self.wallet_data["private_key"]
         self.public_key = self.wallet_data["public_key"]
         self.address = self.wallet_data["address"]
+        self._load_key_objects()
+
+        # Drop serialized entries cached for a previously loaded wallet
+        self._dict_cache.clear()
+        self._list_snapshots.clear()
+        self._init_wallet_sections()
 
         # Create transaction builder
         self.transaction_builder = TransactionBuilder(
@@ -309,6 +457,7 @@ class Wallet:
         self.private_key = wallet_data["private_key"]
         self.public_key = wallet_data["public_key"]
         self.address = wallet_data["address"]
+        self._load_key_objects()
 
         # Create transaction builder
         self.transaction_builder = TransactionBuilder(
@@ -351,6 +500,12 @@ class Wallet:
                     wallet_data,
                     private_key=self.private_key
                 )
+                self.wallet_data["multisig_wallets"][wallet_id] = self.multisig_wallets[wallet_id].dict_view()
+
+        # Drop serialized entries cached for a previously loaded wallet
+        self._dict_cache.clear()
+        self._list_snapshots.clear()
+        self._init_wallet_sections()
 
         # Load address book if available
         if "address_book" in self.wallet_data:
@@ -371,6 +526,23 @@ class Wallet:
         logger.info(f"Loaded wallet with address: {self.address}")
         return self.wallet_data
 
+    def _load_key_objects(self) -> None:
+        """
+        Parse the wallet's PEM keys once and cache the resulting key objects.
+
+        Signing and verification reuse these objects so the hot path is the
+        ECDSA operation itself rather than PEM/ASN.1 decoding. secp256k1 keys
+        are routed through libsecp256k1 when coincurve is installed.
+        """
+        self._private_key_obj = (
+            load_private_key_from_pem(self.private_key.encode()) if self.private_key else None
+        )
+        self._public_key_obj = (
+            load_public_key_from_pem(self.public_key.encode()) if self.public_key else None
+        )
+        self._ecdsa_backend = EcdsaBackend(self._private_key_obj, self._public_key_obj)
+        logger.debug(f"Using {self._ecdsa_backend.name} ECDSA backend")
+
     def save_wallet(self, password: str, wallet_name: Optional[str] = None) -> Path:
         """
         Save the wallet to a file.
@@ -388,8 +560,221 @@ class Wallet:
         if not self.wallet_data:
             raise ValueError("No wallet loaded")
 
-        # Save wallet
-        wallet_path = save_wallet(self.wallet_data, password, wallet_name)
+        # Save wallet, waiting for any auto-save being written on the save thread
+        with self._save_lock:
+            wallet_path = save_wallet(self.wallet_data, password, wallet_name)
+
+        logger.info(f"Saved wallet to {wallet_path}")
+        return wallet_path
+
+    def _schedule_save(self) -> None:
+        """
+        Request an auto-save, coalescing bursts of mutations into a single write.
+
+        The first request arms a timer; further requests before it fires are
+        folded into the same save, which is written on a background thread.
+        Without a running event loop the wallet is saved immediately.
+        """
+        if not (self.auto_save and self.wallet_password):
+            return
+
+        self._save_dirty = True
+
+        # Inside a batch, the save happens once when the batch ends
+        if self._in_batch:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_save()
+            return
+
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.auto_save_delay, self._flush_in_background)
+
+    @contextmanager
+    def batch(self) -> Iterator["Wallet"]:
+        """
+        Group several mutations so they are persisted with a single save.
+
+        Auto-saves requested inside the block are deferred and scheduled once
+        when the outermost batch exits. Nested batches join the outer one.
+
+        Yields:
+            The wallet itself.
+        """
+        if self._in_batch:
+            yield self
+            return
+
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._save_dirty:
+                self._schedule_save()
+
+    def flush_save(self) -> Optional[Path]:
+        """
+        Write any pending auto-save to disk immediately.
+
+        This blocks until the wallet is written; use flush_save_async from
+        coroutines so the event loop is not stalled.
+
+        Returns:
+            The path to the saved wallet file, or None if no save was pending.
+        """
+        future = self._submit_pending_save(snapshot=False)
+        if future is None:
+            return None
+        return future.result()
+
+    async def flush_save_async(self) -> Optional[Path]:
+        """
+        Write any pending auto-save to disk, waiting without blocking the event loop.
+
+        Returns:
+            The path to the saved wallet file, or None if no save was pending.
+        """
+        future = self._submit_pending_save(snapshot=True)
+        if future is None:
+            return None
+        return await asyncio.wrap_future(future)
+
+    def _submit_pending_save(self, snapshot: bool) -> Optional[Future]:
+        """
+        Cancel any pending auto-save timer and queue the pending save on the save thread.
+
+        Running every write on the single save thread keeps them ordered.
+
+        Args:
+            snapshot: Write a copy of the wallet data, so mutations made while the
+                      save is being encrypted and written cannot race with it.
+
+        Returns:
+            The save future, or None if no save was pending.
+        """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        if not self._save_dirty or not self.wallet_password:
+            return None
+
+        self._save_dirty = False
+        wallet_data = self._snapshot_wallet_data() if snapshot else self.wallet_data
+        return self._save_executor.submit(self._write_wallet_data, wallet_data, self.wallet_password)
+
+    def _snapshot_wallet_data(self) -> Dict[str, Any]:
+        """
+        Copy the wallet data for a save written on the save thread.
+
+        Contacts, labels and recurring transactions are stored as new copies
+        whenever they change, so copying their containers is enough. Other
+        sections, such as the live multisig wallet views, are deep-copied.
+
+        Returns:
+            A copy of the wallet data that later mutations do not affect.
+        """
+        snapshot = {}
+        for key, value in self.wallet_data.items():
+            if key in _ENTRY_SECTIONS:
+                value = {name: copy.copy(entries) for name, entries in value.items()}
+            elif isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+            snapshot[key] = value
+        return snapshot
+
+    def _flush_in_background(self) -> None:
+        """
+        Write the pending auto-save on the save thread without blocking the event loop.
+
+        The wallet data is snapshotted on the calling thread, so mutations made
+        while the save is being encrypted and written cannot race with it.
+        """
+        self._save_handle = None
+
+        future = self._submit_pending_save(snapshot=True)
+        if future is not None:
+            future.add_done_callback(partial(self._on_background_save, asyncio.get_running_loop()))
+
+    def _on_background_save(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        """
+        Record the outcome of a background save, retrying a failed one with backoff.
+
+        A failed save is retried up to AUTO_SAVE_MAX_RETRIES times, doubling the
+        delay each time. The error is kept in last_save_error; after the last
+        retry the data stays dirty and is written by the next save or flush.
+        This runs on the save thread, so retries are scheduled on the event loop.
+
+        Args:
+            loop: The event loop the save was started from.
+            future: The completed save future.
+        """
+        error = future.exception()
+        if error is None:
+            self._save_retries = 0
+            return
+
+        self.last_save_error = error
+        self._save_dirty = True
+
+        if self._save_retries >= AUTO_SAVE_MAX_RETRIES:
+            logger.error(f"Giving up auto-saving wallet after {self._save_retries + 1} attempts: {error}")
+            self._save_retries = 0
+            return
+
+        delay = self.auto_save_delay * 2 ** self._save_retries
+        self._save_retries += 1
+        logger.error(f"Error auto-saving wallet, retrying in {delay:.1f}s: {error}")
+        try:
+            loop.call_soon_threadsafe(self._schedule_retry, delay)
+        except RuntimeError:
+            # The event loop is closed; the next save or flush writes the data
+            pass
+
+    def _schedule_retry(self, delay: float) -> None:
+        """
+        Arm the auto-save timer to retry a failed background save.
+
+        Args:
+            delay: Seconds to wait before retrying.
+        """
+        if self._save_dirty and self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(delay, self._flush_in_background)
+
+    def close(self) -> None:
+        """
+        Write any pending auto-save and stop the wallet's worker threads and processes.
+
+        This blocks until the wallet is written. Call disconnect() first when
+        connected to the network; the wallet cannot be saved after it is closed.
+        The stealth scan pool is shared, so another wallet's next large scan
+        starts a new one.
+        """
+        try:
+            self.flush_save()
+        finally:
+            self._save_executor.shutdown(wait=True)
+            shutdown_scan_executor()
+
+    def _write_wallet_data(self, wallet_data: Dict[str, Any], password: str) -> Path:
+        """
+        Encrypt and write wallet data to disk.
+
+        Args:
+            wallet_data: The wallet data to write.
+            password: The password to encrypt the wallet with.
+
+        Returns:
+            The path to the saved wallet file.
+        """
+        # Serialize writers so only one save touches the wallet file at a time
+        with self._save_lock:
+            wallet_path = save_wallet(wallet_data, password)
+        self.last_save_error = None
 
         logger.info(f"Saved wallet to {wallet_path}")
         return wallet_path
@@ -595,7 +980,8 @@ class Wallet:
         recipient: str,
         amount: float,
         fee: Optional[float] = None,
-        memo: Optional[str] = None
+        memo: Optional[str] = None,
+        nonce: Optional[int] = None
     ) -> Transaction:
         """
         Create and sign a transaction in one step.
@@ -605,6 +991,7 @@ class Wallet:
             amount: The amount to send.
             fee: The transaction fee (default: calculated automatically).
             memo: Optional memo to include with the transaction.
+            nonce: Optional nonce for the transaction (default: calculated automatically).
 
         Returns:
             A signed Transaction object.
@@ -613,6 +1000,10 @@ class Wallet:
             ValueError: If no wallet is loaded or if the parameters are invalid.
             ConnectionError: If there's an error connecting to the network.
         """
+        # Take the nonce from the wallet's counter, so it cannot collide with reserved ones
+        if nonce is None:
+            nonce = self._reserve_nonce()
+
         if self.using_hardware_wallet:
             # Create transaction using a temporary transaction builder
             from .transaction import TransactionBuilder
@@ -626,7 +1017,7 @@ class Wallet:
             temp_builder.address = self.address
 
             # Create transaction
-            transaction = temp_builder.create_transaction(recipient, amount, fee, memo)
+            transaction = temp_builder.create_transaction(recipient, amount, fee, memo, nonce)
 
             # Sign with hardware wallet
             if not self.hardware_derivation_path:
@@ -655,7 +1046,7 @@ class Wallet:
 
             return signed_tx
         elif self.transaction_builder:
-            return self.transaction_builder.create_and_sign_transaction(recipient, amount, fee, memo)
+            return self.transaction_builder.create_and_sign_transaction(recipient, amount, fee, memo, nonce)
         else:
             raise ValueError("No wallet loaded")
 
@@ -676,6 +1067,11 @@ class Wallet:
         if not self.transaction_builder:
             raise ValueError("No wallet loaded")
 
+        # Persist pending changes before the transaction leaves the wallet,
+        # unless a batch will persist them when it ends
+        if not self._in_batch:
+            await self.flush_save_async()
+
         return await self.transaction_builder.submit_transaction(transaction)
 
     async def send(
@@ -683,7 +1079,8 @@ class Wallet:
         recipient: str,
         amount: float,
         fee: Optional[float] = None,
-        memo: Optional[str] = None
+        memo: Optional[str] = None,
+        nonce: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Create, sign, and submit a transaction in one step.
@@ -693,6 +1090,7 @@ class Wallet:
             amount: The amount to send.
             fee: The transaction fee (default: calculated automatically).
             memo: Optional memo to include with the transaction.
+            nonce: Optional nonce for the transaction (default: calculated automatically).
 
         Returns:
             The submission response.
@@ -705,7 +1103,7 @@ class Wallet:
             raise ValueError("No wallet loaded")
 
         # Create and sign transaction
-        transaction = await self.create_and_sign_transaction(recipient, amount, fee, memo)
+        transaction = await self.create_and_sign_transaction(recipient, amount, fee, memo, nonce)
 
         # Submit transaction
         response = await self.submit_transaction(transaction)
@@ -917,7 +1315,7 @@ class Wallet:
                 self.address = address
 
                 # Get device info
-                device_info = self.hardware_wallet_manager.get_device_info()
+                device_info = self._get_hw_device_info(wallet_type)
                 logger.info(f"Connected to {device_info['type']} {device_info['model']} with address {address}")
 
                 # Initialize wallet components that don't require private key
@@ -933,6 +1331,24 @@ class Wallet:
             logger.error(f"Failed to connect to {wallet_type.value} hardware wallet")
             return False
 
+    async def auto_connect_hardware_wallet(self, derivation_path: str = "m/44'/0'/0'/0/0") -> bool:
+        """
+        Connect to whichever supported hardware wallet is plugged in.
+
+        All supported wallet types are probed concurrently.
+
+        Args:
+            derivation_path: The BIP32 derivation path to use (default: "m/44'/0'/0'/0/0").
+
+        Returns:
+            True if connection was successful, False otherwise.
+        """
+        wallet_type = await self.hardware_wallet_manager.connect_first_available()
+        if wallet_type is None:
+            return False
+
+        return self.connect_hardware_wallet(wallet_type, derivation_path)
+
     def disconnect_hardware_wallet(self) -> None:
         """
         Disconnect from the hardware wallet.
@@ -940,6 +1356,7 @@ class Wallet:
         if self.using_hardware_wallet and self.hardware_wallet_type:
             logger.info(f"Disconnecting from {self.hardware_wallet_type.value} hardware wallet")
             self.hardware_wallet_manager.disconnect_wallet(self.hardware_wallet_type)
+            self._hw_device_info_cache.pop(self.hardware_wallet_type, None)
 
             # Reset hardware wallet state
             self.using_hardware_wallet = False
@@ -957,6 +1374,26 @@ class Wallet:
         return self.using_hardware_wallet and self.hardware_wallet_type is not None and \
                self.hardware_wallet_manager.is_wallet_connected(self.hardware_wallet_type)
 
+    def _get_hw_device_info(self, wallet_type: HardwareWalletType) -> Dict[str, Any]:
+        """
+        Get device info for a hardware wallet, reusing a recent result if available.
+
+        Args:
+            wallet_type: The type of hardware wallet.
+
+        Returns:
+            A dictionary containing device information.
+        """
+        now = time.monotonic()
+        cached = self._hw_device_info_cache.get(wallet_type)
+        if cached and now - cached[0] < HARDWARE_INFO_TTL:
+            return cached[1]
+
+        # Query the device and cache the result
+        device_info = self.hardware_wallet_manager.get_device_info(wallet_type)
+        self._hw_device_info_cache[wallet_type] = (now, device_info)
+        return device_info
+
     def get_hardware_wallet_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the connected hardware wallet.
@@ -968,7 +1405,7 @@ class Wallet:
             return None
 
         try:
-            device_info = self.hardware_wallet_manager.get_device_info(self.hardware_wallet_type)
+            device_info = self._get_hw_device_info(self.hardware_wallet_type)
             return {
                 "type": self.hardware_wallet_type.value,
                 "model": device_info.get("model", "Unknown"),
@@ -1005,23 +1442,24 @@ class Wallet:
             return signature
         elif self.private_key:
             # Use software wallet to sign message
-            # Load private key
-            private_key_obj = load_private_key_from_pem(self.private_key.encode())
+            if self._ecdsa_backend is None:
+                self._load_key_objects()
 
-            # Sign message
-            signature = sign_message(private_key_obj, message.encode())
+            # Sign message digest
+            _, digest = prepare_message(message)
+            signature = self._ecdsa_backend.sign_digest(digest)
 
             return signature.hex()
         else:
             raise ValueError("No wallet loaded")
 
-    def verify_message(self, message: str, signature: str, address: Optional[str] = None) -> bool:
+    def verify_message(self, message: str, signature: Union[str, bytes], address: Optional[str] = None) -> bool:
         """
         Verify a message signature.
 
         Args:
             message: The message that was signed.
-            signature: The signature as a hex string.
+            signature: The signature as a hex string, or as raw bytes if already decoded.
             address: The address that signed the message. If None, uses the loaded wallet's address.
 
         Returns:
@@ -1033,21 +1471,68 @@ class Wallet:
         if not address and not self.public_key:
             raise ValueError("No wallet loaded and no address provided")
 
-        # Use loaded wallet's public key if no address is provided
-        if not address:
-            public_key_pem = self.public_key.encode()
+        # In a real implementation, we would need to look up the public key for the address
+        # For now, we'll just assume the address is the loaded wallet's address
+        if address and address != self.address:
+            raise ValueError("Cannot verify message for address other than the loaded wallet's address")
+
+        if self._ecdsa_backend is None:
+            self._load_key_objects()
+
+        # Convert signature from hex unless it is already decoded
+        if isinstance(signature, (bytes, bytearray)):
+            signature_bytes = bytes(signature)
         else:
-            # In a real implementation, we would need to look up the public key for the address
-            # For now, we'll just assume the address is the loaded wallet's address
-            if address != self.address:
-                raise ValueError("Cannot verify message for address other than the loaded wallet's address")
-            public_key_pem = self.public_key.encode()
+            signature_bytes = bytes.fromhex(signature)
+
+        # Verify signature against the message digest
+        _, digest = prepare_message(message)
+        return self._ecdsa_backend.verify_digest(signature_bytes, digest)
+
+    def verify_messages_batch(self, items: List[Tuple[str, Union[str, bytes], Optional[str]]]) -> List[bool]:
+        """
+        Verify a batch of signed messages.
 
-        # Convert signature from hex
-        signature_bytes = bytes.fromhex(signature)
+        Args:
+            items: A list of (message, signature, public_key) tuples. The signature
+                is hex-encoded or raw bytes and the public key is PEM-encoded; if the
+                public key is None, the loaded wallet's public key is used.
 
-        # Verify signature
-        return verify_signature(public_key_pem, signature_bytes, message.encode())
+        Returns:
+            A list with one boolean per item, True if that signature is valid.
+
+        Raises:
+            ValueError: If an item has no public key and no wallet is loaded.
+        """
+        results: List[Optional[bool]] = []
+        batch = []
+        batch_indexes = []
+        for message, signature, public_key in items:
+            if isinstance(signature, (bytes, bytearray)):
+                signature_bytes = bytes(signature)
+            else:
+                try:
+                    signature_bytes = bytes.fromhex(signature)
+                except ValueError:
+                    signature_bytes = b""
+
+            if not public_key or public_key == self.public_key:
+                # Use the wallet's already-parsed key instead of re-parsing its PEM
+                if not self.public_key:
+                    raise ValueError("No wallet loaded and no public key provided")
+                if self._ecdsa_backend is None:
+                    self._load_key_objects()
+                results.append(self._ecdsa_backend.verify_digest(signature_bytes, prepare_message(message)[1]))
+            else:
+                batch_indexes.append(len(results))
+                results.append(None)
+                batch.append((prepare_message(message)[1], signature_bytes, public_key))
+
+        # Verify signatures made with other keys as one batch
+        for index, valid in zip(batch_indexes, verify_batch(batch, prehashed=True)):
+            results[index] = valid
+
+        return results
 
     # --- Zero-Knowledge Proof Methods ---
 
@@ -1217,9 +1702,8 @@ class Wallet:
         # Update wallet data
         self.wallet_data["stealth_data"] = stealth_data
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         return stealth_data
 
@@ -1280,6 +1764,9 @@ class Wallet:
         """
         Create and submit a transaction to a stealth address.
 
+        The transaction is signed here with the wallet's own key, so its
+        signature is not verified again before it is submitted.
+
         Args:
             recipient_stealth_address: The recipient's stealth address.
             amount: The amount to send.
@@ -1296,19 +1783,23 @@ class Wallet:
         if not self.stealth_wallet or not self.transaction_builder:
             raise ValueError("No wallet loaded")
 
-        # Create stealth payment
-        transaction, stealth_metadata = await self.create_stealth_payment(
+        # Create stealth payment with the wallet's own transaction builder
+        transaction, stealth_metadata = self.stealth_wallet.create_stealth_payment(
             recipient_stealth_address=recipient_stealth_address,
             amount=amount,
             fee=fee,
-            memo=memo
+            memo=memo,
+            tx_builder=self.transaction_builder
         )
 
-        # Sign transaction
+        # Sign transaction, carrying the stealth metadata over to the signed copy
         signed_transaction = self.transaction_builder.sign_transaction(transaction)
+        signed_transaction.stealth_metadata = stealth_metadata
 
-        # Submit transaction
-        response = await self.transaction_builder.submit_transaction(signed_transaction)
+        # Submit transaction without re-verifying the signature: it was just made by
+        # this builder's key over the same fields the check would re-serialize, and the
+        # stealth metadata set afterwards is not covered by the signature either way
+        response = await self.transaction_builder.submit_transaction(signed_transaction, verify=False)
 
         return response
 
@@ -1328,11 +1819,12 @@ class Wallet:
         # Get transactions
         transactions = await self.get_transactions()
 
-        # Convert transactions to dictionaries
-        tx_dicts = [tx.dict() for tx in transactions]
+        # Only transactions carrying stealth metadata can be stealth payments, so
+        # skip the dict conversion for everything else
+        tx_dicts = [tx.dict() for tx in transactions if tx.stealth_metadata]
 
-        # Scan for payments
-        return self.stealth_wallet.scan_for_payments(tx_dicts)
+        # Scan for payments, sharding large histories across worker processes
+        return await self.stealth_wallet.scan_for_payments_parallel(tx_dicts)
 
     # --- Mixing Methods ---
 
@@ -1382,9 +1874,8 @@ class Wallet:
             "participants": []
         }
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         return session
 
@@ -1429,9 +1920,8 @@ class Wallet:
 
         self.wallet_data["mixing_data"][session_id]["participants"].append(participant["participant_id"])
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         return participant
 
@@ -1454,6 +1944,33 @@ class Wallet:
         # Get session status
         return await self.mixing_wallet.get_session_status(session_id)
 
+    async def wait_for_mixing_session_status(
+        self,
+        session_id: str,
+        status: str,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait until a mixing session reaches a status.
+
+        Args:
+            session_id: The session ID.
+            status: The status to wait for.
+            timeout: Maximum time to wait in seconds (default: no limit).
+
+        Returns:
+            The session status data.
+
+        Raises:
+            ValueError: If no wallet is loaded, or the session is not found or fails.
+            asyncio.TimeoutError: If the status is not reached within the timeout.
+        """
+        if not self.mixing_wallet:
+            raise ValueError("No wallet loaded")
+
+        # Wait for session status
+        return await self.mixing_wallet.wait_for_status(session_id, status, timeout)
+
     async def get_active_mixing_sessions(self) -> List[Dict[str, Any]]:
         """
         Get all active mixing sessions.
@@ -1470,6 +1987,22 @@ class Wallet:
         # Get active sessions
         return await self.mixing_wallet.get_active_sessions()
 
+    async def get_active_mixing_sessions_json(self) -> bytes:
+        """
+        Get all active mixing sessions, encoded as a JSON array.
+
+        Returns:
+            The active session data as UTF-8 encoded JSON.
+
+        Raises:
+            ValueError: If no wallet is loaded.
+        """
+        if not self.mixing_wallet:
+            raise ValueError("No wallet loaded")
+
+        # Get encoded active sessions
+        return await self.mixing_wallet.get_active_sessions_json()
+
     async def get_my_mixing_sessions(self) -> List[Dict[str, Any]]:
         """
         Get all mixing sessions the wallet is participating in.
@@ -1540,6 +2073,25 @@ class Wallet:
             participant_id=participant_id
         )
 
+    async def sign_coinjoin_transactions_bulk(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Sign the CoinJoin transactions of several mixing sessions concurrently.
+
+        Args:
+            session_ids: The IDs of the sessions to sign.
+
+        Returns:
+            A list of signature data, one entry per signing participant.
+
+        Raises:
+            ValueError: If no wallet is loaded or a session is not found.
+        """
+        if not self.mixing_wallet:
+            raise ValueError("No wallet loaded")
+
+        # Sign transactions
+        return await self.mixing_wallet.sign_coinjoin_transactions_bulk(session_ids)
+
     async def get_final_coinjoin_transaction(self, session_id: str) -> Dict[str, Any]:
         """
         Get the final CoinJoin transaction.
@@ -1583,9 +2135,8 @@ class Wallet:
             self.wallet_data["mixing_data"][session_id]["status"] = "completed"
             self.wallet_data["mixing_data"][session_id]["transaction_id"] = response["transaction_id"]
 
-            # Save wallet if auto_save is enabled
-            if self.auto_save and self.wallet_password:
-                self.save_wallet(self.wallet_password)
+            # Schedule an auto-save if enabled
+            self._schedule_save()
 
         return response
 
@@ -1632,11 +2183,10 @@ class Wallet:
         if "multisig_wallets" not in self.wallet_data:
             self.wallet_data["multisig_wallets"] = {}
 
-        self.wallet_data["multisig_wallets"][multisig_wallet.wallet_id] = multisig_wallet.to_dict()
+        self.wallet_data["multisig_wallets"][multisig_wallet.wallet_id] = multisig_wallet.dict_view()
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Created multisig wallet: {multisig_wallet.wallet_id}")
         return multisig_wallet.to_dict()
@@ -1673,11 +2223,10 @@ class Wallet:
         if "multisig_wallets" not in self.wallet_data:
             self.wallet_data["multisig_wallets"] = {}
 
-        self.wallet_data["multisig_wallets"][multisig_wallet.wallet_id] = multisig_wallet.to_dict()
+        self.wallet_data["multisig_wallets"][multisig_wallet.wallet_id] = multisig_wallet.dict_view()
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Joined multisig wallet: {multisig_wallet.wallet_id}")
         return multisig_wallet.to_dict()
@@ -1695,10 +2244,11 @@ class Wallet:
         Raises:
             ValueError: If the wallet is not found.
         """
-        if wallet_id not in self.multisig_wallets:
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
             raise ValueError(f"Multisig wallet {wallet_id} not found")
 
-        return self.multisig_wallets[wallet_id].to_dict()
+        return multisig_wallet.to_dict()
 
     def list_multisig_wallets(self) -> List[Dict[str, Any]]:
         """
@@ -1733,23 +2283,22 @@ class Wallet:
         Raises:
             ValueError: If the wallet is not found or the parameters are invalid.
         """
-        if wallet_id not in self.multisig_wallets:
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
             raise ValueError(f"Multisig wallet {wallet_id} not found")
 
         # Create transaction
-        transaction_data = self.multisig_wallets[wallet_id].create_transaction(
+        transaction_data = multisig_wallet.create_transaction(
             recipient=recipient,
             amount=amount,
             fee=fee,
             memo=memo
         )
 
-        # Update wallet data
-        self.wallet_data["multisig_wallets"][wallet_id] = self.multisig_wallets[wallet_id].to_dict()
+        # Wallet data holds the multisig wallet's live dict view, so it is already current
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Created multisig transaction: {transaction_data['transaction_id']}")
         return transaction_data
@@ -1772,18 +2321,17 @@ class Wallet:
         Raises:
             ValueError: If the wallet or transaction is not found.
         """
-        if wallet_id not in self.multisig_wallets:
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
             raise ValueError(f"Multisig wallet {wallet_id} not found")
 
         # Sign transaction
-        transaction_data = self.multisig_wallets[wallet_id].sign_transaction(transaction_id)
+        transaction_data = multisig_wallet.sign_transaction(transaction_id)
 
-        # Update wallet data
-        self.wallet_data["multisig_wallets"][wallet_id] = self.multisig_wallets[wallet_id].to_dict()
+        # Wallet data holds the multisig wallet's live dict view, so it is already current
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Signed multisig transaction: {transaction_id}")
         return transaction_data
@@ -1806,10 +2354,31 @@ class Wallet:
         Raises:
             ValueError: If the wallet or transaction is not found.
         """
-        if wallet_id not in self.multisig_wallets:
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
             raise ValueError(f"Multisig wallet {wallet_id} not found")
 
-        return self.multisig_wallets[wallet_id].verify_transaction(transaction_id)
+        return multisig_wallet.verify_transaction_batch(transaction_id)
+
+    def verify_all_multisig_transactions(self, wallet_id: str) -> Dict[str, bool]:
+        """
+        Verify all pending transactions of a multi-signature wallet.
+
+        Args:
+            wallet_id: The ID of the multi-signature wallet.
+
+        Returns:
+            A dictionary mapping each pending transaction ID to True if it has
+            enough valid signatures, False otherwise.
+
+        Raises:
+            ValueError: If the wallet is not found.
+        """
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
+            raise ValueError(f"Multisig wallet {wallet_id} not found")
+
+        return multisig_wallet.verify_all_pending()
 
     async def finalize_and_submit_multisig_transaction(
         self,
@@ -1829,30 +2398,187 @@ class Wallet:
         Raises:
             ValueError: If the wallet or transaction is not found or doesn't have enough signatures.
         """
-        if wallet_id not in self.multisig_wallets:
+        multisig_wallet = self.multisig_wallets.get(wallet_id)
+        if multisig_wallet is None:
             raise ValueError(f"Multisig wallet {wallet_id} not found")
 
         if not self.transaction_builder:
             raise ValueError("No wallet loaded")
 
         # Finalize transaction
-        transaction = self.multisig_wallets[wallet_id].finalize_transaction(transaction_id)
+        transaction = multisig_wallet.finalize_transaction(transaction_id)
 
         # Submit transaction
         response = await self.transaction_builder.submit_transaction(transaction)
 
-        # Update wallet data
-        self.wallet_data["multisig_wallets"][wallet_id] = self.multisig_wallets[wallet_id].to_dict()
+        # Wallet data holds the multisig wallet's live dict view, so it is already current
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Submitted multisig transaction: {transaction_id}")
         return response
 
     # --- Address Book Methods ---
 
+    def _init_wallet_sections(self) -> None:
+        """
+        Ensure the wallet data has the address book, label and recurring transaction sections.
+
+        Creating them once when a wallet is created or loaded lets mutations
+        write their entries directly, without checking for the sections first.
+        """
+        self.wallet_data.setdefault("address_book", {}).setdefault("contacts", {})
+        transaction_labels = self.wallet_data.setdefault("transaction_labels", {})
+        transaction_labels.setdefault("labels", {})
+        transaction_labels.setdefault("categories", [])
+        self.wallet_data.setdefault("recurring_transactions", {}).setdefault("transactions", {})
+
+    def _to_dict_cached(self, section: str, key: str, item: Any) -> Dict[str, Any]:
+        """
+        Serialize a contact, label or recurring transaction, reusing the last result.
+
+        The caller gets its own copy, so modifying it cannot alter the cache
+        or the wallet data.
+
+        Args:
+            section: The wallet data section the item belongs to.
+            key: The ID of the item.
+            item: The item to serialize.
+
+        Returns:
+            The serialized item.
+        """
+        return self._copy_entry(self._cached_dict(section, key, item))
+
+    def _cached_dict(self, section: str, key: str, item: Any) -> Dict[str, Any]:
+        """
+        Get the cached serialization of a contact, label or recurring transaction.
+
+        Cached entries are keyed by the item's updated_at timestamp and are
+        dropped whenever the item is stored after a mutation. The returned
+        dictionary is shared and must not be modified or handed out.
+
+        Args:
+            section: The wallet data section the item belongs to.
+            key: The ID of the item.
+            item: The item to serialize.
+
+        Returns:
+            The shared serialized item.
+        """
+        cached = self._dict_cache.get((section, key))
+        if cached is not None and cached[0] == item.updated_at:
+            return cached[1]
+
+        data = item.to_dict()
+        self._dict_cache[(section, key)] = (item.updated_at, data)
+        return data
+
+    @staticmethod
+    def _copy_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a serialized entry, including its list fields (e.g. tags).
+
+        Serialized entries only hold flat values and lists, so this is a full copy.
+
+        Args:
+            data: The serialized entry.
+
+        Returns:
+            An independent copy of the entry.
+        """
+        return {field: list(value) if isinstance(value, list) else value for field, value in data.items()}
+
+    def _list_snapshot(self, section: str, list_items: Callable[[], List[Any]], key_attr: str) -> List[Dict[str, Any]]:
+        """
+        List the serialized entries of a section from an immutable snapshot.
+
+        The snapshot is rebuilt only after an entry of the section is stored,
+        so repeated listings neither walk the manager nor re-serialize entries.
+
+        Args:
+            section: The wallet data section (e.g. "address_book").
+            list_items: Returns the section's items from its manager.
+            key_attr: The name of the items' ID attribute.
+
+        Returns:
+            A new list of copies of the serialized entries.
+        """
+        snapshot = self._list_snapshots.get(section)
+        if snapshot is None:
+            snapshot = tuple(
+                self._cached_dict(section, getattr(item, key_attr), item)
+                for item in list_items()
+            )
+            self._list_snapshots[section] = snapshot
+        return [self._copy_entry(data) for data in snapshot]
+
+    def _store_wallet_entry(self, section: str, collection: str, key: str, item: Optional[Any]) -> None:
+        """
+        Update a single entry of a manager's snapshot in the wallet data.
+
+        Only the changed entry is re-serialized, instead of dumping the whole
+        manager after every mutation.
+
+        Args:
+            section: The wallet data section (e.g. "address_book").
+            collection: The collection within the section (e.g. "contacts").
+            key: The ID of the entry.
+            item: The mutated contact, label or recurring transaction, or None to remove it.
+        """
+        # Invalidate the cached serialization of the mutated entry and its section listing
+        self._dict_cache.pop((section, key), None)
+        self._list_snapshots.pop(section, None)
+
+        entries = self.wallet_data[section][collection]
+        if item is None:
+            entries.pop(key, None)
+        else:
+            # Store a separate copy, so the persisted data never shares objects with the cache
+            entries[key] = self._to_dict_cached(section, key, item)
+
+    @staticmethod
+    def _is_unchanged(item: Any, **fields: Any) -> bool:
+        """
+        Check whether an update would leave an item unchanged.
+
+        Fields passed as None are not being updated and are ignored, matching
+        the update methods of the address book and managers.
+
+        Args:
+            item: The contact, label or recurring transaction to compare against.
+            **fields: The requested field values.
+
+        Returns:
+            True if every requested field already has the requested value.
+        """
+        for name, value in fields.items():
+            if value is None:
+                continue
+
+            current = getattr(item, name)
+            if name == "tags":
+                value = set(value)
+            elif isinstance(current, RecurrenceInterval) and isinstance(value, str):
+                current = current.value
+
+            if current != value:
+                return False
+
+        return True
+
+    def _store_transaction_label(self, transaction_id: str) -> None:
+        """
+        Update a single transaction label in the wallet data.
+
+        Args:
+            transaction_id: The ID of the labeled transaction.
+        """
+        transaction_label = self.label_manager.get_label(transaction_id)
+        self._store_wallet_entry("transaction_labels", "labels", transaction_id, transaction_label)
+        self.wallet_data["transaction_labels"]["categories"] = list(self.label_manager.categories)
+
     def add_contact(
         self,
         name: str,
@@ -1893,17 +2619,13 @@ class Wallet:
         self.address_book.add_contact(contact)
 
         # Update wallet data
-        if "address_book" not in self.wallet_data:
-            self.wallet_data["address_book"] = {}
-
-        self.wallet_data["address_book"] = self.address_book.to_dict()
+        self._store_wallet_entry("address_book", "contacts", contact.contact_id, contact)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Added contact: {name} ({address})")
-        return contact.to_dict()
+        return self._to_dict_cached("address_book", contact.contact_id, contact)
 
     def update_contact(
         self,
@@ -1933,6 +2655,14 @@ class Wallet:
         Raises:
             ValueError: If the contact is not found or the address is invalid.
         """
+        # Nothing to update or save if no field changes
+        contact = self.address_book.get_contact(contact_id)
+        if self._is_unchanged(
+            contact, name=name, address=address, email=email,
+            phone=phone, description=description, tags=tags
+        ):
+            return self._to_dict_cached("address_book", contact_id, contact)
+
         # Update contact
         contact = self.address_book.update_contact(
             contact_id=contact_id,
@@ -1945,14 +2675,13 @@ class Wallet:
         )
 
         # Update wallet data
-        self.wallet_data["address_book"] = self.address_book.to_dict()
+        self._store_wallet_entry("address_book", "contacts", contact_id, contact)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Updated contact: {contact.name} ({contact.address})")
-        return contact.to_dict()
+        return self._to_dict_cached("address_book", contact_id, contact)
 
     def remove_contact(self, contact_id: str) -> None:
         """
@@ -1972,11 +2701,10 @@ class Wallet:
         self.address_book.remove_contact(contact_id)
 
         # Update wallet data
-        self.wallet_data["address_book"] = self.address_book.to_dict()
+        self._store_wallet_entry("address_book", "contacts", contact_id, None)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Removed contact: {contact_name}")
 
@@ -1994,7 +2722,7 @@ class Wallet:
             ValueError: If the contact is not found.
         """
         contact = self.address_book.get_contact(contact_id)
-        return contact.to_dict()
+        return self._to_dict_cached("address_book", contact.contact_id, contact)
 
     def get_contact_by_address(self, address: str) -> Optional[Dict[str, Any]]:
         """
@@ -2007,7 +2735,7 @@ class Wallet:
             The contact data, or None if not found.
         """
         contact = self.address_book.get_contact_by_address(address)
-        return contact.to_dict() if contact else None
+        return self._to_dict_cached("address_book", contact.contact_id, contact) if contact else None
 
     def get_contact_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -2020,7 +2748,7 @@ class Wallet:
             The contact data, or None if not found.
         """
         contact = self.address_book.get_contact_by_name(name)
-        return contact.to_dict() if contact else None
+        return self._to_dict_cached("address_book", contact.contact_id, contact) if contact else None
 
     def search_contacts(
         self,
@@ -2038,7 +2766,7 @@ class Wallet:
             A list of matching contact data.
         """
         contacts = self.address_book.search_contacts(query=query, tags=tags)
-        return [contact.to_dict() for contact in contacts]
+        return [self._to_dict_cached("address_book", contact.contact_id, contact) for contact in contacts]
 
     def list_contacts(self) -> List[Dict[str, Any]]:
         """
@@ -2047,8 +2775,7 @@ class Wallet:
         Returns:
             A list of all contact data.
         """
-        contacts = self.address_book.list_contacts()
-        return [contact.to_dict() for contact in contacts]
+        return self._list_snapshot("address_book", self.address_book.list_contacts, "contact_id")
 
     def get_contacts_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """
@@ -2061,18 +2788,19 @@ class Wallet:
             A list of contacts with the given tag.
         """
         contacts = self.address_book.get_contacts_by_tag(tag)
-        return [contact.to_dict() for contact in contacts]
+        return [self._to_dict_cached("address_book", contact.contact_id, contact) for contact in contacts]
 
-    def add_tag_to_contact(self, contact_id: str, tag: str) -> Dict[str, Any]:
+    def _edit_contact_tag(self, contact_id: str, tag: str, add: bool) -> Contact:
         """
-        Add a tag to a contact.
+        Add or remove a contact tag and persist the change.
 
         Args:
             contact_id: The ID of the contact.
-            tag: The tag to add.
+            tag: The tag to add or remove.
+            add: True to add the tag, False to remove it.
 
         Returns:
-            The updated contact data.
+            The contact.
 
         Raises:
             ValueError: If the contact is not found.
@@ -2080,31 +2808,35 @@ class Wallet:
         # Get contact
         contact = self.address_book.get_contact(contact_id)
 
-        # Add tag if not already present
-        if tag not in contact.tags:
-            contact.tags.append(tag)
+        # Nothing to update or save if the tag is already in the requested state
+        if (tag in contact.tags) == add:
+            return contact
 
-            # Update contact
-            contact.updated_at = int(time.time())
+        # Add or remove tag
+        if add:
+            self.address_book.add_tag_to_contact(contact_id, tag)
+        else:
+            self.address_book.remove_tag_from_contact(contact_id, tag)
 
-            # Update wallet data
-            self.wallet_data["address_book"] = self.address_book.to_dict()
+        # Update wallet data
+        self._store_wallet_entry("address_book", "contacts", contact_id, contact)
 
-            # Save wallet if auto_save is enabled
-            if self.auto_save and self.wallet_password:
-                self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
+        if add:
             logger.info(f"Added tag '{tag}' to contact: {contact.name}")
+        else:
+            logger.info(f"Removed tag '{tag}' from contact: {contact.name}")
+        return contact
 
-        return contact.to_dict()
-
-    def remove_tag_from_contact(self, contact_id: str, tag: str) -> Dict[str, Any]:
+    def add_tag_to_contact(self, contact_id: str, tag: str) -> Dict[str, Any]:
         """
-        Remove a tag from a contact.
+        Add a tag to a contact.
 
         Args:
             contact_id: The ID of the contact.
-            tag: The tag to remove.
+            tag: The tag to add.
 
         Returns:
             The updated contact data.
@@ -2112,26 +2844,25 @@ class Wallet:
         Raises:
             ValueError: If the contact is not found.
         """
-        # Get contact
-        contact = self.address_book.get_contact(contact_id)
-
-        # Remove tag if present
-        if tag in contact.tags:
-            contact.tags.remove(tag)
+        contact = self._edit_contact_tag(contact_id, tag, add=True)
+        return self._to_dict_cached("address_book", contact_id, contact)
 
-            # Update contact
-            contact.updated_at = int(time.time())
-
-            # Update wallet data
-            self.wallet_data["address_book"] = self.address_book.to_dict()
+    def remove_tag_from_contact(self, contact_id: str, tag: str) -> Dict[str, Any]:
+        """
+        Remove a tag from a contact.
 
-            # Save wallet if auto_save is enabled
-            if self.auto_save and self.wallet_password:
-                self.save_wallet(self.wallet_password)
+        Args:
+            contact_id: The ID of the contact.
+            tag: The tag to remove.
 
-            logger.info(f"Removed tag '{tag}' from contact: {contact.name}")
+        Returns:
+            The updated contact data.
 
-        return contact.to_dict()
+        Raises:
+            ValueError: If the contact is not found.
+        """
+        contact = self._edit_contact_tag(contact_id, tag, add=False)
+        return self._to_dict_cached("address_book", contact_id, contact)
 
     def get_all_tags(self) -> List[str]:
         """
@@ -2140,10 +2871,7 @@ class Wallet:
         Returns:
             A list of all unique tags.
         """
-        tags = set()
-        for contact in self.address_book.list_contacts():
-            tags.update(contact.tags)
-        return sorted(list(tags))
+        return self.address_book.get_all_tags()
 
     # --- Transaction Labeling Methods ---
 
@@ -2168,17 +2896,8 @@ class Wallet:
         Returns:
             The added transaction label data.
         """
-        # Create transaction label
-        transaction_label = create_transaction_label(
-            transaction_id=transaction_id,
-            label=label,
-            category=category,
-            notes=notes,
-            tags=tags
-        )
-
-        # Add to label manager
-        self.label_manager.add_label(
+        # Create the label in the label manager
+        transaction_label = self.label_manager.add_label(
             transaction_id=transaction_id,
             label=label,
             category=category,
@@ -2187,17 +2906,13 @@ class Wallet:
         )
 
         # Update wallet data
-        if "transaction_labels" not in self.wallet_data:
-            self.wallet_data["transaction_labels"] = {}
-
-        self.wallet_data["transaction_labels"] = self.label_manager.to_dict()
+        self._store_transaction_label(transaction_id)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Added label to transaction {transaction_id}")
-        return transaction_label.to_dict()
+        return self._to_dict_cached("transaction_labels", transaction_id, transaction_label)
 
     def update_transaction_label(
         self,
@@ -2223,6 +2938,13 @@ class Wallet:
         Raises:
             ValueError: If the transaction label is not found.
         """
+        # Nothing to update or save if no field changes
+        transaction_label = self.label_manager.get_label(transaction_id)
+        if transaction_label and self._is_unchanged(
+            transaction_label, label=label, category=category, notes=notes, tags=tags
+        ):
+            return self._to_dict_cached("transaction_labels", transaction_id, transaction_label)
+
         # Update transaction label
         transaction_label = self.label_manager.update_label(
             transaction_id=transaction_id,
@@ -2233,14 +2955,13 @@ class Wallet:
         )
 
         # Update wallet data
-        self.wallet_data["transaction_labels"] = self.label_manager.to_dict()
+        self._store_transaction_label(transaction_id)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Updated label for transaction {transaction_id}")
-        return transaction_label.to_dict()
+        return self._to_dict_cached("transaction_labels", transaction_id, transaction_label)
 
     def remove_transaction_label(self, transaction_id: str) -> None:
         """
@@ -2256,11 +2977,10 @@ class Wallet:
         self.label_manager.remove_label(transaction_id)
 
         # Update wallet data
-        self.wallet_data["transaction_labels"] = self.label_manager.to_dict()
+        self._store_transaction_label(transaction_id)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Removed label for transaction {transaction_id}")
 
@@ -2275,7 +2995,7 @@ class Wallet:
             The transaction label data, or None if not found.
         """
         transaction_label = self.label_manager.get_label(transaction_id)
-        return transaction_label.to_dict() if transaction_label else None
+        return self._to_dict_cached("transaction_labels", transaction_id, transaction_label) if transaction_label else None
 
     def search_transaction_labels(
         self,
@@ -2299,7 +3019,10 @@ class Wallet:
             category=category,
             tags=tags
         )
-        return [label.to_dict() for label in transaction_labels]
+        return [
+            self._to_dict_cached("transaction_labels", label.transaction_id, label)
+            for label in transaction_labels
+        ]
 
     def list_transaction_labels(self) -> List[Dict[str, Any]]:
         """
@@ -2308,8 +3031,7 @@ class Wallet:
         Returns:
             A list of all transaction label data.
         """
-        transaction_labels = self.label_manager.list_labels()
-        return [label.to_dict() for label in transaction_labels]
+        return self._list_snapshot("transaction_labels", self.label_manager.list_labels, "transaction_id")
 
     def get_transaction_labels_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
@@ -2322,7 +3044,10 @@ class Wallet:
             A list of transaction labels with the given category.
         """
         transaction_labels = self.label_manager.get_labels_by_category(category)
-        return [label.to_dict() for label in transaction_labels]
+        return [
+            self._to_dict_cached("transaction_labels", label.transaction_id, label)
+            for label in transaction_labels
+        ]
 
     def get_transaction_labels_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """
@@ -2335,7 +3060,10 @@ class Wallet:
             A list of transaction labels with the given tag.
         """
         transaction_labels = self.label_manager.get_labels_by_tag(tag)
-        return [label.to_dict() for label in transaction_labels]
+        return [
+            self._to_dict_cached("transaction_labels", label.transaction_id, label)
+            for label in transaction_labels
+        ]
 
     def get_all_transaction_categories(self) -> List[str]:
         """
@@ -2392,8 +3120,7 @@ class Wallet:
             ValueError: If the parameters are invalid.
         """
         # Generate transaction ID
-        import uuid
-        transaction_id = f"recurring_{uuid.uuid4().hex[:8]}"
+        transaction_id = f"recurring_{secrets.token_hex(4)}"
 
         # Create recurring transaction
         transaction = self.recurring_manager.add_transaction(
@@ -2411,17 +3138,13 @@ class Wallet:
         )
 
         # Update wallet data
-        if "recurring_transactions" not in self.wallet_data:
-            self.wallet_data["recurring_transactions"] = {}
-
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+        self._store_wallet_entry("recurring_transactions", "transactions", transaction_id, transaction)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Created recurring transaction {transaction_id}")
-        return transaction.to_dict()
+        return self._to_dict_cached("recurring_transactions", transaction_id, transaction)
 
     def update_recurring_transaction(
         self,
@@ -2459,6 +3182,15 @@ class Wallet:
         Raises:
             ValueError: If the transaction is not found or the parameters are invalid.
         """
+        # Nothing to update or save if no field changes
+        transaction = self.recurring_manager.get_transaction(transaction_id)
+        if transaction and self._is_unchanged(
+            transaction, recipient=recipient, amount=amount, interval=interval,
+            start_date=start_date, end_date=end_date, custom_days=custom_days,
+            memo=memo, fee=fee, enabled=enabled, max_executions=max_executions
+        ):
+            return self._to_dict_cached("recurring_transactions", transaction_id, transaction)
+
         # Update recurring transaction
         transaction = self.recurring_manager.update_transaction(
             transaction_id=transaction_id,
@@ -2475,14 +3207,13 @@ class Wallet:
         )
 
         # Update wallet data
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+        self._store_wallet_entry("recurring_transactions", "transactions", transaction_id, transaction)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Updated recurring transaction {transaction_id}")
-        return transaction.to_dict()
+        return self._to_dict_cached("recurring_transactions", transaction_id, transaction)
 
     def remove_recurring_transaction(self, transaction_id: str) -> None:
         """
@@ -2498,11 +3229,10 @@ class Wallet:
         self.recurring_manager.remove_transaction(transaction_id)
 
         # Update wallet data
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+        self._store_wallet_entry("recurring_transactions", "transactions", transaction_id, None)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Removed recurring transaction {transaction_id}")
 
@@ -2517,7 +3247,7 @@ class Wallet:
             The recurring transaction data, or None if not found.
         """
         transaction = self.recurring_manager.get_transaction(transaction_id)
-        return transaction.to_dict() if transaction else None
+        return self._to_dict_cached("recurring_transactions", transaction_id, transaction) if transaction else None
 
     def list_recurring_transactions(self) -> List[Dict[str, Any]]:
         """
@@ -2526,8 +3256,9 @@ class Wallet:
         Returns:
             A list of all recurring transaction data.
         """
-        transactions = self.recurring_manager.list_transactions()
-        return [transaction.to_dict() for transaction in transactions]
+        return self._list_snapshot(
+            "recurring_transactions", self.recurring_manager.list_transactions, "transaction_id"
+        )
 
     def get_due_recurring_transactions(self) -> List[Dict[str, Any]]:
         """
@@ -2537,40 +3268,46 @@ class Wallet:
             A list of recurring transaction data that are due.
         """
         transactions = self.recurring_manager.get_due_transactions()
-        return [transaction.to_dict() for transaction in transactions]
+        return [
+            self._to_dict_cached("recurring_transactions", transaction.transaction_id, transaction)
+            for transaction in transactions
+        ]
 
-    def enable_recurring_transaction(self, transaction_id: str) -> Dict[str, Any]:
+    def _set_recurring_transaction_enabled(self, transaction_id: str, enabled: bool) -> RecurringTransaction:
         """
-        Enable a recurring transaction.
+        Enable or disable a recurring transaction and persist the change.
 
         Args:
-            transaction_id: The ID of the transaction to enable.
+            transaction_id: The ID of the transaction.
+            enabled: Whether the transaction should be enabled.
 
         Returns:
-            The updated recurring transaction data.
+            The updated recurring transaction.
 
         Raises:
             ValueError: If the transaction is not found.
         """
-        # Enable recurring transaction
-        transaction = self.recurring_manager.enable_transaction(transaction_id)
+        # Enable or disable recurring transaction
+        if enabled:
+            transaction = self.recurring_manager.enable_transaction(transaction_id)
+        else:
+            transaction = self.recurring_manager.disable_transaction(transaction_id)
 
         # Update wallet data
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+        self._store_wallet_entry("recurring_transactions", "transactions", transaction_id, transaction)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
-        logger.info(f"Enabled recurring transaction {transaction_id}")
-        return transaction.to_dict()
+        logger.info(f"{'Enabled' if enabled else 'Disabled'} recurring transaction {transaction_id}")
+        return transaction
 
-    def disable_recurring_transaction(self, transaction_id: str) -> Dict[str, Any]:
+    def enable_recurring_transaction(self, transaction_id: str) -> Dict[str, Any]:
         """
-        Disable a recurring transaction.
+        Enable a recurring transaction.
 
         Args:
-            transaction_id: The ID of the transaction to disable.
+            transaction_id: The ID of the transaction to enable.
 
         Returns:
             The updated recurring transaction data.
@@ -2578,25 +3315,36 @@ class Wallet:
         Raises:
             ValueError: If the transaction is not found.
         """
-        # Disable recurring transaction
-        transaction = self.recurring_manager.disable_transaction(transaction_id)
+        transaction = self._set_recurring_transaction_enabled(transaction_id, True)
+        return self._to_dict_cached("recurring_transactions", transaction_id, transaction)
 
-        # Update wallet data
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+    def disable_recurring_transaction(self, transaction_id: str) -> Dict[str, Any]:
+        """
+        Disable a recurring transaction.
+
+        Args:
+            transaction_id: The ID of the transaction to disable.
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        Returns:
+            The updated recurring transaction data.
 
-        logger.info(f"Disabled recurring transaction {transaction_id}")
-        return transaction.to_dict()
+        Raises:
+            ValueError: If the transaction is not found.
+        """
+        transaction = self._set_recurring_transaction_enabled(transaction_id, False)
+        return self._to_dict_cached("recurring_transactions", transaction_id, transaction)
 
-    async def execute_recurring_transaction(self, transaction_id: str) -> Dict[str, Any]:
+    async def execute_recurring_transaction(
+        self,
+        transaction_id: str,
+        nonce: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Execute a recurring transaction.
 
         Args:
             transaction_id: The ID of the transaction to execute.
+            nonce: Optional nonce for the transaction (default: calculated automatically).
 
         Returns:
             The execution response.
@@ -2614,55 +3362,100 @@ class Wallet:
             raise ValueError(f"Transaction {transaction_id} is disabled")
 
         # Execute transaction
-        response = await self.send_transaction(
+        response = await self.send(
             recipient=transaction.recipient,
             amount=transaction.amount,
             fee=transaction.fee,
-            memo=transaction.memo
+            memo=transaction.memo,
+            nonce=nonce
         )
 
         # Mark transaction as executed
         self.recurring_manager.mark_executed(transaction_id)
 
         # Update wallet data
-        self.wallet_data["recurring_transactions"] = self.recurring_manager.to_dict()
+        self._store_wallet_entry("recurring_transactions", "transactions", transaction_id, transaction)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Executed recurring transaction {transaction_id}")
         return response
 
+    async def _execute_due_transaction(self, transaction_id: str, nonce: int) -> Dict[str, Any]:
+        """
+        Execute a due recurring transaction and report the outcome.
+
+        Args:
+            transaction_id: The ID of the transaction to execute.
+            nonce: The nonce reserved for the transaction.
+
+        Returns:
+            A dictionary describing whether the execution succeeded.
+        """
+        try:
+            response = await self.execute_recurring_transaction(transaction_id, nonce)
+            return {
+                "transaction_id": transaction_id,
+                "success": True,
+                "response": response
+            }
+        except Exception as e:
+            logger.error(f"Error executing recurring transaction {transaction_id}: {e}")
+            return {
+                "transaction_id": transaction_id,
+                "success": False,
+                "error": str(e)
+            }
+
     async def execute_due_transactions(self) -> List[Dict[str, Any]]:
         """
         Execute all recurring transactions that are due.
 
+        The transactions are submitted concurrently, so the total time is
+        bounded by the slowest submission rather than the sum of all of them.
+        Their auto-saves are coalesced by the save timer. A call made while
+        an earlier one is still running returns an empty list, so no
+        transaction is sent twice.
+
         Returns:
             A list of execution responses.
         """
-        # Get due transactions
-        due_transactions = self.recurring_manager.get_due_transactions()
+        # An overlapping run would see the same queued transactions and send them twice
+        if self._executing_due_transactions:
+            logger.info("Due recurring transactions are already being executed")
+            return []
 
-        # Execute each transaction
-        responses = []
-        for transaction in due_transactions:
-            try:
-                response = await self.execute_recurring_transaction(transaction.transaction_id)
-                responses.append({
-                    "transaction_id": transaction.transaction_id,
-                    "success": True,
-                    "response": response
-                })
-            except Exception as e:
-                logger.error(f"Error executing recurring transaction {transaction.transaction_id}: {e}")
-                responses.append({
-                    "transaction_id": transaction.transaction_id,
-                    "success": False,
-                    "error": str(e)
-                })
+        self._executing_due_transactions = True
+        try:
+            # Get due transactions
+            due_transactions = self.recurring_manager.get_due_transactions()
+
+            # Reserve a distinct nonce for each transaction up front, then execute them concurrently
+            responses = await asyncio.gather(*[
+                self._execute_due_transaction(transaction.transaction_id, self._reserve_nonce())
+                for transaction in due_transactions
+            ])
+        finally:
+            self._executing_due_transactions = False
+
+        return list(responses)
+
+    def _reserve_nonce(self) -> int:
+        """
+        Reserve the next transaction nonce for this wallet.
 
-        return responses
+        Nonces are timestamp-based, like those chosen by the transaction
+        builder, but never repeat: a counter hands out the current time in
+        milliseconds, or one more than the last nonce if that is later.
+
+        Returns:
+            The reserved nonce.
+        """
+        self._next_nonce = max(self._next_nonce, int(time.time() * 1000))
+        nonce = self._next_nonce
+        self._next_nonce += 1
+        return nonce
 
     def add_tag_to_transaction_label(self, transaction_id: str, tag: str) -> Dict[str, Any]:
         """
@@ -2682,14 +3475,13 @@ class Wallet:
         transaction_label = self.label_manager.add_tag_to_label(transaction_id, tag)
 
         # Update wallet data
-        self.wallet_data["transaction_labels"] = self.label_manager.to_dict()
+        self._store_transaction_label(transaction_id)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Added tag '{tag}' to transaction {transaction_id}")
-        return transaction_label.to_dict()
+        return self._to_dict_cached("transaction_labels", transaction_id, transaction_label)
 
     def remove_tag_from_transaction_label(self, transaction_id: str, tag: str) -> Dict[str, Any]:
         """
@@ -2709,14 +3501,13 @@ class Wallet:
         transaction_label = self.label_manager.remove_tag_from_label(transaction_id, tag)
 
         # Update wallet data
-        self.wallet_data["transaction_labels"] = self.label_manager.to_dict()
+        self._store_transaction_label(transaction_id)
 
-        # Save wallet if auto_save is enabled
-        if self.auto_save and self.wallet_password:
-            self.save_wallet(self.wallet_password)
+        # Schedule an auto-save if enabled
+        self._schedule_save()
 
         logger.info(f"Removed tag '{tag}' from transaction {transaction_id}")
-        return transaction_label.to_dict()
+        return self._to_dict_cached("transaction_labels", transaction_id, transaction_label)
 
     # QR Code Methods
 
@@ -2747,16 +3538,7 @@ class Wallet:
         if not self.address:
             raise ValueError("No wallet loaded")
 
-        payment_request = PaymentRequest(
-            address=self.address,
-            amount=amount,
-            memo=memo,
-            label=label,
-            expires=expires,
-            request_id=request_id
-        )
-
-        return QRCodeGenerator.generate_payment_request_data(payment_request)
+        return _payment_qr_data(self.address, amount, memo, label, expires, request_id)
 
     def generate_contact_qr_code(
         self,
@@ -2778,13 +3560,7 @@ class Wallet:
         if not contact:
             raise ValueError(f"Contact not found: {contact_name}")
 
-        return QRCodeGenerator.generate_contact_card_data(
-            name=contact.name,
-            address=contact.address,
-            email=contact.email,
-            phone=contact.phone,
-            notes=contact.description
-        )
+        return _contact_qr_data(contact.name, contact.address, contact.email, contact.phone, contact.description)
 
     def init_qr_scanner(self) -> bool:
         """
@@ -2800,13 +3576,25 @@ class Wallet:
             logger.error(f"Error initializing QR code scanner: {e}")
             return False
 
-    def scan_qr_code_from_camera(self, camera_index: int = 0, timeout: int = 30) -> Optional[Dict[str, Any]]:
+    async def scan_qr_code_from_camera(
+        self,
+        camera_index: int = 0,
+        timeout: int = 30,
+        max_dimension: Optional[int] = MAX_FRAME_DIMENSION,
+        show_preview: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Scan a QR code from the camera.
 
+        The capture and decode loop runs in a worker thread, so the event
+        loop stays responsive for the whole scan.
+
         Args:
             camera_index: Camera index (default: 0)
             timeout: Timeout in seconds (default: 30)
+            max_dimension: Longest frame side to decode at; larger frames are
+                           downscaled, None decodes at full size (default: 1024)
+            show_preview: Show the camera frames in a window (default: False)
 
         Returns:
             Parsed QR code data, or None if no QR code was scanned
@@ -2819,7 +3607,11 @@ class Wallet:
                 raise QRCodeError("QR code scanner not available")
 
         # Scan QR code
-        qr_data = self.qr_scanner.scan_from_camera(camera_index, timeout)
+        loop = asyncio.get_running_loop()
+        qr_data = await loop.run_in_executor(
+            None,
+            partial(self.qr_scanner.scan_from_camera, camera_index, timeout, max_dimension, show_preview)
+        )
         if not qr_data:
             return None
 
@@ -2864,18 +3656,14 @@ class Wallet:
         Raises:
             QRCodeError: If the QR code data is invalid or unsupported
         """
-        try:
-            # Parse QR code data
-            qr_type, data = QRCodeParser.parse_qr_data(qr_data)
+        # Parse QR code data; the parser already logs and raises QRCodeError
+        qr_type, data = QRCodeParser.parse_qr_data(qr_data)
 
-            # Return parsed data with type
-            return {
-                "type": qr_type.value,
-                "data": data
-            }
-        except Exception as e:
-            logger.error(f"Error processing QR code data: {e}")
-            raise QRCodeError(f"Error processing QR code data: {e}")
+        # Return parsed data with type
+        return {
+            "type": qr_type.value,
+            "data": data
+        }
 
     async def process_payment_request_qr_code(self, qr_data: str) -> Dict[str, Any]:
         """
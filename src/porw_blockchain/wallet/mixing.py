@@ -7,9 +7,12 @@ which enhance privacy by breaking the transaction graph.
 
 import os
 import uuid
+import hashlib
 import logging
 import json
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple, Set
 from datetime import datetime
 
@@ -22,6 +25,8 @@ from ..core.crypto_utils import (
     is_valid_address
 )
 from ..privacy.mixing import (
+    MixingCoordinator,
+    MixingSession,
     MixingParticipant,
     get_mixing_coordinator,
     DEFAULT_DENOMINATION,
@@ -31,6 +36,51 @@ from ..privacy.mixing import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Last formatted timestamp as (unix second, ISO 8601 string)
+_iso_timestamp_cache = (0, "")
+
+# Number of worker threads for participant cryptography
+CRYPTO_WORKERS = 4
+
+# Length of the truncated SHA-256 digest kept for each used output address
+OUTPUT_ADDRESS_DIGEST_SIZE = 16
+
+
+def _output_address_digest(output_address: str) -> bytes:
+    """
+    Compute the fixed-size digest used to track a used output address.
+    
+    Args:
+        output_address: The output address.
+        
+    Returns:
+        The truncated SHA-256 digest of the address.
+    """
+    return hashlib.sha256(output_address.encode()).digest()[:OUTPUT_ADDRESS_DIGEST_SIZE]
+
+
+def _now_iso() -> str:
+    """
+    Get the current local time as an ISO 8601 string with second precision.
+    
+    The formatted string is reused for all calls within the same second.
+    
+    Returns:
+        The current time in ISO 8601 format.
+    """
+    global _iso_timestamp_cache
+    now = int(time.time())
+    second, timestamp = _iso_timestamp_cache
+    if second != now:
+        timestamp = datetime.fromtimestamp(now).isoformat()
+        _iso_timestamp_cache = (now, timestamp)
+    return timestamp
+
 
 class MixingWallet:
     """
@@ -51,11 +101,35 @@ class MixingWallet:
         self.private_key = private_key
         self.address = address
         self.participants = {}  # {participant_id: MixingParticipant}
+        self._participants_by_session = {}  # {(session_id, participant_id): MixingParticipant}
+        self._session_participants = {}  # {session_id: [MixingParticipant]}
         self.sessions = {}  # {session_id: {participant_id, status, ...}}
-        self.output_addresses = set()  # Set of output addresses used in mixing
+        self.output_addresses = set()  # Set of digests of output addresses used in mixing
+        self._coordinator_key_pems = {}  # {session_id: coordinator public key PEM}
+        self._status_events = {}  # {session_id: asyncio.Event set on the next status change}
+        self._crypto_executor = ThreadPoolExecutor(max_workers=CRYPTO_WORKERS, thread_name_prefix="mixing-crypto")
+        self._coordinator = get_mixing_coordinator()
         
         logger.info(f"Initialized mixing wallet for {address}")
     
+    def _get_coordinator(self) -> MixingCoordinator:
+        """
+        Get the global mixing coordinator.
+        
+        stop_mixing_coordinator discards the global instance, so the handle
+        stored by the wallet is checked against it on every call. A replaced
+        coordinator is stored, and the keys cached for the old coordinator's
+        sessions are dropped.
+        
+        Returns:
+            The current global mixing coordinator.
+        """
+        coordinator = get_mixing_coordinator()
+        if coordinator is not self._coordinator:
+            self._coordinator = coordinator
+            self._coordinator_key_pems.clear()
+        return coordinator
+    
     async def create_mixing_session(
         self,
         denomination: float = DEFAULT_DENOMINATION,
@@ -76,7 +150,7 @@ class MixingWallet:
             The created mixing session data.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Create session
         session = coordinator.create_session(
@@ -86,21 +160,37 @@ class MixingWallet:
             fee_percent=fee_percent
         )
         
-        # Store session
-        self.sessions[session.session_id] = {
-            "session_id": session.session_id,
-            "denomination": denomination,
-            "min_participants": min_participants,
-            "max_participants": max_participants,
-            "fee_percent": fee_percent,
-            "status": session.status,
-            "created_at": session.created_at.isoformat(),
-            "expires_at": session.expires_at.isoformat(),
-            "participants": []
-        }
+        # Store session, reusing the serialized session for the summary
+        session_dict = session.to_dict()
+        self.sessions[session.session_id] = self._build_session_summary(session_dict, [])
+        session.add_status_listener(self._on_session_status_change)
         
         logger.info(f"Created mixing session {session.session_id}")
-        return session.to_dict()
+        return session_dict
+    
+    @staticmethod
+    def _build_session_summary(session_dict: Dict[str, Any], participants: List[str]) -> Dict[str, Any]:
+        """
+        Build the wallet's summary of a session from its serialized form.
+        
+        Args:
+            session_dict: The session data from MixingSession.to_dict().
+            participants: IDs of the wallet's participants in the session.
+            
+        Returns:
+            The session summary.
+        """
+        return {
+            "session_id": session_dict["session_id"],
+            "denomination": session_dict["denomination"],
+            "min_participants": session_dict["min_participants"],
+            "max_participants": session_dict["max_participants"],
+            "fee_percent": session_dict["fee_percent"],
+            "status": session_dict["status"],
+            "created_at": session_dict["created_at"],
+            "expires_at": session_dict["expires_at"],
+            "participants": participants
+        }
     
     async def join_mixing_session(
         self,
@@ -121,7 +211,7 @@ class MixingWallet:
             ValueError: If the session is not found or cannot be joined.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get session
         session = coordinator.get_session(session_id)
@@ -139,58 +229,62 @@ class MixingWallet:
             output_address = f"mix_{uuid.uuid4().hex}"
         
         # Check if output address is already used
-        if output_address in self.output_addresses:
+        output_address_digest = _output_address_digest(output_address)
+        if output_address_digest in self.output_addresses:
             raise ValueError(f"Output address {output_address} is already used in another mixing session")
         
-        # Create participant
-        participant = MixingParticipant(
-            private_key=self.private_key,
-            input_address=self.address,
-            output_address=output_address
-        )
-        
-        # Create blinded output
-        coordinator_public_key_pem = serialize_public_key(session.coordinator_public_key)
-        blinded_output = participant.create_blinded_output(coordinator_public_key_pem)
-        
-        # Create proof of funds
-        proof_of_funds = participant.create_proof_of_funds()
-        
-        # Register participant
-        success = session.register_participant(
-            participant_id=participant.participant_id,
-            input_address=self.address,
-            output_address=output_address,
-            blinded_output=blinded_output,
-            proof_of_funds=proof_of_funds
-        )
-        
-        if not success:
-            raise ValueError(f"Failed to register participant in session {session_id}")
+        # Reserve the output address before awaiting, so a concurrent join cannot reuse it
+        self.output_addresses.add(output_address_digest)
+        try:
+            # Create participant
+            participant = MixingParticipant(
+                private_key=self.private_key,
+                input_address=self.address,
+                output_address=output_address
+            )
+            
+            # Create blinded output and proof of funds concurrently
+            coordinator_public_key_pem = self._get_coordinator_public_key_pem(session)
+            loop = asyncio.get_running_loop()
+            blinded_output, proof_of_funds = await asyncio.gather(
+                loop.run_in_executor(self._crypto_executor, participant.create_blinded_output, coordinator_public_key_pem),
+                loop.run_in_executor(self._crypto_executor, participant.create_proof_of_funds)
+            )
+            
+            # Register participant
+            success = session.register_participant(
+                participant_id=participant.participant_id,
+                input_address=self.address,
+                output_address=output_address,
+                blinded_output=blinded_output,
+                proof_of_funds=proof_of_funds
+            )
+            
+            if not success:
+                raise ValueError(f"Failed to register participant in session {session_id}")
+        except BaseException:
+            # Release the reservation if the participant could not be registered
+            self.output_addresses.discard(output_address_digest)
+            raise
         
         # Store participant
         self.participants[participant.participant_id] = participant
+        self._participants_by_session[(session_id, participant.participant_id)] = participant
+        self._session_participants.setdefault(session_id, []).append(participant)
         participant.session_id = session_id
         
-        # Add output address to used set
-        self.output_addresses.add(output_address)
+        # Follow status changes of the session
+        session.add_status_listener(self._on_session_status_change)
         
         # Update session data
         if session_id in self.sessions:
             self.sessions[session_id]["participants"].append(participant.participant_id)
             self.sessions[session_id]["status"] = session.status
         else:
-            self.sessions[session_id] = {
-                "session_id": session_id,
-                "denomination": session.denomination,
-                "min_participants": session.min_participants,
-                "max_participants": session.max_participants,
-                "fee_percent": session.fee_percent,
-                "status": session.status,
-                "created_at": session.created_at.isoformat(),
-                "expires_at": session.expires_at.isoformat(),
-                "participants": [participant.participant_id]
-            }
+            self.sessions[session_id] = self._build_session_summary(
+                session.to_dict(),
+                [participant.participant_id]
+            )
         
         logger.info(f"Joined mixing session {session_id} as participant {participant.participant_id}")
         
@@ -216,39 +310,34 @@ class MixingWallet:
             participant_id: The participant ID.
             
         Returns:
-            The blind signature data.
+            The blind signature data, with the signatures as raw bytes.
             
         Raises:
             ValueError: If the session or participant is not found.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get session
         session = coordinator.get_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        # Check if participant exists
-        if participant_id not in self.participants:
-            raise ValueError(f"Participant {participant_id} not found")
-        
         # Get participant
-        participant = self.participants[participant_id]
-        
-        # Check if participant is in the right session
-        if participant.session_id != session_id:
-            raise ValueError(f"Participant {participant_id} is not in session {session_id}")
+        participant = self._get_session_participant(session_id, participant_id)
         
         # Get blind signature
         blind_signature = session.create_blind_signature(participant_id)
         
-        # Unblind signature
-        unblinded_signature = participant.unblind_signature(blind_signature)
-        
-        # Verify unblinded signature
-        coordinator_public_key_pem = serialize_public_key(session.coordinator_public_key)
-        is_valid = participant.verify_unblinded_signature(coordinator_public_key_pem)
+        # Unblind and verify signature on the crypto executor; the session stays on the event loop
+        loop = asyncio.get_running_loop()
+        unblinded_signature = await loop.run_in_executor(
+            self._crypto_executor, participant.unblind_signature, blind_signature
+        )
+        coordinator_public_key_pem = self._get_coordinator_public_key_pem(session)
+        is_valid = await loop.run_in_executor(
+            self._crypto_executor, participant.verify_unblinded_signature, coordinator_public_key_pem
+        )
         
         if not is_valid:
             raise ValueError(f"Invalid unblinded signature for participant {participant_id}")
@@ -263,11 +352,51 @@ class MixingWallet:
         return {
             "participant_id": participant_id,
             "session_id": session_id,
-            "blind_signature": blind_signature.hex(),
-            "unblinded_signature": unblinded_signature.hex(),
+            "blind_signature": blind_signature,
+            "unblinded_signature": unblinded_signature,
             "is_valid": is_valid
         }
     
+    def _get_session_participant(self, session_id: str, participant_id: str) -> MixingParticipant:
+        """
+        Look up one of the wallet's participants in a session.
+        
+        Args:
+            session_id: The session ID.
+            participant_id: The participant ID.
+            
+        Returns:
+            The participant.
+            
+        Raises:
+            ValueError: If the participant is not found or is not in the session.
+        """
+        participant = self._participants_by_session.get((session_id, participant_id))
+        if participant is None:
+            if participant_id not in self.participants:
+                raise ValueError(f"Participant {participant_id} not found")
+            raise ValueError(f"Participant {participant_id} is not in session {session_id}")
+        return participant
+    
+    def _get_coordinator_public_key_pem(self, session: MixingSession) -> bytes:
+        """
+        Get the PEM encoding of a session's coordinator public key.
+        
+        The coordinator key is fixed for the lifetime of a session, so it is
+        serialized once and cached by session ID.
+        
+        Args:
+            session: The mixing session.
+            
+        Returns:
+            The PEM-encoded coordinator public key.
+        """
+        pem = self._coordinator_key_pems.get(session.session_id)
+        if pem is None:
+            pem = serialize_public_key(session.coordinator_public_key)
+            self._coordinator_key_pems[session.session_id] = pem
+        return pem
+    
     async def sign_coinjoin_transaction(
         self,
         session_id: str,
@@ -281,36 +410,108 @@ class MixingWallet:
             participant_id: The participant ID.
             
         Returns:
-            The signature data.
+            The signature data, with the signature as raw bytes.
+            
+        Raises:
+            ValueError: If the session or participant is not found.
+        """
+        session, participant = self._prepare_coinjoin_signing(session_id, participant_id)
+        
+        # Sign transaction
+        signature = participant.sign_transaction(session.coinjoin_transaction)
+        
+        return self._record_coinjoin_signature(session, participant_id, signature)
+    
+    async def sign_coinjoin_transactions_bulk(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Sign the CoinJoin transactions of several sessions concurrently.
+        
+        Every participant this wallet has in each of the given sessions signs
+        that session's transaction. The signing itself runs on the wallet's
+        crypto executor so the signatures are computed in parallel.
+        
+        Args:
+            session_ids: The IDs of the sessions to sign.
+            
+        Returns:
+            A list of signature data, one entry per signing participant,
+            with the signatures as raw bytes.
+            
+        Raises:
+            ValueError: If a session is not found.
+        """
+        # Resolve sessions and participants up front, on the event loop
+        signing_jobs = []
+        for session_id in session_ids:
+            for participant in self._session_participants.get(session_id, []):
+                signing_jobs.append(self._prepare_coinjoin_signing(session_id, participant.participant_id))
+        
+        # Sign all transactions concurrently
+        loop = asyncio.get_running_loop()
+        signatures = await asyncio.gather(*[
+            loop.run_in_executor(self._crypto_executor, participant.sign_transaction, session.coinjoin_transaction)
+            for session, participant in signing_jobs
+        ])
+        
+        # Add signatures to their sessions
+        return [
+            self._record_coinjoin_signature(session, participant.participant_id, signature)
+            for (session, participant), signature in zip(signing_jobs, signatures)
+        ]
+    
+    def _prepare_coinjoin_signing(
+        self,
+        session_id: str,
+        participant_id: str
+    ) -> Tuple[MixingSession, MixingParticipant]:
+        """
+        Look up a session and participant for signing, creating the CoinJoin transaction if needed.
+        
+        Args:
+            session_id: The session ID.
+            participant_id: The participant ID.
+            
+        Returns:
+            A tuple containing the session and the participant.
             
         Raises:
             ValueError: If the session or participant is not found.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get session
         session = coordinator.get_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        # Check if participant exists
-        if participant_id not in self.participants:
-            raise ValueError(f"Participant {participant_id} not found")
-        
         # Get participant
-        participant = self.participants[participant_id]
-        
-        # Check if participant is in the right session
-        if participant.session_id != session_id:
-            raise ValueError(f"Participant {participant_id} is not in session {session_id}")
+        participant = self._get_session_participant(session_id, participant_id)
         
         # Create CoinJoin transaction if not already created
         if not session.coinjoin_transaction:
             session.create_coinjoin_transaction()
         
-        # Sign transaction
-        signature = participant.sign_transaction(session.coinjoin_transaction)
+        return session, participant
+    
+    def _record_coinjoin_signature(
+        self,
+        session: MixingSession,
+        participant_id: str,
+        signature: bytes
+    ) -> Dict[str, Any]:
+        """
+        Add a participant's CoinJoin signature to its session.
+        
+        Args:
+            session: The mixing session.
+            participant_id: The participant ID.
+            signature: The participant's signature.
+            
+        Returns:
+            The signature data, with the signature as raw bytes.
+        """
+        session_id = session.session_id
         
         # Add signature to session
         session.add_transaction_signature(participant_id, signature)
@@ -325,7 +526,7 @@ class MixingWallet:
         return {
             "participant_id": participant_id,
             "session_id": session_id,
-            "signature": signature.hex(),
+            "signature": signature,
             "status": session.status
         }
     
@@ -343,7 +544,7 @@ class MixingWallet:
             ValueError: If the session is not found or not completed.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get session
         session = coordinator.get_session(session_id)
@@ -380,7 +581,7 @@ class MixingWallet:
             ValueError: If the session is not found.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get session
         session = coordinator.get_session(session_id)
@@ -394,6 +595,69 @@ class MixingWallet:
         # Return session data
         return session.to_dict()
     
+    async def wait_for_status(
+        self,
+        session_id: str,
+        status: str,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait until a mixing session reaches a status.
+        
+        The wait is driven by the session's status change notifications
+        instead of polling get_session_status.
+        
+        Args:
+            session_id: The session ID.
+            status: The status to wait for.
+            timeout: Maximum time to wait in seconds (default: no limit).
+            
+        Returns:
+            The session status data.
+            
+        Raises:
+            ValueError: If the session is not found or fails before reaching the status.
+            asyncio.TimeoutError: If the status is not reached within the timeout.
+        """
+        # Get mixing coordinator
+        coordinator = self._get_coordinator()
+        
+        # Get session
+        session = coordinator.get_session(session_id)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+        
+        session.add_status_listener(self._on_session_status_change)
+        
+        async def wait() -> None:
+            while session.status != status:
+                if session.status == "failed":
+                    raise ValueError(f"Session {session_id} failed before reaching {status} state")
+                event = self._status_events.setdefault(session_id, asyncio.Event())
+                await event.wait()
+        
+        await asyncio.wait_for(wait(), timeout)
+        
+        # Return session data
+        return session.to_dict()
+    
+    def _on_session_status_change(self, session_id: str, status: str) -> None:
+        """
+        Record a session status change and wake up tasks waiting on it.
+        
+        Args:
+            session_id: The session ID.
+            status: The new session status.
+        """
+        # Update session data
+        if session_id in self.sessions:
+            self.sessions[session_id]["status"] = status
+        
+        # Wake up waiters; they re-arm a fresh event if they keep waiting
+        event = self._status_events.pop(session_id, None)
+        if event is not None:
+            event.set()
+    
     async def get_active_sessions(self) -> List[Dict[str, Any]]:
         """
         Get all active mixing sessions.
@@ -402,7 +666,7 @@ class MixingWallet:
             A list of active session data.
         """
         # Get mixing coordinator
-        coordinator = get_mixing_coordinator()
+        coordinator = self._get_coordinator()
         
         # Get active sessions
         active_sessions = coordinator.get_active_sessions()
@@ -410,6 +674,21 @@ class MixingWallet:
         # Return session data
         return [session.to_dict() for session in active_sessions]
     
+    async def get_active_sessions_json(self) -> bytes:
+        """
+        Get all active mixing sessions, encoded as a JSON array.
+        
+        Transports can send the bytes as-is instead of encoding the session
+        list themselves; orjson is used for the encoding when available.
+        
+        Returns:
+            The active session data as UTF-8 encoded JSON.
+        """
+        sessions = await self.get_active_sessions()
+        if orjson is not None:
+            return orjson.dumps(sessions)
+        return json.dumps(sessions).encode()
+    
     async def get_my_sessions(self) -> List[Dict[str, Any]]:
         """
         Get all mixing sessions the wallet is participating in.
@@ -432,10 +711,7 @@ class MixingWallet:
         """
         # Filter participants by session ID if provided
         if session_id:
-            participants = [
-                p for p in self.participants.values()
-                if p.session_id == session_id
-            ]
+            participants = self._session_participants.get(session_id, [])
         else:
             participants = list(self.participants.values())
         
@@ -476,5 +752,5 @@ class MixingWallet:
             "session_id": session_id,
             "transaction_id": "dummy_transaction_id",
             "status": "submitted",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
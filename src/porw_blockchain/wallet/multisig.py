@@ -11,17 +11,17 @@ import json
 import logging
 import os
 import time
+import uuid
 from typing import Dict, List, Optional, Any, Tuple, Set, Union
 
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.backends import default_backend
 
 from ..core.structures import Transaction
 from ..core.crypto_utils import (
+    ADDRESS_VERSION,
     CURVE,
+    base58check_encode,
     load_private_key_from_pem,
-    load_public_key_from_pem,
     serialize_private_key,
     serialize_public_key,
     get_address_from_pubkey,
@@ -30,9 +30,97 @@ from ..core.crypto_utils import (
     verify_signature
 )
 
+from .signing import EcdsaBackend, verify_batch
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Prefix of generated multisig wallet IDs
+WALLET_ID_PREFIX = "multisig_"
+
+
+def _signing_payload(transaction_data: Dict[str, Any]) -> bytes:
+    """
+    Build the canonical bytes signers sign for a multi-signature transaction.
+    
+    Args:
+        transaction_data: The transaction data.
+        
+    Returns:
+        The sorted-key JSON encoding of the transaction without its signatures.
+    """
+    signing_data = {key: value for key, value in transaction_data.items() if key != "signatures"}
+    return json.dumps(signing_data, sort_keys=True).encode()
+
+
+def _count_valid_multisig_signatures(
+    digest: bytes,
+    signatures: Dict[str, str],
+    verified: Optional[Set[Tuple[str, str]]] = None,
+    threshold: Optional[int] = None,
+    parallel: bool = False
+) -> int:
+    """
+    Count the valid signatures on a multi-signature transaction.
+    
+    Args:
+        digest: The SHA-256 digest of the signed message.
+        signatures: Hex-encoded signatures keyed by the signer's PEM public key.
+        verified: (public_key, signature_hex) pairs already known to be valid; newly
+                  verified pairs are added to it (optional).
+        threshold: Stop verifying once this many signatures are valid (default: verify all).
+        parallel: Whether large batches may be verified on a thread pool (default: False).
+        
+    Returns:
+        The number of valid signatures found.
+    """
+    if verified is None:
+        verified = set()
+    
+    # Signatures verified on an earlier call count without verifying them again
+    valid_signatures = sum(1 for item in signatures.items() if item in verified)
+    unverified = {
+        public_key: signature_hex
+        for public_key, signature_hex in signatures.items()
+        if (public_key, signature_hex) not in verified
+    }
+    if not unverified:
+        return valid_signatures
+    batch = _signature_batch(digest, unverified)
+    
+    # Verify only as many new signatures as are still needed to reach the threshold
+    while batch and (threshold is None or valid_signatures < threshold):
+        take = len(batch) if threshold is None else threshold - valid_signatures
+        chunk, batch = batch[:take], batch[take:]
+        for (_, _, public_key), is_valid in zip(chunk, verify_batch(chunk, prehashed=True, parallel=parallel)):
+            if is_valid:
+                verified.add((public_key, unverified[public_key]))
+                valid_signatures += 1
+    
+    return valid_signatures
+
+
+def _signature_batch(digest: bytes, signatures: Dict[str, str]) -> List[Tuple[bytes, bytes, str]]:
+    """
+    Build a verification batch for the signatures on a multi-signature transaction.
+    
+    Every signer signs the same message, so its digest is shared by the whole batch.
+    
+    Args:
+        digest: The SHA-256 digest of the signed message.
+        signatures: Hex-encoded signatures keyed by the signer's PEM public key.
+        
+    Returns:
+        A list of (digest, signature, public_key_pem) tuples.
+    """
+    batch = []
+    for public_key, signature_hex in signatures.items():
+        try:
+            batch.append((digest, bytes.fromhex(signature_hex), public_key))
+        except ValueError as e:
+            logger.warning(f"Invalid signature from {public_key}: {e}")
+    return batch
+
 
 class MultiSigWallet:
     """
@@ -42,6 +130,13 @@ class MultiSigWallet:
     wallets, which require multiple signatures to authorize transactions.
     """
     
+    __slots__ = (
+        "wallet_id", "required_signatures", "total_signers", "private_key", "public_keys",
+        "address", "description", "creation_time", "pending_transactions",
+        "_public_key_set", "_dict_view", "_signer", "_verified_signatures",
+        "_transaction_versions", "_signing_digests"
+    )
+    
     def __init__(
         self,
         wallet_id: Optional[str] = None,
@@ -69,10 +164,16 @@ class MultiSigWallet:
         self.total_signers = total_signers
         self.private_key = private_key
         self.public_keys = public_keys or []
+        self._public_key_set: Set[str] = set(self.public_keys)
         self.address = address
         self.description = description or f"MultiSig Wallet ({required_signatures}-of-{total_signers})"
         self.creation_time = int(time.time())
         self.pending_transactions: Dict[str, Dict[str, Any]] = {}
+        self._dict_view: Optional[Dict[str, Any]] = None
+        self._signer: Optional[Tuple[str, EcdsaBackend, str]] = None  # (private key PEM, backend, public key PEM)
+        self._verified_signatures: Dict[str, Tuple[bytes, Set[Tuple[str, str]]]] = {}  # {transaction_id: (payload digest, {(public_key, signature_hex)})}
+        self._transaction_versions: Dict[str, int] = {}  # {transaction_id: version}, bumped whenever the signed data changes
+        self._signing_digests: Dict[str, Tuple[int, bytes]] = {}  # {transaction_id: (version, payload digest)}
         
         # Generate address if not provided and we have all public keys
         if not self.address and len(self.public_keys) == self.total_signers:
@@ -87,8 +188,7 @@ class MultiSigWallet:
         Returns:
             A unique wallet ID.
         """
-        import uuid
-        return f"multisig_{uuid.uuid4().hex[:8]}"
+        return f"{WALLET_ID_PREFIX}{uuid.uuid4().hex[:8]}"
     
     def _generate_multisig_address(self) -> str:
         """
@@ -117,7 +217,6 @@ class MultiSigWallet:
         multisig_hash = hashlib.sha256(multisig_str.encode()).digest()
         
         # Create address with a multisig prefix
-        from ..core.crypto_utils import base58check_encode, ADDRESS_VERSION
         address = base58check_encode(ADDRESS_VERSION, multisig_hash[:20])
         
         # Add a multisig prefix
@@ -126,6 +225,18 @@ class MultiSigWallet:
         logger.debug(f"Generated multisig address: {multisig_address}")
         return multisig_address
     
+    def has_public_key(self, public_key: str) -> bool:
+        """
+        Check whether a public key belongs to one of the wallet's signers.
+        
+        Args:
+            public_key: The public key to check.
+            
+        Returns:
+            True if the public key is one of the wallet's public keys, False otherwise.
+        """
+        return public_key in self._public_key_set
+    
     def add_public_key(self, public_key: str) -> None:
         """
         Add a public key to the multi-signature wallet.
@@ -139,13 +250,15 @@ class MultiSigWallet:
         if len(self.public_keys) >= self.total_signers:
             raise ValueError(f"Wallet already has {self.total_signers} public keys")
         
-        if public_key not in self.public_keys:
+        if public_key not in self._public_key_set:
             self.public_keys.append(public_key)
+            self._public_key_set.add(public_key)
             logger.debug(f"Added public key to multisig wallet {self.wallet_id}")
             
             # Generate address if we now have all public keys
             if len(self.public_keys) == self.total_signers and not self.address:
                 self.address = self._generate_multisig_address()
+                self._refresh_dict_view()
     
     def create_transaction(
         self,
@@ -201,10 +314,123 @@ class MultiSigWallet:
         
         # Store in pending transactions
         self.pending_transactions[tx_hash] = transaction_data
+        self._touch_transaction(tx_hash)
         
         logger.info(f"Created multisig transaction {tx_hash} to {recipient} for {amount}")
         return transaction_data
     
+    def update_transaction(self, transaction_id: str, **changes: Any) -> Dict[str, Any]:
+        """
+        Update the fields of a pending multi-signature transaction.
+        
+        Pending transaction data must be changed through this method, so the
+        cached signing digest is recomputed. Signatures collected before the
+        change no longer verify against the updated data.
+        
+        Args:
+            transaction_id: The ID of the transaction to update.
+            **changes: The transaction fields to set.
+            
+        Returns:
+            The updated transaction data.
+            
+        Raises:
+            ValueError: If the transaction is not found or a field cannot be changed.
+        """
+        if transaction_id not in self.pending_transactions:
+            raise ValueError(f"Transaction {transaction_id} not found in pending transactions")
+        
+        if "signatures" in changes or "transaction_id" in changes:
+            raise ValueError("Signatures and transaction ID of a pending transaction cannot be changed")
+        
+        # Update transaction data
+        transaction_data = self.pending_transactions[transaction_id]
+        transaction_data.update(changes)
+        self._touch_transaction(transaction_id)
+        
+        logger.info(f"Updated multisig transaction {transaction_id}")
+        return transaction_data
+    
+    def _touch_transaction(self, transaction_id: str) -> None:
+        """
+        Record that the signed data of a pending transaction has changed.
+        
+        Args:
+            transaction_id: The ID of the pending transaction.
+        """
+        self._transaction_versions[transaction_id] = self._transaction_versions.get(transaction_id, 0) + 1
+    
+    def _get_signing_digest(self, transaction_id: str) -> bytes:
+        """
+        Get the SHA-256 digest of a pending transaction's signing payload.
+        
+        The payload is encoded and hashed once per version of the transaction,
+        and the digest is reused for every signature and verification until
+        a mutator bumps the version.
+        
+        Args:
+            transaction_id: The ID of the pending transaction.
+            
+        Returns:
+            The digest signed by each signer.
+        """
+        version = self._transaction_versions.get(transaction_id, 0)
+        entry = self._signing_digests.get(transaction_id)
+        if entry is None or entry[0] != version:
+            digest = hashlib.sha256(_signing_payload(self.pending_transactions[transaction_id])).digest()
+            entry = self._signing_digests[transaction_id] = (version, digest)
+        return entry[1]
+    
+    def _get_verified_signatures(self, transaction_id: str, digest: bytes) -> Set[Tuple[str, str]]:
+        """
+        Get the signatures of a pending transaction already known to be valid.
+        
+        The set is tied to the signing digest it was verified against, and is
+        discarded if the transaction data has changed since.
+        
+        Args:
+            transaction_id: The ID of the pending transaction.
+            digest: The transaction's current signing digest.
+            
+        Returns:
+            The (public_key, signature_hex) pairs verified against this digest.
+        """
+        entry = self._verified_signatures.get(transaction_id)
+        if entry is None or entry[0] != digest:
+            entry = self._verified_signatures[transaction_id] = (digest, set())
+        return entry[1]
+    
+    def _get_signer(self) -> Tuple[EcdsaBackend, str]:
+        """
+        Get the signing backend and public key for the user's private key.
+        
+        The private key PEM is parsed once and the result reused for every
+        signature until the private key changes.
+        
+        Returns:
+            A tuple containing the signing backend and the PEM-encoded public key.
+        """
+        if self._signer is None or self._signer[0] != self.private_key:
+            private_key_obj = load_private_key_from_pem(self.private_key.encode())
+            public_key = serialize_public_key(private_key_obj.public_key()).decode()
+            self._signer = (self.private_key, EcdsaBackend(private_key=private_key_obj), public_key)
+        return self._signer[1], self._signer[2]
+    
+    def get_signer_public_key(self) -> str:
+        """
+        Get the public key matching the user's private key.
+        
+        Returns:
+            The PEM-encoded public key.
+            
+        Raises:
+            ValueError: If the user's private key is not set.
+        """
+        if not self.private_key:
+            raise ValueError("Private key not set. Cannot derive public key.")
+        
+        return self._get_signer()[1]
+    
     def sign_transaction(self, transaction_id: str) -> Dict[str, Any]:
         """
         Sign a pending multi-signature transaction.
@@ -227,25 +453,17 @@ class MultiSigWallet:
         # Get transaction data
         transaction_data = self.pending_transactions[transaction_id]
         
-        # Create message to sign (transaction data without signatures)
-        signing_data = transaction_data.copy()
-        signing_data.pop("signatures", None)
-        message = json.dumps(signing_data, sort_keys=True)
-        
-        # Load private key
-        private_key_obj = load_private_key_from_pem(self.private_key.encode())
-        
-        # Sign message
-        signature = private_key_obj.sign(
-            message.encode(),
-            ec.ECDSA(hashes.SHA256())
-        )
+        # Get digest to sign (transaction data without signatures)
+        digest = self._get_signing_digest(transaction_id)
         
-        # Get public key
-        public_key = serialize_public_key(private_key_obj.public_key()).decode()
+        # Sign digest with the cached signer
+        signer, public_key = self._get_signer()
+        signature = signer.sign_digest(digest)
         
-        # Add signature to transaction
-        transaction_data["signatures"][public_key] = signature.hex()
+        # Add signature to transaction; it was just produced, so it needs no verification
+        signature_hex = signature.hex()
+        transaction_data["signatures"][public_key] = signature_hex
+        self._get_verified_signatures(transaction_id, digest).add((public_key, signature_hex))
         
         # Update pending transaction
         self.pending_transactions[transaction_id] = transaction_data
@@ -269,35 +487,63 @@ class MultiSigWallet:
         if transaction_id not in self.pending_transactions:
             raise ValueError(f"Transaction {transaction_id} not found in pending transactions")
         
-        # Get transaction data
-        transaction_data = self.pending_transactions[transaction_id]
+        # Verify each signature against the message that was signed
+        valid_signatures = self._count_valid_signatures(transaction_id, parallel=True)
         
-        # Create message that was signed
-        signing_data = transaction_data.copy()
-        signing_data.pop("signatures", None)
-        message = json.dumps(signing_data, sort_keys=True)
-        
-        # Verify each signature
-        valid_signatures = 0
-        for public_key, signature_hex in transaction_data["signatures"].items():
-            try:
-                # Convert signature to bytes
-                signature = bytes.fromhex(signature_hex)
-                
-                # Load public key
-                public_key_obj = load_public_key_from_pem(public_key.encode())
-                
-                # Verify signature
-                public_key_obj.verify(
-                    signature,
-                    message.encode(),
-                    ec.ECDSA(hashes.SHA256())
-                )
-                
-                # Signature is valid
-                valid_signatures += 1
-            except Exception as e:
-                logger.warning(f"Invalid signature from {public_key}: {e}")
+        # Check if we have enough valid signatures
+        has_enough_signatures = valid_signatures >= self.required_signatures
+        
+        logger.info(f"Multisig transaction {transaction_id} has {valid_signatures}/{self.required_signatures} valid signatures")
+        return has_enough_signatures
+    
+    def _count_valid_signatures(
+        self,
+        transaction_id: str,
+        threshold: Optional[int] = None,
+        parallel: bool = False
+    ) -> int:
+        """
+        Count the valid signatures on a pending transaction.
+        
+        Signatures that were verified before are remembered per transaction,
+        so polling a transaction while it collects signatures only verifies
+        the newly added ones, as long as the signed data is unchanged.
+        
+        Args:
+            transaction_id: The ID of the pending transaction.
+            threshold: Stop verifying once this many signatures are valid (default: verify all).
+            parallel: Whether large batches may be verified on a thread pool (default: False).
+            
+        Returns:
+            The number of valid signatures found.
+        """
+        digest = self._get_signing_digest(transaction_id)
+        return _count_valid_multisig_signatures(
+            digest,
+            self.pending_transactions[transaction_id]["signatures"],
+            verified=self._get_verified_signatures(transaction_id, digest),
+            threshold=threshold,
+            parallel=parallel
+        )
+    
+    def verify_transaction_batch(self, transaction_id: str) -> bool:
+        """
+        Verify a multi-signature transaction, checking all signatures as one batch.
+        
+        Args:
+            transaction_id: The ID of the transaction to verify.
+            
+        Returns:
+            True if the transaction has enough valid signatures, False otherwise.
+            
+        Raises:
+            ValueError: If the transaction is not found.
+        """
+        if transaction_id not in self.pending_transactions:
+            raise ValueError(f"Transaction {transaction_id} not found in pending transactions")
+        
+        # Verify signatures until the required number is reached
+        valid_signatures = self._count_valid_signatures(transaction_id, threshold=self.required_signatures)
         
         # Check if we have enough valid signatures
         has_enough_signatures = valid_signatures >= self.required_signatures
@@ -305,6 +551,50 @@ class MultiSigWallet:
         logger.info(f"Multisig transaction {transaction_id} has {valid_signatures}/{self.required_signatures} valid signatures")
         return has_enough_signatures
     
+    def verify_all_pending(self) -> Dict[str, bool]:
+        """
+        Verify every pending transaction, checking all of their signatures as one batch.
+        
+        The signatures not yet verified on any pending transaction are gathered
+        into a single batch, so one pass over the verification thread pool
+        covers them all instead of one pass per transaction.
+        
+        Returns:
+            A dictionary mapping each pending transaction ID to True if it has
+            enough valid signatures, False otherwise.
+        """
+        # Gather the unverified signatures of all pending transactions
+        batch = []
+        owners = []
+        verified_by_transaction = {}
+        for transaction_id, transaction_data in self.pending_transactions.items():
+            digest = self._get_signing_digest(transaction_id)
+            verified = verified_by_transaction[transaction_id] = self._get_verified_signatures(transaction_id, digest)
+            unverified = {
+                public_key: signature_hex
+                for public_key, signature_hex in transaction_data["signatures"].items()
+                if (public_key, signature_hex) not in verified
+            }
+            for item in _signature_batch(digest, unverified):
+                batch.append(item)
+                owners.append((transaction_id, unverified[item[2]]))
+        
+        # Verify the whole batch and remember the valid signatures per transaction
+        for (_, _, public_key), (transaction_id, signature_hex), is_valid in zip(
+            batch, owners, verify_batch(batch, prehashed=True, parallel=True)
+        ):
+            if is_valid:
+                verified_by_transaction[transaction_id].add((public_key, signature_hex))
+        
+        results = {}
+        for transaction_id, transaction_data in self.pending_transactions.items():
+            verified = verified_by_transaction[transaction_id]
+            valid_signatures = sum(1 for item in transaction_data["signatures"].items() if item in verified)
+            results[transaction_id] = valid_signatures >= self.required_signatures
+        
+        logger.info(f"Verified {len(batch)} signatures across {len(results)} pending multisig transactions")
+        return results
+    
     def finalize_transaction(self, transaction_id: str) -> Transaction:
         """
         Finalize a multi-signature transaction that has enough valid signatures.
@@ -318,6 +608,10 @@ class MultiSigWallet:
         Raises:
             ValueError: If the transaction is not found or doesn't have enough valid signatures.
         """
+        # Re-encode the payload once, so data edited in place is never finalized with signatures over other data
+        if transaction_id in self.pending_transactions:
+            self._touch_transaction(transaction_id)
+        
         if not self.verify_transaction(transaction_id):
             raise ValueError(f"Transaction {transaction_id} doesn't have enough valid signatures")
         
@@ -333,18 +627,19 @@ class MultiSigWallet:
             timestamp=transaction_data["timestamp"],
             memo=transaction_data["memo"],
             transaction_id=transaction_id,
-            is_memo_encrypted=False  # Assuming memo is not encrypted
+            is_memo_encrypted=False,  # Assuming memo is not encrypted
+            multisig_data={
+                "required_signatures": self.required_signatures,
+                "total_signers": self.total_signers,
+                "signatures": transaction_data["signatures"]
+            }
         )
         
-        # Add multisig data to transaction
-        transaction.multisig_data = {
-            "required_signatures": self.required_signatures,
-            "total_signers": self.total_signers,
-            "signatures": transaction_data["signatures"]
-        }
-        
         # Remove from pending transactions
         self.pending_transactions.pop(transaction_id)
+        self._verified_signatures.pop(transaction_id, None)
+        self._transaction_versions.pop(transaction_id, None)
+        self._signing_digests.pop(transaction_id, None)
         
         logger.info(f"Finalized multisig transaction {transaction_id}")
         return transaction
@@ -367,6 +662,26 @@ class MultiSigWallet:
             "pending_transactions": self.pending_transactions
         }
     
+    def dict_view(self) -> Dict[str, Any]:
+        """
+        Get a live dictionary view of the multi-signature wallet.
+        
+        Unlike to_dict(), the same dictionary is returned on every call. It shares
+        the public key list and pending transactions with the wallet, so signing
+        and creating transactions keep it current without rebuilding it.
+        
+        Returns:
+            A dictionary representation of the wallet.
+        """
+        if self._dict_view is None:
+            self._dict_view = self.to_dict()
+        return self._dict_view
+    
+    def _refresh_dict_view(self) -> None:
+        """Update the scalar fields of the dictionary view after they change."""
+        if self._dict_view is not None:
+            self._dict_view.update(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any], private_key: Optional[str] = None) -> 'MultiSigWallet':
         """
@@ -435,10 +750,9 @@ def create_multisig_wallet(
     
     # Add user's public key if not already in the list
     if private_key:
-        private_key_obj = load_private_key_from_pem(private_key.encode())
-        public_key = serialize_public_key(private_key_obj.public_key()).decode()
+        public_key = wallet.get_signer_public_key()
         
-        if public_key not in wallet.public_keys:
+        if not wallet.has_public_key(public_key):
             wallet.add_public_key(public_key)
     
     logger.info(f"Created new multisig wallet: {wallet.wallet_id} ({required_signatures}-of-{total_signers})")
@@ -463,10 +777,9 @@ def join_multisig_wallet(
     wallet = MultiSigWallet.from_dict(wallet_data, private_key)
     
     # Add user's public key if not already in the list
-    private_key_obj = load_private_key_from_pem(private_key.encode())
-    public_key = serialize_public_key(private_key_obj.public_key()).decode()
+    public_key = wallet.get_signer_public_key()
     
-    if public_key not in wallet.public_keys:
+    if not wallet.has_public_key(public_key):
         wallet.add_public_key(public_key)
     
     logger.info(f"Joined multisig wallet: {wallet.wallet_id}")
@@ -487,32 +800,9 @@ def verify_multisig_transaction(transaction: Dict[str, Any]) -> bool:
     required_signatures = transaction.get("required_signatures", 0)
     signatures = transaction.get("signatures", {})
     
-    # Create message that was signed
-    signing_data = transaction.copy()
-    signing_data.pop("signatures", None)
-    message = json.dumps(signing_data, sort_keys=True)
-    
-    # Verify each signature
-    valid_signatures = 0
-    for public_key, signature_hex in signatures.items():
-        try:
-            # Convert signature to bytes
-            signature = bytes.fromhex(signature_hex)
-            
-            # Load public key
-            public_key_obj = load_public_key_from_pem(public_key.encode())
-            
-            # Verify signature
-            public_key_obj.verify(
-                signature,
-                message.encode(),
-                ec.ECDSA(hashes.SHA256())
-            )
-            
-            # Signature is valid
-            valid_signatures += 1
-        except Exception as e:
-            logger.warning(f"Invalid signature from {public_key}: {e}")
+    # Verify each signature against the message that was signed
+    digest = hashlib.sha256(_signing_payload(transaction)).digest()
+    valid_signatures = _count_valid_multisig_signatures(digest, signatures, parallel=True)
     
     # Check if we have enough valid signatures
     has_enough_signatures = valid_signatures >= required_signatures
@@ -8,18 +8,87 @@ for payment requests and other wallet operations.
 
 import json
 import logging
-import re
-import urllib.parse
+import queue
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
+from urllib.parse import quote_plus, unquote_plus
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class QRCodeType(Enum):
-    """Types of QR codes supported by the wallet."""
+# Largest frame side handed to the decoder; larger camera frames are downscaled first
+MAX_FRAME_DIMENSION = 1024
+
+# Pixel stride used when sampling a camera frame to detect repeated frames
+FRAME_SIGNATURE_STRIDE = 16
+
+# Side length of the canonical patch a located QR code is resized to before binarization
+QR_PATCH_SIZE = 200
+
+# Adaptive threshold neighbourhood for the patch; it must span more than a finder pattern's solid centre
+QR_PATCH_BLOCK_SIZE = 51
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """
+    Encode QR code data as compact JSON.
+
+    QR code capacity is limited, so no whitespace is emitted; orjson is used
+    for the encoding when available, falling back to json for data it
+    rejects, such as integers wider than 64 bits.
+
+    Args:
+        data: The data to encode
+
+    Returns:
+        JSON string
+
+    Raises:
+        QRCodeError: If the data cannot be encoded as JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+
+    try:
+        return json.dumps(data, separators=(",", ":"))
+    except (TypeError, ValueError) as e:
+        raise QRCodeError(f"Error encoding QR code data: {e}")
+
+
+# JSON decoder for QR code data; orjson errors subclass json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _is_porw_address(address: Optional[str]) -> bool:
+    """
+    Check that a string looks like a PoRW address.
+
+    Args:
+        address: The address to check
+
+    Returns:
+        True if the address is non-empty and has the "porw1" prefix
+    """
+    return bool(address) and address.startswith("porw1")
+
+
+class QRCodeType(str, Enum):
+    """
+    Types of QR codes supported by the wallet.
+
+    Members are strings, so they compare equal to, and serialize as, their values.
+    """
     PAYMENT_REQUEST = "payment"
     ADDRESS_ONLY = "address"
     CONTACT_CARD = "contact"
@@ -58,34 +127,35 @@ class QRCodeGenerator:
             QR code data string
         """
         # Validate address
-        if not payment_request.address or not payment_request.address.startswith("porw1"):
+        if not _is_porw_address(payment_request.address):
             raise QRCodeError("Invalid PoRW address")
 
         # Build URI
         uri = f"porw:{payment_request.address}"
-        params = {}
+
+        # Encode the fixed parameter set directly, quoting values as urlencode() would
+        params = []
 
         if payment_request.amount is not None:
             if payment_request.amount <= 0:
                 raise QRCodeError("Amount must be greater than 0")
-            params["amount"] = str(payment_request.amount)
+            params.append("amount=" + quote_plus(str(payment_request.amount), safe=""))
 
         if payment_request.memo:
-            params["memo"] = payment_request.memo
+            params.append("memo=" + quote_plus(payment_request.memo, safe=""))
 
         if payment_request.label:
-            params["label"] = payment_request.label
+            params.append("label=" + quote_plus(payment_request.label, safe=""))
 
         if payment_request.expires:
-            params["expires"] = str(payment_request.expires)
+            params.append("expires=" + quote_plus(str(payment_request.expires), safe=""))
 
         if payment_request.request_id:
-            params["request_id"] = payment_request.request_id
+            params.append("request_id=" + quote_plus(payment_request.request_id, safe=""))
 
         # Add parameters to URI if any
         if params:
-            query_string = urllib.parse.urlencode(params)
-            uri = f"{uri}?{query_string}"
+            uri = f"{uri}?{'&'.join(params)}"
 
         return uri
 
@@ -101,7 +171,7 @@ class QRCodeGenerator:
             QR code data string
         """
         # Validate address
-        if not address or not address.startswith("porw1"):
+        if not _is_porw_address(address):
             raise QRCodeError("Invalid PoRW address")
 
         return address
@@ -128,12 +198,12 @@ class QRCodeGenerator:
             QR code data string
         """
         # Validate address
-        if not address or not address.startswith("porw1"):
+        if not _is_porw_address(address):
             raise QRCodeError("Invalid PoRW address")
 
         # Create contact data
         contact_data = {
-            "type": QRCodeType.CONTACT_CARD.value,
+            "type": QRCodeType.CONTACT_CARD,
             "name": name,
             "address": address
         }
@@ -148,7 +218,7 @@ class QRCodeGenerator:
             contact_data["notes"] = notes
 
         # Convert to JSON
-        return json.dumps(contact_data)
+        return _json_dumps(contact_data)
 
     @staticmethod
     def generate_transaction_data(transaction: Dict[str, Any]) -> str:
@@ -167,12 +237,12 @@ class QRCodeGenerator:
 
         # Create transaction data
         tx_data = {
-            "type": QRCodeType.TRANSACTION.value,
+            "type": QRCodeType.TRANSACTION,
             "transaction": transaction
         }
 
         # Convert to JSON
-        return json.dumps(tx_data)
+        return _json_dumps(tx_data)
 
     @staticmethod
     def generate_wallet_connect_data(
@@ -195,7 +265,7 @@ class QRCodeGenerator:
         """
         # Create wallet connect data
         connect_data = {
-            "type": QRCodeType.WALLET_CONNECT.value,
+            "type": QRCodeType.WALLET_CONNECT,
             "url": node_url,
             "key": public_key,
             "chain": chain_id,
@@ -203,7 +273,7 @@ class QRCodeGenerator:
         }
 
         # Convert to JSON
-        return json.dumps(connect_data)
+        return _json_dumps(connect_data)
 
 
 class QRCodeParser:
@@ -224,27 +294,21 @@ class QRCodeParser:
             QRCodeError: If the QR code data is invalid or unsupported
         """
         try:
-            # Check if it's a PoRW URI
-            if qr_data.startswith("porw:"):
-                return QRCodeParser._parse_porw_uri(qr_data)
-
-            # Check if it's a plain address
-            if qr_data.startswith("porw1"):
-                return QRCodeType.ADDRESS_ONLY, {"address": qr_data}
-
-            # Try to parse as JSON
-            try:
-                data = json.loads(qr_data)
-                if isinstance(data, dict) and "type" in data:
-                    qr_type = data.get("type")
-                    if qr_type == QRCodeType.CONTACT_CARD.value:
-                        return QRCodeType.CONTACT_CARD, data
-                    elif qr_type == QRCodeType.TRANSACTION.value:
-                        return QRCodeType.TRANSACTION, data
-                    elif qr_type == QRCodeType.WALLET_CONNECT.value:
-                        return QRCodeType.WALLET_CONNECT, data
-            except json.JSONDecodeError:
-                pass
+            # Dispatch PoRW URIs and plain addresses on their scheme prefix
+            prefix_parser = _PREFIX_PARSERS.get(qr_data[:QR_PREFIX_LENGTH])
+            if prefix_parser is not None:
+                return prefix_parser(qr_data)
+
+            # Only JSON objects can carry a typed payload
+            if qr_data.lstrip().startswith("{"):
+                try:
+                    data = _json_loads(qr_data)
+                    if isinstance(data, dict):
+                        qr_type = _JSON_QR_TYPES.get(data.get("type"))
+                        if qr_type is not None:
+                            return qr_type, data
+                except json.JSONDecodeError:
+                    pass
 
             # Unsupported QR code
             raise QRCodeError("Unsupported QR code format")
@@ -252,6 +316,19 @@ class QRCodeParser:
             logger.error(f"Error parsing QR code data: {e}")
             raise QRCodeError(f"Error parsing QR code data: {e}")
 
+    @staticmethod
+    def _parse_address(address: str) -> Tuple[QRCodeType, Dict[str, Any]]:
+        """
+        Parse a plain PoRW address.
+
+        Args:
+            address: Address string
+
+        Returns:
+            Tuple containing the QR code type and parsed data
+        """
+        return QRCodeType.ADDRESS_ONLY, {"address": address}
+
     @staticmethod
     def _parse_porw_uri(uri: str) -> Tuple[QRCodeType, Dict[str, Any]]:
         """
@@ -266,18 +343,21 @@ class QRCodeParser:
         Raises:
             QRCodeError: If the URI is invalid
         """
-        # Parse URI
-        match = re.match(r"porw:([a-zA-Z0-9]+)(\?(.*))?", uri)
-        if not match:
+        # Split "porw:<address>?<query string>"
+        if not uri.startswith("porw:"):
             raise QRCodeError("Invalid PoRW URI")
 
-        address = match.group(1)
-        query_string = match.group(3)
+        address, _, query_string = uri[QR_PREFIX_LENGTH:].partition("?")
+        if not address or not (address.isascii() and address.isalnum()):
+            raise QRCodeError("Invalid PoRW URI")
 
-        # Parse query parameters
+        # Parse query parameters, skipping blank values as parse_qsl() does
         params = {}
         if query_string:
-            params = dict(urllib.parse.parse_qsl(query_string))
+            for pair in query_string.split("&"):
+                key, _, value = pair.partition("=")
+                if key and value:
+                    params[key] = unquote_plus(value)
 
         # Create payment request
         payment_request = {
@@ -308,6 +388,20 @@ class QRCodeParser:
         return QRCodeType.PAYMENT_REQUEST, payment_request
 
 
+# Parsers for QR data, keyed by the fixed-length scheme prefix they handle
+QR_PREFIX_LENGTH = 5
+_PREFIX_PARSERS = {
+    "porw:": QRCodeParser._parse_porw_uri,
+    "porw1": QRCodeParser._parse_address
+}
+
+# QR code types that are encoded as JSON objects; members hash and compare as their "type" field values
+_JSON_QR_TYPES = {
+    qr_type: qr_type
+    for qr_type in (QRCodeType.CONTACT_CARD, QRCodeType.TRANSACTION, QRCodeType.WALLET_CONNECT)
+}
+
+
 class QRCodeScanner:
     """
     Scanner for QR codes.
@@ -321,21 +415,82 @@ class QRCodeScanner:
         # Check if required libraries are available
         try:
             import cv2
-            from pyzbar import pyzbar
             self.cv2 = cv2
-            self.pyzbar = pyzbar
+            self._detector = cv2.QRCodeDetector()
             self.scanner_available = True
         except ImportError:
-            logger.warning("QR code scanning libraries not available. Install with: pip install opencv-python pyzbar")
+            logger.warning("QR code scanning libraries not available. Install with: pip install opencv-python")
             self.scanner_available = False
 
-    def scan_from_camera(self, camera_index: int = 0, timeout: int = 30) -> Optional[str]:
+        # zbar is optional and only used for codes OpenCV's detector cannot decode
+        try:
+            from pyzbar import pyzbar
+            self.pyzbar = pyzbar
+        except ImportError:
+            self.pyzbar = None
+
+    def scan_from_frame(self, frame: Any, max_dimension: Optional[int] = MAX_FRAME_DIMENSION) -> Optional[str]:
+        """
+        Decode a QR code from a single image frame.
+
+        Decoding cost grows with the pixel count, so frames larger than
+        max_dimension on their longest side are downscaled first.
+
+        Args:
+            frame: Image frame as a numpy array
+            max_dimension: Longest side to decode at, or None to decode at full size
+                           (default: MAX_FRAME_DIMENSION)
+
+        Returns:
+            Decoded QR code data, or None if no QR code was found
+        """
+        if max_dimension:
+            height, width = frame.shape[:2]
+            scale = max_dimension / max(height, width)
+            if scale < 1:
+                frame = self.cv2.resize(frame, None, fx=scale, fy=scale, interpolation=self.cv2.INTER_AREA)
+
+        return self._decode(frame)
+
+    def _decode(self, image: Any) -> Optional[str]:
+        """
+        Decode a QR code from an image.
+
+        OpenCV's native detector is tried first; zbar, when installed, is
+        used as a fallback.
+
+        Args:
+            image: Image as a numpy array
+
+        Returns:
+            Decoded QR code data, or None if no QR code was found
+        """
+        data, _, _ = self._detector.detectAndDecode(image)
+        if data:
+            return data
+
+        if self.pyzbar is not None:
+            for obj in self.pyzbar.decode(image):
+                return obj.data.decode('utf-8')
+
+        return None
+
+    def scan_from_camera(
+        self,
+        camera_index: int = 0,
+        timeout: int = 30,
+        max_dimension: Optional[int] = MAX_FRAME_DIMENSION,
+        show_preview: bool = False
+    ) -> Optional[str]:
         """
         Scan a QR code from the camera.
 
         Args:
             camera_index: Camera index (default: 0)
             timeout: Timeout in seconds (default: 30)
+            max_dimension: Longest frame side to decode at (default: MAX_FRAME_DIMENSION)
+            show_preview: Show the camera frames in a window; pressing "q" cancels
+                          the scan (default: False)
 
         Returns:
             Scanned QR code data, or None if no QR code was scanned
@@ -352,46 +507,204 @@ class QRCodeScanner:
             if not cap.isOpened():
                 raise QRCodeError(f"Could not open camera {camera_index}")
 
-            # Set timeout
-            start_time = self.cv2.getTickCount()
-            timeout_ticks = timeout * self.cv2.getTickFrequency()
-
-            while True:
-                # Check timeout
-                current_time = self.cv2.getTickCount()
-                if (current_time - start_time) / self.cv2.getTickFrequency() > timeout:
-                    break
-
-                # Read frame
-                ret, frame = cap.read()
-                if not ret:
-                    continue
-
-                # Decode QR code
-                decoded_objects = self.pyzbar.decode(frame)
-                for obj in decoded_objects:
-                    # Close camera
-                    cap.release()
-                    
-                    # Return QR code data
-                    return obj.data.decode('utf-8')
-
-                # Display frame
-                self.cv2.imshow('QR Code Scanner', frame)
-                
-                # Check for key press
-                if self.cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
-
-            # Close camera
-            cap.release()
-            self.cv2.destroyAllWindows()
-            
+            # Keep only the freshest frame so we never decode stale, buffered frames
+            cap.set(self.cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # Ask the camera for frames close to the decode size
+            if max_dimension:
+                cap.set(self.cv2.CAP_PROP_FRAME_WIDTH, max_dimension)
+
+            # Grab frames on a separate thread; the one-slot queue always holds the latest frame
+            frames: queue.Queue = queue.Queue(maxsize=1)
+            stop = threading.Event()
+            capture_thread = threading.Thread(
+                target=self._capture_frames,
+                args=(cap, frames, stop),
+                name="qr-camera-capture",
+                daemon=True
+            )
+            capture_thread.start()
+
+            try:
+                # Set timeout
+                deadline = time.monotonic() + timeout
+                last_signature = None
+
+                while True:
+                    # Check timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    # Wait for the latest frame
+                    try:
+                        frame = frames.get(timeout=min(remaining, 0.1))
+                    except queue.Empty:
+                        continue
+
+                    # Decode QR code, unless the frame repeats the previous one
+                    signature = self._frame_signature(frame)
+                    if signature != last_signature:
+                        last_signature = signature
+                        qr_data = self.scan_from_frame(frame, max_dimension)
+                        if qr_data is not None:
+                            return qr_data
+
+                    # Display frame
+                    if show_preview:
+                        self.cv2.imshow('QR Code Scanner', frame)
+
+                        # Check for key press
+                        if self.cv2.waitKey(1) & 0xFF == ord('q'):
+                            break
+            finally:
+                # Stop capturing and close camera, also on timeout or error
+                stop.set()
+                capture_thread.join()
+                cap.release()
+                if show_preview:
+                    self.cv2.destroyAllWindows()
+
             return None
         except Exception as e:
             logger.error(f"Error scanning QR code: {e}")
             raise QRCodeError(f"Error scanning QR code: {e}")
 
+    def _preprocessed_variants(self, image: Any) -> Iterator[Any]:
+        """
+        Yield progressively cleaned-up versions of an image for decoding.
+
+        The ladder is grayscale, contrast-equalized (CLAHE), Otsu-binarized,
+        inverted (for light-on-dark codes), a 2x upscale for small codes and
+        finally the located code as a padded, fixed-size, adaptively
+        thresholded patch.
+
+        Args:
+            image: Image as a numpy array
+
+        Yields:
+            Preprocessed images, in the order they should be tried
+        """
+        cv2 = self.cv2
+
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        yield gray
+
+        equalized = cv2.createCLAHE(clipLimit=20.0, tileGridSize=(8, 8)).apply(gray)
+        yield equalized
+
+        _, binary = cv2.threshold(equalized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        yield binary
+
+        yield cv2.bitwise_not(binary)
+
+        yield cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+
+        patch = self._normalized_patch(gray)
+        if patch is not None:
+            yield patch
+
+    def _normalized_patch(self, gray: Any) -> Optional[Any]:
+        """
+        Crop a located QR code to a canonical, binarized patch.
+
+        The code's bounding box is padded by 1/8 of its size on each side,
+        resized to QR_PATCH_SIZE x QR_PATCH_SIZE and adaptively thresholded,
+        so binarization works on modules of a predictable size.
+
+        Args:
+            gray: Grayscale image as a numpy array
+
+        Returns:
+            The binarized patch, or None if no QR code could be located
+        """
+        cv2 = self.cv2
+
+        found, points = self._detector.detect(gray)
+        if not found or points is None:
+            return None
+
+        # Pad the bounding box and clamp it to the image
+        points = points.reshape(-1, 2)
+        x_min, y_min = points.min(axis=0)
+        x_max, y_max = points.max(axis=0)
+        pad = max(x_max - x_min, y_max - y_min) / 8
+        height, width = gray.shape[:2]
+        left, top = max(int(x_min - pad), 0), max(int(y_min - pad), 0)
+        right, bottom = min(int(x_max + pad) + 1, width), min(int(y_max + pad) + 1, height)
+        if right <= left or bottom <= top:
+            return None
+
+        patch = cv2.resize(
+            gray[top:bottom, left:right],
+            (QR_PATCH_SIZE, QR_PATCH_SIZE),
+            interpolation=cv2.INTER_AREA
+        )
+        return cv2.adaptiveThreshold(
+            patch, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, QR_PATCH_BLOCK_SIZE, 4
+        )
+
+    def _decode_with_preprocessing(self, image: Any) -> Optional[str]:
+        """
+        Try to decode an image that failed to decode as-is.
+
+        Each preprocessing step is only computed if the previous ones failed,
+        so the extra cost is only paid on hard images.
+
+        Args:
+            image: Image as a numpy array
+
+        Returns:
+            Decoded QR code data, or None if no QR code was found
+        """
+        for variant in self._preprocessed_variants(image):
+            qr_data = self._decode(variant)
+            if qr_data is not None:
+                return qr_data
+
+        return None
+
+    @staticmethod
+    def _frame_signature(frame: Any) -> int:
+        """
+        Compute a cheap signature of a frame to detect repeated frames.
+
+        Only every FRAME_SIGNATURE_STRIDE-th pixel in each direction is
+        hashed, so the cost is a small fraction of decoding the frame.
+
+        Args:
+            frame: Image frame as a numpy array
+
+        Returns:
+            Hash of the sampled pixels
+        """
+        return hash(frame[::FRAME_SIGNATURE_STRIDE, ::FRAME_SIGNATURE_STRIDE].tobytes())
+
+    @staticmethod
+    def _capture_frames(cap: Any, frames: queue.Queue, stop: threading.Event) -> None:
+        """
+        Read camera frames until stopped, keeping only the most recent one queued.
+
+        Frames the decoder has not picked up yet are dropped, so it always
+        works on the freshest frame instead of falling behind the camera.
+
+        Args:
+            cap: The open video capture
+            frames: One-slot queue receiving the latest frame
+            stop: Event signalling the capture to stop
+        """
+        while not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                continue
+
+            # Replace any frame the decoder has not picked up yet
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            frames.put_nowait(frame)
+
     def scan_from_image(self, image_path: str) -> Optional[str]:
         """
         Scan a QR code from an image.
@@ -415,11 +728,12 @@ class QRCodeScanner:
                 raise QRCodeError(f"Could not read image: {image_path}")
 
             # Decode QR code
-            decoded_objects = self.pyzbar.decode(image)
-            for obj in decoded_objects:
-                return obj.data.decode('utf-8')
+            qr_data = self._decode(image)
+            if qr_data is not None:
+                return qr_data
 
-            return None
+            # Retry on cleaned-up versions of the image
+            return self._decode_with_preprocessing(image)
         except Exception as e:
             logger.error(f"Error scanning QR code from image: {e}")
             raise QRCodeError(f"Error scanning QR code from image: {e}")
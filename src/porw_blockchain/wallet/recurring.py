@@ -5,12 +5,13 @@ This module provides classes and functions for creating and managing
 recurring transactions, allowing users to automate regular payments.
 """
 
+import heapq
 import json
 import logging
 import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -346,9 +347,22 @@ class RecurringTransactionManager:
         Initialize a recurring transaction manager.
         """
         self.transactions: Dict[str, RecurringTransaction] = {}  # transaction_id -> RecurringTransaction
+        self._due_heap: List[Tuple[int, str]] = []  # (next_execution, transaction_id), may hold stale entries
         
         logger.debug("Initialized RecurringTransactionManager")
     
+    def _schedule(self, transaction: RecurringTransaction) -> None:
+        """
+        Add a transaction's next execution time to the due queue.
+        
+        Earlier entries for the same transaction become stale and are
+        discarded when they reach the front of the queue.
+        
+        Args:
+            transaction: The recurring transaction to schedule.
+        """
+        heapq.heappush(self._due_heap, (transaction.next_execution, transaction.transaction_id))
+    
     def add_transaction(
         self,
         transaction_id: str,
@@ -405,6 +419,7 @@ class RecurringTransactionManager:
         
         # Add to transactions
         self.transactions[transaction_id] = transaction
+        self._schedule(transaction)
         
         logger.info(f"Added recurring transaction {transaction_id}")
         return transaction
@@ -464,6 +479,7 @@ class RecurringTransactionManager:
             enabled=enabled,
             max_executions=max_executions
         )
+        self._schedule(transaction)
         
         logger.info(f"Updated recurring transaction {transaction_id}")
         return transaction
@@ -511,10 +527,32 @@ class RecurringTransactionManager:
         """
         Get recurring transactions that are due for execution.
         
+        Only transactions whose next execution time has passed are looked at,
+        in order of that time, instead of checking every transaction.
+        
         Returns:
             A list of recurring transactions that are due.
         """
-        return [tx for tx in self.transactions.values() if tx.is_due()]
+        current_time = int(time.time())
+        due: Dict[str, RecurringTransaction] = {}
+        
+        while self._due_heap and self._due_heap[0][0] <= current_time:
+            next_execution, transaction_id = heapq.heappop(self._due_heap)
+            transaction = self.transactions.get(transaction_id)
+            
+            # Skip stale entries for removed or rescheduled transactions
+            if transaction is None or transaction.next_execution != next_execution or transaction_id in due:
+                continue
+            
+            # Disabled or finished transactions are rescheduled when updated
+            if transaction.is_due():
+                due[transaction_id] = transaction
+        
+        # Due transactions stay queued until they are executed
+        for transaction in due.values():
+            self._schedule(transaction)
+        
+        return list(due.values())
     
     def mark_executed(self, transaction_id: str) -> None:
         """
@@ -529,8 +567,10 @@ class RecurringTransactionManager:
         if transaction_id not in self.transactions:
             raise ValueError(f"Transaction with ID {transaction_id} not found")
         
-        # Mark as executed
-        self.transactions[transaction_id].mark_executed()
+        # Mark as executed and queue the next execution
+        transaction = self.transactions[transaction_id]
+        transaction.mark_executed()
+        self._schedule(transaction)
     
     def enable_transaction(self, transaction_id: str) -> RecurringTransaction:
         """
@@ -551,6 +591,7 @@ class RecurringTransactionManager:
         # Enable transaction
         transaction = self.transactions[transaction_id]
         transaction.update(enabled=True)
+        self._schedule(transaction)
         
         logger.info(f"Enabled recurring transaction {transaction_id}")
         return transaction
@@ -607,7 +648,9 @@ class RecurringTransactionManager:
         
         transactions_data = data.get("transactions", {})
         for transaction_id, transaction_data in transactions_data.items():
-            manager.transactions[transaction_id] = RecurringTransaction.from_dict(transaction_data)
+            transaction = RecurringTransaction.from_dict(transaction_data)
+            manager.transactions[transaction_id] = transaction
+            manager._schedule(transaction)
         
         return manager
 
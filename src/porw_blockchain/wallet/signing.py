@@ -0,0 +1,347 @@
+"""
+ECDSA signing backends for the PoRW wallet.
+
+This module routes secp256k1 signing and verification through libsecp256k1
+(via the optional ``coincurve`` binding) when it is installed, and falls back
+to the ``cryptography`` library for other curves or when it is not.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterator, List, Optional, Tuple
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    Prehashed,
+    decode_dss_signature,
+    encode_dss_signature
+)
+
+from ..core.crypto_utils import load_public_key_from_pem
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    coincurve = None
+    COINCURVE_AVAILABLE = False
+
+# Order of the secp256k1 group, used for low-S normalization
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Number of prehashed verification results remembered across batches
+VERIFY_CACHE_SIZE = 16384
+
+# Smallest batch worth spreading over the verification thread pool
+PARALLEL_VERIFY_MIN_BATCH = 4
+
+# Verification runs in native code, so large batches can be spread over several cores;
+# the pool is created by the first parallel batch
+_verify_executor: Optional[ThreadPoolExecutor] = None
+_verify_executor_lock = threading.Lock()
+
+# Whether the fallback to cryptography for secp256k1 keys has been logged
+_fallback_logged = False
+
+
+def _get_verify_executor() -> ThreadPoolExecutor:
+    """
+    Get the verification thread pool, creating it on first use.
+
+    Returns:
+        The verification thread pool.
+    """
+    global _verify_executor
+    with _verify_executor_lock:
+        if _verify_executor is None:
+            _verify_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="ecdsa-verify")
+        return _verify_executor
+
+
+def _log_coincurve_fallback() -> None:
+    """Log once that secp256k1 keys use cryptography because coincurve is not installed."""
+    global _fallback_logged
+    if not _fallback_logged:
+        _fallback_logged = True
+        logger.debug("coincurve not available, falling back to cryptography for ECDSA. Install with: pip install coincurve")
+
+
+@lru_cache(maxsize=256)
+def prepare_message(message: str) -> Tuple[bytes, bytes]:
+    """
+    Encode a message and compute its SHA-256 digest.
+
+    Results are cached, so a message that is signed and then verified, or
+    verified against several signatures, is only encoded and hashed once.
+
+    Args:
+        message: The message text.
+
+    Returns:
+        A tuple containing the UTF-8 encoded message and its SHA-256 digest.
+    """
+    data = message.encode()
+    return data, hashlib.sha256(data).digest()
+
+
+def normalize_signature(signature: bytes) -> bytes:
+    """
+    Normalize a DER-encoded secp256k1 signature to its low-S form.
+
+    libsecp256k1 only accepts low-S signatures, while the cryptography library
+    may produce either form.
+
+    Args:
+        signature: The DER-encoded signature.
+
+    Returns:
+        The DER-encoded low-S signature.
+
+    Raises:
+        ValueError: If the signature is not valid DER.
+    """
+    r, s = decode_dss_signature(signature)
+    if s > SECP256K1_ORDER // 2:
+        s = SECP256K1_ORDER - s
+    return encode_dss_signature(r, s)
+
+
+class EcdsaBackend:
+    """
+    Signs and verifies messages for a single key pair.
+
+    The key material is converted into the backend's native representation
+    once, so each sign/verify call only performs the ECDSA operation.
+    """
+
+    def __init__(
+        self,
+        private_key: Optional[ec.EllipticCurvePrivateKey] = None,
+        public_key: Optional[ec.EllipticCurvePublicKey] = None
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            private_key: The private key object (optional).
+            public_key: The public key object (optional, derived from the private key if omitted).
+        """
+        if public_key is None and private_key is not None:
+            public_key = private_key.public_key()
+
+        self.private_key = private_key
+        self.public_key = public_key
+        self._cc_priv = None
+        self._cc_pub = None
+
+        # Use libsecp256k1 for secp256k1 keys when available
+        if public_key is not None and isinstance(public_key.curve, ec.SECP256K1):
+            if COINCURVE_AVAILABLE:
+                if private_key is not None:
+                    raw_priv = private_key.private_numbers().private_value.to_bytes(32, "big")
+                    self._cc_priv = coincurve.PrivateKey(raw_priv)
+                raw_pub = public_key.public_bytes(
+                    encoding=serialization.Encoding.X962,
+                    format=serialization.PublicFormat.CompressedPoint
+                )
+                self._cc_pub = coincurve.PublicKey(raw_pub)
+            else:
+                _log_coincurve_fallback()
+
+    @property
+    def name(self) -> str:
+        """Name of the backend in use."""
+        return "coincurve" if self._cc_pub is not None else "cryptography"
+
+    def sign(self, data: bytes) -> bytes:
+        """
+        Sign data with ECDSA over SHA-256.
+
+        Args:
+            data: The data to sign.
+
+        Returns:
+            The DER-encoded signature.
+
+        Raises:
+            ValueError: If no private key is available.
+        """
+        return self.sign_digest(hashlib.sha256(data).digest())
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        """
+        Sign a precomputed SHA-256 digest with ECDSA.
+
+        Args:
+            digest: The 32-byte SHA-256 digest of the data.
+
+        Returns:
+            The DER-encoded signature.
+
+        Raises:
+            ValueError: If no private key is available.
+        """
+        if self.private_key is None:
+            raise ValueError("No private key available for signing")
+
+        if self._cc_priv is not None:
+            return self._cc_priv.sign(digest, hasher=None)
+
+        return self.private_key.sign(digest, ec.ECDSA(Prehashed(hashes.SHA256())))
+
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        """
+        Verify an ECDSA/SHA-256 signature.
+
+        Args:
+            signature: The DER-encoded signature.
+            data: The signed data.
+
+        Returns:
+            True if the signature is valid, False otherwise.
+
+        Raises:
+            ValueError: If no public key is available.
+        """
+        return self.verify_digest(signature, hashlib.sha256(data).digest())
+
+    def verify_digest(self, signature: bytes, digest: bytes) -> bool:
+        """
+        Verify an ECDSA signature over a precomputed SHA-256 digest.
+
+        Args:
+            signature: The DER-encoded signature.
+            digest: The 32-byte SHA-256 digest of the signed data.
+
+        Returns:
+            True if the signature is valid, False otherwise.
+
+        Raises:
+            ValueError: If no public key is available.
+        """
+        if self.public_key is None:
+            raise ValueError("No public key available for verification")
+
+        if self._cc_pub is not None:
+            try:
+                return self._cc_pub.verify(normalize_signature(signature), digest, hasher=None)
+            except ValueError:
+                return False
+
+        try:
+            self.public_key.verify(signature, digest, ec.ECDSA(Prehashed(hashes.SHA256())))
+            return True
+        except InvalidSignature:
+            return False
+
+
+@lru_cache(maxsize=1024)
+def backend_for_public_key(public_key: str) -> Optional[EcdsaBackend]:
+    """
+    Get a verification backend for a PEM-encoded public key.
+
+    Backends are cached by PEM, so a signer's key is parsed and converted
+    into the backend's native form only once across all verifications.
+
+    Args:
+        public_key: The PEM-encoded public key.
+
+    Returns:
+        The backend, or None if the public key is invalid.
+    """
+    try:
+        return EcdsaBackend(public_key=load_public_key_from_pem(public_key.encode()))
+    except ValueError as e:
+        logger.warning(f"Invalid public key for verification: {e}")
+        return None
+
+
+@lru_cache(maxsize=VERIFY_CACHE_SIZE)
+def _verify_digest_cached(public_key: str, signature: bytes, digest: bytes) -> bool:
+    """
+    Verify a signature over a digest, remembering the result.
+
+    The cache is keyed on the full public key, signature and digest, so a
+    repeated check (e.g. a rebroadcast transaction) is a lookup, and a result
+    is only ever reused for exactly the inputs it was computed from.
+
+    Args:
+        public_key: The PEM-encoded public key.
+        signature: The DER-encoded signature.
+        digest: The 32-byte SHA-256 digest of the signed data.
+
+    Returns:
+        True if the signature is valid, False otherwise.
+    """
+    backend = backend_for_public_key(public_key)
+    return backend is not None and backend.verify_digest(signature, digest)
+
+
+def _verify_item(item: Tuple[bytes, bytes, str], prehashed: bool) -> bool:
+    """
+    Verify a single signature, using the cached backend for its public key.
+
+    Args:
+        item: A (data, signature, public_key_pem) tuple.
+        prehashed: Whether the data is already a SHA-256 digest.
+
+    Returns:
+        True if the signature is valid, False otherwise.
+    """
+    data, signature, public_key = item
+    if prehashed:
+        return _verify_digest_cached(public_key, signature, data)
+    backend = backend_for_public_key(public_key)
+    return backend is not None and backend.verify(signature, data)
+
+
+def _iter_verify(items: List[Tuple[bytes, bytes, str]], prehashed: bool) -> Iterator[bool]:
+    """
+    Verify signatures one at a time, using cached backends for the public keys.
+
+    Args:
+        items: A list of (data, signature, public_key_pem) tuples.
+        prehashed: Whether the data in each item is already a SHA-256 digest.
+
+    Yields:
+        True or False for each item, in order.
+    """
+    for item in items:
+        yield _verify_item(item, prehashed)
+
+
+def verify_batch(
+    items: List[Tuple[bytes, bytes, str]],
+    prehashed: bool = False,
+    parallel: bool = False
+) -> List[bool]:
+    """
+    Verify a batch of ECDSA/SHA-256 signatures.
+
+    ECDSA signatures cannot be soundly combined into a single check, so each
+    signature is still verified individually; PEM parsing and backend setup
+    are cached, so each distinct public key is loaded only once.
+
+    Args:
+        items: A list of (data, signature, public_key_pem) tuples.
+        prehashed: Whether the data in each item is already a SHA-256 digest
+                   (default: False).
+        parallel: Spread batches of at least PARALLEL_VERIFY_MIN_BATCH items
+                  over a shared thread pool (default: False).
+
+    Returns:
+        A list with one boolean per item, True if that signature is valid.
+    """
+    if parallel and len(items) >= PARALLEL_VERIFY_MIN_BATCH:
+        return list(_get_verify_executor().map(partial(_verify_item, prehashed=prehashed), items))
+    return list(_iter_verify(items, prehashed))
+
@@ -5,10 +5,15 @@ This module provides methods for creating and using stealth addresses in the wal
 allowing users to receive funds without revealing their identity on the blockchain.
 """
 
+import asyncio
+import atexit
 import logging
 import os
 import hashlib
 import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -36,6 +41,79 @@ from ..privacy.stealth_address import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Minimum number of transactions before a scan is sharded across processes
+PARALLEL_SCAN_THRESHOLD = 256
+
+# Long-lived pool for sharded scans, created by the first large scan
+_scan_executor: Optional[ProcessPoolExecutor] = None
+_scan_executor_lock = threading.Lock()
+
+
+def _get_scan_executor() -> ProcessPoolExecutor:
+    """
+    Get the process pool for sharded scans, creating it on first use.
+
+    Workers are spawned rather than forked, since the wallet process already
+    runs background threads. The pool is shut down when the interpreter exits.
+
+    Returns:
+        The scan process pool.
+    """
+    global _scan_executor
+    with _scan_executor_lock:
+        if _scan_executor is None:
+            _scan_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _scan_executor
+
+
+def shutdown_scan_executor() -> None:
+    """
+    Shut down the scan process pool, if it was created.
+
+    A later large scan creates a new pool.
+    """
+    global _scan_executor
+    with _scan_executor_lock:
+        executor, _scan_executor = _scan_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_scan_executor)
+
+
+def _scan_shard(
+    view_private_key_pem: str,
+    spend_public_key_pem: str,
+    payment_address: str,
+    transactions: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Scan one shard of transactions in a worker process.
+
+    Key objects cannot be pickled, so the worker rebuilds them from PEM. Only
+    the keys needed for scanning are sent; the spend private key never leaves
+    the wallet process.
+
+    Args:
+        view_private_key_pem: The PEM-encoded view private key.
+        spend_public_key_pem: The PEM-encoded spend public key.
+        payment_address: The precomputed payment address for the stealth keys.
+        transactions: The transactions in this shard.
+
+    Returns:
+        The stealth payments detected in this shard.
+    """
+    return scan_for_stealth_payments(
+        view_private_key=load_private_key_from_pem(view_private_key_pem.encode('utf-8')),
+        spend_public_key=load_public_key_from_pem(spend_public_key_pem.encode('utf-8')),
+        blockchain_transactions=transactions,
+        payment_address=payment_address
+    )
+
 
 class StealthWallet:
     """
@@ -115,7 +193,8 @@ class StealthWallet:
         recipient_stealth_address: str,
         amount: float,
         fee: Optional[float] = None,
-        memo: Optional[str] = None
+        memo: Optional[str] = None,
+        tx_builder: Optional[Any] = None
     ) -> Tuple[Transaction, Dict[str, Any]]:
         """
         Create a transaction to a stealth address.
@@ -125,6 +204,8 @@ class StealthWallet:
             amount: The amount to send.
             fee: The transaction fee (default: calculated automatically).
             memo: Optional memo to include with the transaction.
+            tx_builder: An existing TransactionBuilder for this wallet's key to reuse
+                        (default: a new one is created).
             
         Returns:
             A tuple containing the transaction and stealth metadata.
@@ -143,10 +224,11 @@ class StealthWallet:
             )
             
             # Create transaction
-            from .transaction import TransactionBuilder
-            tx_builder = TransactionBuilder(
-                private_key=self.private_key
-            )
+            if tx_builder is None:
+                from .transaction import TransactionBuilder
+                tx_builder = TransactionBuilder(
+                    private_key=self.private_key
+                )
             
             # Create transaction to the payment address
             transaction = tx_builder.create_transaction(
@@ -186,7 +268,8 @@ class StealthWallet:
             detected_payments = scan_for_stealth_payments(
                 view_private_key=self.stealth_keys.view_private_key,
                 spend_public_key=self.stealth_keys.spend_public_key,
-                blockchain_transactions=transactions
+                blockchain_transactions=transactions,
+                payment_address=self.stealth_keys.get_payment_address()
             )
             
             return detected_payments
@@ -195,6 +278,61 @@ class StealthWallet:
             logger.error(f"Error scanning for stealth payments: {e}")
             raise
     
+    async def scan_for_payments_parallel(
+        self,
+        transactions: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan for stealth payments, sharding large scans across worker processes.
+
+        Small scans run on a worker thread; larger ones are split into one shard
+        per worker and run in a process pool. Either way the event loop is not
+        blocked.
+
+        Args:
+            transactions: List of transactions to scan.
+            max_workers: Number of worker processes (default: CPU count).
+
+        Returns:
+            A list of detected stealth payments, in transaction order.
+
+        Raises:
+            ValueError: If no stealth keys are loaded.
+        """
+        if not self.stealth_keys:
+            raise ValueError("No stealth keys loaded")
+
+        loop = asyncio.get_running_loop()
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 2 or len(transactions) < PARALLEL_SCAN_THRESHOLD:
+            return await loop.run_in_executor(None, self.scan_for_payments, transactions)
+
+        # Split transactions into one contiguous shard per worker
+        shard_size = -(-len(transactions) // workers)
+        shards = [transactions[i:i + shard_size] for i in range(0, len(transactions), shard_size)]
+        view_private_key_pem = serialize_private_key(self.stealth_keys.view_private_key).decode('utf-8')
+        spend_public_key_pem = serialize_public_key(self.stealth_keys.spend_public_key).decode('utf-8')
+        payment_address = self.stealth_keys.get_payment_address()
+        executor = _get_scan_executor()
+
+        try:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    executor, _scan_shard,
+                    view_private_key_pem, spend_public_key_pem, payment_address, shard
+                )
+                for shard in shards
+            ])
+
+            # Merge shard results
+            return [payment for shard_payments in results for payment in shard_payments]
+
+        except Exception as e:
+            logger.error(f"Error scanning for stealth payments: {e}")
+            raise
+
     def recover_payment_private_key(self, ephemeral_public_key_pem: str) -> str:
         """
         Recover the private key for a stealth payment.
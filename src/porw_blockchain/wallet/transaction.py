@@ -209,12 +209,14 @@ class TransactionBuilder:
         logger.debug(f"Signed transaction {transaction.id}")
         return signed_tx
 
-    async def submit_transaction(self, transaction: Transaction) -> Dict[str, Any]:
+    async def submit_transaction(self, transaction: Transaction, verify: bool = True) -> Dict[str, Any]:
         """
         Submit a transaction to the network.
 
         Args:
             transaction: The transaction to submit.
+            verify: Whether to re-verify the signature before submitting (default: True).
+                    Callers that have just signed the transaction themselves can skip this.
 
         Returns:
             The response from the network.
@@ -227,32 +229,33 @@ class TransactionBuilder:
         if not transaction.signature:
             raise ValueError(f"Transaction {transaction.id} is not signed")
 
-        # Verify the transaction signature
-        tx_data = {
-            "id": transaction.id,
-            "sender": transaction.sender,
-            "receiver": transaction.receiver,
-            "amount": transaction.amount,
-            "fee": transaction.fee,
-            "timestamp": transaction.timestamp,
-            "nonce": transaction.nonce
-        }
-
-        # Add memo if present
-        if transaction.memo:
-            tx_data["memo"] = transaction.memo
-
-        # Convert to JSON string
-        tx_json = json.dumps(tx_data, sort_keys=True)
-
-        # Get public key from address
-        # In a real implementation, this would be stored or derived
-        # For now, we'll use the one from initialization
-        public_key = self.public_key
-
-        # Verify signature
-        if not verify_signature(tx_json, transaction.signature, public_key):
-            raise ValueError(f"Invalid signature for transaction {transaction.id}")
+        if verify:
+            # Verify the transaction signature
+            tx_data = {
+                "id": transaction.id,
+                "sender": transaction.sender,
+                "receiver": transaction.receiver,
+                "amount": transaction.amount,
+                "fee": transaction.fee,
+                "timestamp": transaction.timestamp,
+                "nonce": transaction.nonce
+            }
+
+            # Add memo if present
+            if transaction.memo:
+                tx_data["memo"] = transaction.memo
+
+            # Convert to JSON string
+            tx_json = json.dumps(tx_data, sort_keys=True)
+
+            # Get public key from address
+            # In a real implementation, this would be stored or derived
+            # For now, we'll use the one from initialization
+            public_key = self.public_key
+
+            # Verify signature
+            if not verify_signature(tx_json, transaction.signature, public_key):
+                raise ValueError(f"Invalid signature for transaction {transaction.id}")
 
         # Check if network client is available
         if not self.network_client:
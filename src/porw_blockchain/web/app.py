@@ -57,6 +57,19 @@ WALLET = None
 CONTRACT_MANAGER = None
 
 
+def hex_encode_bytes(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Hex-encode the bytes values of a response dictionary for JSON output.
+
+    Args:
+        data: The response dictionary
+
+    Returns:
+        A copy of the dictionary with bytes values replaced by hex strings
+    """
+    return {key: value.hex() if isinstance(value, bytes) else value for key, value in data.items()}
+
+
 class WebInterface:
     """Web interface for the PoRW blockchain system."""
 
@@ -1768,13 +1781,14 @@ def delete(key):
             return web.json_response({'error': 'No wallet found'}, status=400)
 
         try:
-            # Get active sessions
-            sessions = await WALLET.get_active_mixing_sessions()
+            # Get active sessions, already encoded as JSON
+            sessions_json = await WALLET.get_active_mixing_sessions_json()
 
-            # Return the sessions
-            return web.json_response({
-                'sessions': sessions
-            })
+            # Return the sessions without decoding and re-encoding them
+            return web.Response(
+                body=b'{"sessions": ' + sessions_json + b'}',
+                content_type='application/json'
+            )
 
         except Exception as e:
             return web.json_response({'error': f'Error getting active mixing sessions: {e}'}, status=500)
@@ -1820,7 +1834,7 @@ def delete(key):
             )
 
             # Return the signature
-            return web.json_response(signature)
+            return web.json_response(hex_encode_bytes(signature))
 
         except Exception as e:
             return web.json_response({'error': f'Error getting blind signature: {e}'}, status=500)
@@ -1847,7 +1861,7 @@ def delete(key):
             )
 
             # Return the signature
-            return web.json_response(signature)
+            return web.json_response(hex_encode_bytes(signature))
 
         except Exception as e:
             return web.json_response({'error': f'Error signing transaction: {e}'}, status=500)
@@ -0,0 +1,107 @@
+# tests/test_contacts.py
+"""
+Tests for the PoRW wallet address book.
+
+This module contains tests for keeping the address, name and tag indexes
+of the address book consistent with its contacts.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.porw_blockchain.wallet.contacts import AddressBook, create_contact
+
+
+# --- Fixtures ---
+
+@pytest.fixture(autouse=True)
+def valid_addresses():
+    """Accept any "porw1" address, without decoding its checksum."""
+    with patch(
+        "src.porw_blockchain.wallet.contacts._is_valid_address",
+        side_effect=lambda address: address.startswith("porw1")
+    ):
+        yield
+
+
+@pytest.fixture
+def address_book():
+    """Create an address book with three tagged contacts."""
+    address_book = AddressBook()
+    address_book.add_contact(create_contact("Alice", "porw1alice", tags=["friend", "work"]))
+    address_book.add_contact(create_contact("Bob", "porw1bob", tags=["work"]))
+    address_book.add_contact(create_contact("Carol", "porw1carol", tags=["friend"]))
+    return address_book
+
+
+def contact_id(address_book, name):
+    """Get the ID of the contact with the given name."""
+    return address_book.get_contact_by_name(name).contact_id
+
+
+def indexes(address_book):
+    """Get the address book's indexes, ignoring the order of their entries."""
+    return (
+        address_book.address_index,
+        {name: set(contact_ids) for name, contact_ids in address_book.name_index.items()},
+        {tag: set(contact_ids) for tag, contact_ids in address_book.tag_index.items()}
+    )
+
+
+def assert_consistent(address_book):
+    """Assert that the indexes match ones rebuilt from the contacts."""
+    rebuilt = AddressBook.from_dict(address_book.to_dict())
+    assert indexes(address_book) == indexes(rebuilt)
+    assert address_book.get_all_tags() == rebuilt.get_all_tags()
+
+
+# --- Index consistency ---
+
+def test_update_contact_reindexes(address_book):
+    """Test that updating a contact's name, address and tags updates every index."""
+    alice = contact_id(address_book, "Alice")
+
+    address_book.update_contact(alice, name="Alicia", address="porw1alicia", tags=["family"])
+
+    assert address_book.get_contact_by_name("Alice") is None
+    assert address_book.get_contact_by_name("alicia").contact_id == alice
+    assert address_book.get_contact_by_address("porw1alice") is None
+    assert address_book.get_contact_by_address("porw1alicia").contact_id == alice
+    assert [contact.name for contact in address_book.get_contacts_by_tag("work")] == ["Bob"]
+    assert [contact.name for contact in address_book.get_contacts_by_tag("family")] == ["Alicia"]
+    assert address_book.get_all_tags() == ["family", "friend", "work"]
+    assert_consistent(address_book)
+
+
+def test_rejected_update_leaves_indexes_unchanged(address_book):
+    """Test that an update with an invalid address changes no index."""
+    alice = contact_id(address_book, "Alice")
+    before = indexes(address_book)
+
+    with pytest.raises(ValueError):
+        address_book.update_contact(alice, name="Alicia", address="invalid")
+
+    assert indexes(address_book) == before
+    assert address_book.get_contact_by_name("Alice").contact_id == alice
+    assert_consistent(address_book)
+
+
+def test_remove_contact_unindexes(address_book):
+    """Test that removing a contact drops it, and emptied tags, from every index."""
+    address_book.remove_contact(contact_id(address_book, "Bob"))
+    address_book.remove_contact(contact_id(address_book, "Alice"))
+
+    assert address_book.get_contact_by_name("Bob") is None
+    assert address_book.get_contact_by_address("porw1alice") is None
+    assert address_book.get_contacts_by_tag("work") == []
+    assert address_book.get_all_tags() == ["friend"]
+    assert_consistent(address_book)
+
+
+def test_tag_order_follows_tagging(address_book):
+    """Test that contacts are listed by tag in the order they were tagged."""
+    address_book.add_tag_to_contact(contact_id(address_book, "Carol"), "work")
+    address_book.remove_tag_from_contact(contact_id(address_book, "Alice"), "work")
+
+    assert [contact.name for contact in address_book.get_contacts_by_tag("work")] == ["Bob", "Carol"]
+    assert_consistent(address_book)
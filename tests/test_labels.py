@@ -0,0 +1,78 @@
+# tests/test_labels.py
+"""
+Tests for PoRW wallet transaction labels.
+
+This module contains tests for keeping the category and tag indexes of
+the transaction label manager consistent with its labels.
+"""
+
+import pytest
+
+from src.porw_blockchain.wallet.labels import TransactionLabelManager
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def label_manager():
+    """Create a label manager with four labelled transactions."""
+    label_manager = TransactionLabelManager()
+    for index in range(4):
+        label_manager.add_label(f"tx{index}", category="food", tags=["a", "b"])
+    return label_manager
+
+
+def transaction_ids(labels):
+    """Get the transaction IDs of a list of labels."""
+    return [label.transaction_id for label in labels]
+
+
+def assert_consistent(label_manager):
+    """Assert that the indexes match ones rebuilt from the labels."""
+    rebuilt = TransactionLabelManager.from_dict(label_manager.to_dict())
+    assert label_manager.category_index == rebuilt.category_index
+    assert label_manager.tag_index == rebuilt.tag_index
+    assert label_manager.get_all_tags() == rebuilt.get_all_tags()
+
+
+# --- Index consistency ---
+
+def test_update_label_reindexes_changes_only(label_manager):
+    """Test that updating a label moves it between tags and keeps its place in unchanged ones."""
+    label_manager.update_label("tx1", notes="lunch", tags=["b", "c"])
+
+    assert transaction_ids(label_manager.get_labels_by_category("food")) == ["tx0", "tx1", "tx2", "tx3"]
+    assert transaction_ids(label_manager.get_labels_by_tag("a")) == ["tx0", "tx2", "tx3"]
+    assert transaction_ids(label_manager.get_labels_by_tag("b")) == ["tx0", "tx1", "tx2", "tx3"]
+    assert transaction_ids(label_manager.get_labels_by_tag("c")) == ["tx1"]
+    assert_consistent(label_manager)
+
+
+def test_update_label_category(label_manager):
+    """Test that changing a label's category moves it to the new category's index."""
+    label_manager.update_label("tx0", category="rent")
+
+    assert transaction_ids(label_manager.get_labels_by_category("food")) == ["tx1", "tx2", "tx3"]
+    assert transaction_ids(label_manager.get_labels_by_category("rent")) == ["tx0"]
+    assert_consistent(label_manager)
+
+
+def test_remove_label_unindexes(label_manager):
+    """Test that removing labels drops them, and emptied entries, from the indexes."""
+    label_manager.update_label("tx2", tags=["only"])
+    label_manager.remove_label("tx2")
+
+    assert transaction_ids(label_manager.get_labels_by_tag("b")) == ["tx0", "tx1", "tx3"]
+    assert label_manager.get_labels_by_tag("only") == []
+    assert label_manager.get_all_tags() == ["a", "b"]
+    assert_consistent(label_manager)
+
+
+def test_replacing_label_reindexes(label_manager):
+    """Test that adding a label for a labelled transaction replaces its index entries."""
+    label_manager.add_label("tx3", category="travel", tags=["c"])
+
+    assert transaction_ids(label_manager.get_labels_by_category("food")) == ["tx0", "tx1", "tx2"]
+    assert transaction_ids(label_manager.get_labels_by_tag("a")) == ["tx0", "tx1", "tx2"]
+    assert transaction_ids(label_manager.get_labels_by_tag("c")) == ["tx3"]
+    assert_consistent(label_manager)
@@ -0,0 +1,114 @@
+# tests/test_qrcode.py
+"""
+Tests for PoRW wallet QR codes.
+
+This module contains tests for generating and parsing the data carried
+by PoRW QR codes.
+"""
+
+import json
+import pytest
+
+from src.porw_blockchain.wallet.qrcode import (
+    QRCodeGenerator,
+    QRCodeParser,
+    QRCodeType,
+    QRCodeError,
+    PaymentRequest,
+    generate_payment_qr_code,
+    parse_payment_qr_code
+)
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def transaction():
+    """Create transaction data for a transaction QR code."""
+    return {
+        "id": "tx1",
+        "sender": "porw1senderaddress",
+        "recipient": "porw1recipientaddress",
+        "amount": 10.0
+    }
+
+
+# --- Generation ---
+
+def test_transaction_data_with_large_amount_and_integer_keys(transaction):
+    """Test that data orjson rejects is still encoded as compact JSON."""
+    transaction["amount"] = 10**20
+    transaction["meta"] = {1: "a"}
+
+    qr_data = QRCodeGenerator.generate_transaction_data(transaction)
+
+    assert " " not in qr_data
+    assert json.loads(qr_data)["transaction"]["amount"] == 10**20
+    assert json.loads(qr_data)["transaction"]["meta"] == {"1": "a"}
+
+    qr_type, data = QRCodeParser.parse_qr_data(qr_data)
+    assert qr_type == QRCodeType.TRANSACTION
+    assert data["transaction"]["id"] == "tx1"
+
+
+def test_transaction_data_that_cannot_be_encoded(transaction):
+    """Test that data that is not JSON serializable raises a QRCodeError."""
+    transaction["meta"] = object()
+
+    with pytest.raises(QRCodeError):
+        QRCodeGenerator.generate_transaction_data(transaction)
+
+
+# --- Payment URIs ---
+
+@pytest.mark.parametrize("payment_request", [
+    PaymentRequest(address="porw1recipient"),
+    PaymentRequest(address="porw1recipient", amount=12.5),
+    PaymentRequest(
+        address="porw1recipient",
+        amount=0.001,
+        memo="rent & bills = 50% + fees",
+        label="Flat 4/B #2?",
+        expires=1893456000,
+        request_id="req-1"
+    ),
+    PaymentRequest(address="porw1recipient", memo="caf\u00e9 \u2615 for two", label="  spaced  "),
+])
+def test_payment_uri_round_trip(payment_request):
+    """Test that a generated payment URI parses back to the same request."""
+    qr_data = QRCodeGenerator.generate_payment_request_data(payment_request)
+
+    qr_type, data = QRCodeParser.parse_qr_data(qr_data)
+
+    assert qr_type == QRCodeType.PAYMENT_REQUEST
+    assert parse_payment_qr_code(qr_data) == payment_request
+    assert data["address"] == payment_request.address
+
+
+def test_payment_qr_code_round_trip():
+    """Test that generate_payment_qr_code and parse_payment_qr_code are inverses."""
+    qr_data = generate_payment_qr_code("porw1recipient", amount=3.0, memo="a=b&c", request_id="r 1")
+
+    assert qr_data.startswith("porw:porw1recipient?")
+    assert parse_payment_qr_code(qr_data) == PaymentRequest(
+        address="porw1recipient",
+        amount=3.0,
+        memo="a=b&c",
+        request_id="r 1"
+    )
+
+
+def test_address_only_round_trip():
+    """Test that an address-only QR code parses to a payment request without an amount."""
+    qr_data = QRCodeGenerator.generate_address_only_data("porw1recipient")
+
+    assert parse_payment_qr_code(qr_data) == PaymentRequest(address="porw1recipient")
+
+
+def test_invalid_payment_requests():
+    """Test that invalid addresses and amounts are rejected when generating."""
+    with pytest.raises(QRCodeError):
+        generate_payment_qr_code("btc1recipient")
+
+    with pytest.raises(QRCodeError):
+        generate_payment_qr_code("porw1recipient", amount=0)
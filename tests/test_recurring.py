@@ -0,0 +1,126 @@
+# tests/test_recurring.py
+"""
+Tests for PoRW wallet recurring transactions.
+
+This module contains tests for the due-transaction queue of the recurring
+transaction manager and for executing due transactions from the wallet.
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock, patch, AsyncMock
+
+from src.porw_blockchain.wallet.recurring import RecurringTransactionManager
+from src.porw_blockchain.wallet.main import Wallet
+
+
+DAY = 86400
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def manager():
+    """Create a manager with one due, one future and one disabled transaction."""
+    now = int(time.time())
+    manager = RecurringTransactionManager()
+    manager.add_transaction("due", "porw1recipient", 1.0, "daily", start_date=now - 2 * DAY)
+    manager.add_transaction("future", "porw1recipient", 1.0, "daily", start_date=now + DAY)
+    manager.add_transaction("disabled", "porw1recipient", 1.0, "daily", start_date=now - 3 * DAY, enabled=False)
+    return manager
+
+
+def due_ids(manager):
+    """Get the sorted IDs of the due transactions."""
+    return sorted(transaction.transaction_id for transaction in manager.get_due_transactions())
+
+
+# --- Due queue ---
+
+def test_due_transactions(manager):
+    """Test that only enabled transactions whose time has passed are due."""
+    assert due_ids(manager) == ["due"]
+
+
+def test_due_transaction_stays_queued_until_executed(manager):
+    """Test that a due transaction is returned again until it is marked executed."""
+    assert due_ids(manager) == ["due"]
+    assert due_ids(manager) == ["due"]
+
+    manager.mark_executed("due")
+
+    assert due_ids(manager) == []
+
+
+def test_rescheduled_transaction_ignores_stale_entry(manager):
+    """Test that moving a due transaction into the future leaves no stale due entry."""
+    manager.update_transaction("due", start_date=int(time.time()) + DAY)
+
+    assert due_ids(manager) == []
+
+
+def test_updated_transaction_becomes_due(manager):
+    """Test that moving a future transaction into the past makes it due."""
+    manager.update_transaction("future", start_date=int(time.time()) - DAY)
+
+    assert due_ids(manager) == ["due", "future"]
+
+
+def test_removed_transaction_is_not_due(manager):
+    """Test that a removed transaction's queued entry is skipped."""
+    manager.remove_transaction("due")
+
+    assert due_ids(manager) == []
+
+
+def test_disable_then_enable(manager):
+    """Test that disabling removes a transaction from the due list and enabling restores it."""
+    manager.disable_transaction("due")
+    assert due_ids(manager) == []
+
+    manager.enable_transaction("due")
+    manager.enable_transaction("disabled")
+    assert due_ids(manager) == ["disabled", "due"]
+
+
+def test_due_queue_survives_round_trip(manager):
+    """Test that a manager loaded from a dictionary rebuilds its due queue."""
+    loaded = RecurringTransactionManager.from_dict(manager.to_dict())
+
+    assert due_ids(loaded) == ["due"]
+
+
+# --- Wallet execution ---
+
+@pytest.fixture
+def wallet(manager):
+    """Create a wallet using the recurring transaction manager."""
+    with patch("src.porw_blockchain.wallet.main.TransactionBuilder"), \
+            patch.object(Wallet, "_load_key_objects"):
+        wallet = Wallet(network_client=MagicMock(), auto_connect=False)
+    wallet.wallet_data = {"recurring_transactions": {"transactions": {}}}
+    wallet.recurring_manager = manager
+    return wallet
+
+
+@pytest.mark.asyncio
+async def test_failed_execution_stays_queued(wallet, manager):
+    """Test that a recurring transaction that fails to send is still due afterwards."""
+    with patch.object(Wallet, "send", new_callable=AsyncMock, side_effect=ConnectionError("offline")):
+        responses = await wallet.execute_due_transactions()
+
+    assert [(response["transaction_id"], response["success"]) for response in responses] == [("due", False)]
+    assert manager.get_transaction("due").execution_count == 0
+    assert due_ids(manager) == ["due"]
+
+
+@pytest.mark.asyncio
+async def test_successful_execution_is_dequeued(wallet, manager):
+    """Test that a recurring transaction that is sent is no longer due."""
+    with patch.object(Wallet, "send", new_callable=AsyncMock, return_value={"status": "accepted"}):
+        responses = await wallet.execute_due_transactions()
+
+    assert [(response["transaction_id"], response["success"]) for response in responses] == [("due", True)]
+    assert manager.get_transaction("due").execution_count == 1
+    assert due_ids(manager) == []
+    assert "due" in wallet.wallet_data["recurring_transactions"]["transactions"]
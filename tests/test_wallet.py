@@ -0,0 +1,183 @@
+# tests/test_wallet.py
+"""
+Tests for the PoRW wallet.
+
+This module contains tests for loading wallets and keeping the wallet
+data sections consistent with the wallet's managers.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch, AsyncMock
+
+from src.porw_blockchain.wallet.main import Wallet, AUTO_SAVE_MAX_RETRIES
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def wallet_file_data():
+    """Create wallet file data without address book, label or recurring sections."""
+    return {
+        "private_key": "private-key-pem",
+        "public_key": "public-key-pem",
+        "address": "porw1walletaddress"
+    }
+
+
+@pytest.fixture
+def wallet():
+    """Create a wallet that doesn't connect to the network or write to disk."""
+    with patch("src.porw_blockchain.wallet.main.TransactionBuilder"), \
+            patch.object(Wallet, "_load_key_objects"):
+        wallet = Wallet(network_client=MagicMock(), auto_connect=False)
+        wallet.auto_save = False
+        yield wallet
+
+
+def load_from_file(wallet, wallet_data):
+    """Load wallet data into a wallet through load_wallet_from_file."""
+    with patch("src.porw_blockchain.wallet.main.load_wallet", return_value=wallet_data), \
+            patch("src.porw_blockchain.wallet.main.TransactionBuilder"), \
+            patch.object(Wallet, "_load_key_objects"):
+        return wallet.load_wallet_from_file("wallet.dat", "password")
+
+
+# --- Loading ---
+
+def test_load_wallet_from_file_initializes_sections(wallet, wallet_file_data):
+    """Test that loading a wallet file creates the missing wallet data sections."""
+    wallet_data = load_from_file(wallet, wallet_file_data)
+
+    assert wallet_data["address_book"] == {"contacts": {}}
+    assert wallet_data["transaction_labels"] == {"labels": {}, "categories": []}
+    assert wallet_data["recurring_transactions"] == {"transactions": {}}
+
+
+def test_add_contact_after_loading_wallet_file(wallet, wallet_file_data):
+    """Test that a contact can be added to a wallet file without an address book."""
+    load_from_file(wallet, wallet_file_data)
+
+    with patch("src.porw_blockchain.wallet.contacts._is_valid_address", return_value=True):
+        contact = wallet.add_contact("Alice", "porw1aliceaddress")
+
+    contacts = wallet.wallet_data["address_book"]["contacts"]
+    assert list(contacts) == [contact["contact_id"]]
+    assert contacts[contact["contact_id"]]["address"] == "porw1aliceaddress"
+
+
+def test_load_wallet_from_file_drops_cached_entries(wallet, wallet_file_data):
+    """Test that entries cached for a previously loaded wallet are not reused."""
+    load_from_file(wallet, dict(wallet_file_data))
+    with patch("src.porw_blockchain.wallet.contacts._is_valid_address", return_value=True):
+        wallet.add_contact("Alice", "porw1aliceaddress")
+        assert len(wallet.list_contacts()) == 1
+
+        load_from_file(wallet, dict(wallet_file_data, address="porw1otheraddress"))
+
+    assert wallet._dict_cache == {}
+    assert wallet._list_snapshots == {}
+
+
+# --- Saving ---
+
+@pytest.fixture
+def auto_saving_wallet(wallet, wallet_file_data):
+    """Create a wallet that auto-saves with a short delay."""
+    load_from_file(wallet, wallet_file_data)
+    wallet.auto_save = True
+    wallet.wallet_password = "password"
+    wallet.auto_save_delay = 0.001
+    yield wallet
+    wallet.auto_save = False
+    wallet.close()
+
+
+def test_save_snapshot_is_not_affected_by_later_changes(auto_saving_wallet):
+    """Test that the data handed to a background save does not change with the wallet."""
+    wallet = auto_saving_wallet
+    wallet.wallet_data["multisig_wallets"] = {"ms1": {"pending_transactions": {}}}
+
+    snapshot = wallet._snapshot_wallet_data()
+    with patch("src.porw_blockchain.wallet.contacts._is_valid_address", return_value=True):
+        wallet.add_contact("Alice", "porw1aliceaddress")
+    wallet.wallet_data["multisig_wallets"]["ms1"]["pending_transactions"]["tx1"] = {}
+
+    assert snapshot["address_book"]["contacts"] == {}
+    assert snapshot["multisig_wallets"]["ms1"]["pending_transactions"] == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_background_save_is_retried_with_limit(auto_saving_wallet):
+    """Test that a failing auto-save is retried a bounded number of times and the error is kept."""
+    wallet = auto_saving_wallet
+    error = OSError("disk full")
+
+    with patch("src.porw_blockchain.wallet.main.save_wallet", side_effect=error) as save:
+        wallet._schedule_save()
+        await asyncio.sleep(0.2)
+
+    assert save.call_count == AUTO_SAVE_MAX_RETRIES + 1
+    assert wallet.last_save_error is error
+    assert wallet._save_dirty
+
+    with patch("src.porw_blockchain.wallet.main.save_wallet", return_value="wallet.dat") as save:
+        assert wallet.flush_save() == "wallet.dat"
+    assert wallet.last_save_error is None
+
+
+def test_close_writes_pending_save(auto_saving_wallet):
+    """Test that closing the wallet writes a pending save and stops the save thread."""
+    wallet = auto_saving_wallet
+    wallet._save_dirty = True
+
+    with patch("src.porw_blockchain.wallet.main.save_wallet", return_value="wallet.dat") as save:
+        wallet.close()
+
+    save.assert_called_once()
+    with pytest.raises(RuntimeError):
+        wallet._save_executor.submit(print)
+
+
+# --- Recurring transactions ---
+
+@pytest.mark.asyncio
+async def test_due_transactions_get_distinct_nonces(wallet):
+    """Test that due transactions executed together get distinct, increasing nonces."""
+    due = [MagicMock(transaction_id=f"rt{i}") for i in range(5)]
+    wallet.recurring_manager = MagicMock()
+    wallet.recurring_manager.get_due_transactions.return_value = due
+
+    with patch.object(Wallet, "execute_recurring_transaction", new_callable=AsyncMock) as execute:
+        await wallet.execute_due_transactions()
+        await wallet.execute_due_transactions()
+
+    nonces = [call.args[1] for call in execute.call_args_list]
+    assert len(nonces) == 10
+    assert nonces == sorted(set(nonces))
+
+
+@pytest.mark.asyncio
+async def test_overlapping_due_transaction_runs(wallet):
+    """Test that a run started while another is in progress sends nothing."""
+    release = asyncio.Event()
+
+    async def execute(transaction_id, nonce=None):
+        await release.wait()
+        return {"transaction_id": transaction_id}
+
+    wallet.recurring_manager = MagicMock()
+    wallet.recurring_manager.get_due_transactions.return_value = [MagicMock(transaction_id="rt1")]
+
+    with patch.object(Wallet, "execute_recurring_transaction", side_effect=execute) as execute_mock:
+        first = asyncio.create_task(wallet.execute_due_transactions())
+        await asyncio.sleep(0)
+
+        assert await wallet.execute_due_transactions() == []
+
+        release.set()
+        responses = await first
+
+    assert [response["transaction_id"] for response in responses] == ["rt1"]
+    assert execute_mock.call_count == 1
+    assert not wallet._executing_due_transactions